@@ -8,12 +8,22 @@ Key characteristics from reference photos:
 - Large curved palm rest with integrated thumbstick
 - Silver/gray side accents
 - LCD at top center
+
+This is a standalone preview render. The GUI's g13_device.png asset comes
+from generate_g13_background.py (``make assets``), so this script writes to
+a separate file next to it in the repository root.
 """
 
 import math
+from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numpy as np
+except ImportError:  # Optional: falls back to ImageDraw.ellipse
+    np = None
+
 # Canvas - portrait, sized to fit the curved shape
 WIDTH = 520
 HEIGHT = 700
@@ -35,6 +45,9 @@ LCD_GREEN = (60, 140, 60)
 BACKLIGHT_COLOR = (255, 120, 0)
 BACKLIGHT_INTENSITY = 0.4  # 0.0 to 1.0
 
+# Preview output, kept apart from the committed GUI asset
+OUTPUT_PATH = Path(__file__).resolve().parent / "g13_device_polished.png"
+
 
 def rotate_point(x, y, cx, cy, angle_deg):
     """Rotate point (x,y) around center (cx,cy) by angle in degrees."""
@@ -46,17 +59,12 @@ def rotate_point(x, y, cx, cy, angle_deg):
 
 def draw_key_glow(draw, cx, cy, w, h, color, intensity=0.4):
     """Draw a soft glow behind a key."""
-    # Draw multiple expanding rectangles with decreasing opacity
+    # Draw multiple expanding rectangles, blending the loop-invariant glow
+    # color further into the body color toward the outside
     r, g, b = color
+    glow_color = (int(r * 0.3 + 20), int(g * 0.3 + 20), int(b * 0.3 + 20))
     for i in range(8, 0, -1):
         expand = i * 2
-        int(255 * intensity * (1 - i / 10))
-        glow_color = (
-            int(r * 0.3 + 20),
-            int(g * 0.3 + 20),
-            int(b * 0.3 + 20),
-        )
-        # Blend with background
         blend = i / 8
         blended = (
             int(glow_color[0] * (1 - blend) + BODY_MID[0] * blend),
@@ -239,6 +247,43 @@ def draw_m_key(draw, cx, cy, w, h, label=None, font=None, backlight=None, intens
         draw.text((cx, cy), label, fill=label_color, font=font, anchor="mm")
 
 
+def draw_ellipses(img, ellipses):
+    """Rasterize filled ellipses with NumPy boolean masks over their bounding boxes.
+
+    Edge pixels differ slightly from ImageDraw.ellipse, which is used when
+    NumPy is missing; the preview output is not pixel-stable across the two.
+
+    Args:
+        img: RGB image to draw onto
+        ellipses: Iterable of (bbox, fill, outline, width) tuples, drawn in order
+
+    Returns:
+        The image with the ellipses drawn (a new image when NumPy is used)
+    """
+    if np is None:
+        draw = ImageDraw.Draw(img)
+        for bbox, fill, outline, width in ellipses:
+            draw.ellipse(bbox, fill=fill, outline=outline, width=width or 1)
+        return img
+
+    canvas = np.array(img)
+    for (x0, y0, x1, y1), fill, outline, width in ellipses:
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+        yy, xx = np.ogrid[y0 : y1 + 1, x0 : x1 + 1]
+        dx, dy = xx - cx, yy - cy
+        region = canvas[y0 : y1 + 1, x0 : x1 + 1]
+        outer = (dx * dx) / (rx * rx) + (dy * dy) / (ry * ry) <= 1
+        if outline is not None and width:
+            irx, iry = rx - width, ry - width
+            inner = (dx * dx) / (irx * irx) + (dy * dy) / (iry * iry) <= 1
+            region[outer] = outline
+            region[inner] = fill
+        else:
+            region[outer] = fill
+    return Image.fromarray(canvas)
+
+
 def main():
     img = Image.new("RGB", (WIDTH, HEIGHT), BLACK)
     draw = ImageDraw.Draw(img)
@@ -391,55 +436,53 @@ def main():
     # === PALM REST with THUMBSTICK ===
     # Large curved area at bottom
     palm_cx, palm_cy = 350, 520
-
-    # Palm rest surface (elliptical, darker)
-    draw.ellipse(
-        (palm_cx - 120, palm_cy - 90, palm_cx + 120, palm_cy + 90),
-        fill=(30, 32, 36),
-        outline=(45, 48, 52),
-        width=2,
-    )
-
-    # === THUMB BUTTONS (LEFT, DOWN) ===
-    # Not drawn here - Qt button widgets provide the visuals
-
-    # === THUMBSTICK ===
     stick_cx, stick_cy = 385, 520
-
-    # Outer housing
-    draw.ellipse(
-        (stick_cx - 48, stick_cy - 48, stick_cx + 48, stick_cy + 48),
-        fill=(55, 58, 62),
-        outline=(70, 73, 78),
-        width=2,
-    )
-
-    # Inner well
-    draw.ellipse(
-        (stick_cx - 38, stick_cy - 38, stick_cx + 38, stick_cy + 38),
-        fill=(25, 27, 30),
-        outline=(40, 42, 45),
-    )
-
-    # Stick shadow
-    draw.ellipse(
-        (stick_cx - 20 + 2, stick_cy - 20 + 2, stick_cx + 20 + 2, stick_cy + 20 + 2),
-        fill=(12, 14, 16),
-    )
-
-    # Stick cap
-    draw.ellipse(
-        (stick_cx - 20, stick_cy - 20, stick_cx + 20, stick_cy + 20),
-        fill=(50, 53, 58),
-        outline=(65, 68, 72),
-        width=2,
-    )
-
-    # Stick top
-    draw.ellipse((stick_cx - 14, stick_cy - 14, stick_cx + 14, stick_cy + 14), fill=(60, 63, 68))
-
-    # Dimple
-    draw.ellipse((stick_cx - 5, stick_cy - 5, stick_cx + 5, stick_cy + 5), fill=(42, 45, 50))
+    ellipses = [
+        # Palm rest surface (elliptical, darker)
+        (
+            (palm_cx - 120, palm_cy - 90, palm_cx + 120, palm_cy + 90),
+            (30, 32, 36),
+            (45, 48, 52),
+            2,
+        ),
+        # === THUMB BUTTONS (LEFT, DOWN) ===
+        # Not drawn here - Qt button widgets provide the visuals
+        # === THUMBSTICK ===
+        # Outer housing
+        (
+            (stick_cx - 48, stick_cy - 48, stick_cx + 48, stick_cy + 48),
+            (55, 58, 62),
+            (70, 73, 78),
+            2,
+        ),
+        # Inner well
+        (
+            (stick_cx - 38, stick_cy - 38, stick_cx + 38, stick_cy + 38),
+            (25, 27, 30),
+            (40, 42, 45),
+            1,
+        ),
+        # Stick shadow
+        (
+            (stick_cx - 20 + 2, stick_cy - 20 + 2, stick_cx + 20 + 2, stick_cy + 20 + 2),
+            (12, 14, 16),
+            None,
+            0,
+        ),
+        # Stick cap
+        (
+            (stick_cx - 20, stick_cy - 20, stick_cx + 20, stick_cy + 20),
+            (50, 53, 58),
+            (65, 68, 72),
+            2,
+        ),
+        # Stick top
+        ((stick_cx - 14, stick_cy - 14, stick_cx + 14, stick_cy + 14), (60, 63, 68), None, 0),
+        # Dimple
+        ((stick_cx - 5, stick_cy - 5, stick_cx + 5, stick_cy + 5), (42, 45, 50), None, 0),
+    ]
+    img = draw_ellipses(img, ellipses)
+    draw = ImageDraw.Draw(img)
 
     # === BRANDING ===
     try:
@@ -453,7 +496,7 @@ def main():
     draw.text((260, 632), "G13", fill=(80, 83, 88), font=font_lg, anchor="mm")
 
     # Save
-    img.save("src/g13_linux/gui/resources/images/g13_device.png")
+    img.save(OUTPUT_PATH)
     print(f"Saved: {WIDTH}x{HEIGHT}")
 
 
@@ -7,13 +7,14 @@ Provides real-time button events and profile/macro management.
 """
 
 import asyncio
-import json
 import logging
+import os
 import re
 import sys
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -125,6 +126,13 @@ def _safe_path(base_dir: Path, name: str) -> Path:
     return filepath
 
 
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write data as indented JSON, replacing path atomically."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
 # REST API Endpoints
 
 
@@ -140,7 +148,7 @@ async def list_profiles():
     profiles = []
     for f in PROFILES_DIR.glob("*.json"):
         try:
-            data = json.loads(f.read_text())
+            data = orjson.loads(f.read_bytes())
             profiles.append(
                 {
                     "name": data.get("name", f.stem),
@@ -159,7 +167,7 @@ async def get_profile(name: str):
     profile_path = _safe_path(PROFILES_DIR, name)
     if not profile_path.exists():
         raise HTTPException(status_code=404, detail="Profile not found")
-    return json.loads(profile_path.read_text())
+    return orjson.loads(profile_path.read_bytes())
 
 
 @app.post("/api/profiles/{name}")
@@ -168,7 +176,7 @@ async def save_profile(name: str, profile: ProfileData):
     profile_path = _safe_path(PROFILES_DIR, name)
     data = profile.model_dump()
     data["name"] = name
-    profile_path.write_text(json.dumps(data, indent=2))
+    _write_json_atomic(profile_path, data)
     await manager.broadcast({"type": "profile_saved", "name": name})
     return {"status": "ok", "name": name}
 
@@ -201,7 +209,7 @@ async def list_macros():
     macros = []
     for f in MACROS_DIR.glob("*.json"):
         try:
-            data = json.loads(f.read_text())
+            data = orjson.loads(f.read_bytes())
             macros.append(
                 {
                     "id": f.stem,
@@ -221,7 +229,7 @@ async def get_macro(macro_id: str):
     macro_path = _safe_path(MACROS_DIR, macro_id)
     if not macro_path.exists():
         raise HTTPException(status_code=404, detail="Macro not found")
-    return json.loads(macro_path.read_text())
+    return orjson.loads(macro_path.read_bytes())
 
 
 @app.post("/api/macros")
@@ -233,7 +241,7 @@ async def create_macro(macro: MacroData):
     macro_path = MACROS_DIR / f"{macro_id}.json"
     data = macro.model_dump()
     data["id"] = macro_id
-    macro_path.write_text(json.dumps(data, indent=2))
+    _write_json_atomic(macro_path, data)
     await manager.broadcast({"type": "macro_created", "id": macro_id})
     return {"status": "ok", "id": macro_id}
 
@@ -371,4 +379,14 @@ async def shutdown_event():
 
 
 if __name__ == "__main__":
-    uvicorn.run("server:app", host="127.0.0.1", port=8765, reload=True, log_level="info")
+    # Auto-reload spawns a file watcher; only enable it for development (G13_DEV=1)
+    uvicorn.run(
+        "server:app",
+        host="127.0.0.1",
+        port=8765,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("G13_DEV") == "1",
+        workers=1,
+        log_level="info",
+    )
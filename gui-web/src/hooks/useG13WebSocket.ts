@@ -58,6 +58,25 @@ export function useG13WebSocket(): G13WebSocketHook {
         }));
         break;
 
+      case 'input_batch': {
+        // All input changes from one HID read cycle; pressed applies before released
+        const pressed = message.pressed as string[];
+        const released = message.released as string[];
+        const joystick = message.joystick as { x: number; y: number } | undefined;
+        setState((prev) => {
+          // A set keeps a key held across a release/re-press listed once
+          const next = new Set(prev.pressed_keys);
+          pressed.forEach((k) => next.add(k));
+          released.forEach((k) => next.delete(k));
+          return {
+            ...prev,
+            pressed_keys: [...next],
+            joystick: joystick ?? prev.joystick,
+          };
+        });
+        break;
+      }
+
       case 'mode_changed':
         setState((prev) => ({
           ...prev,
@@ -19,15 +19,21 @@ Basic Usage:
 For more information, see: https://github.com/AreteDriver/G13_Linux
 """
 
-from importlib.metadata import version as _version
+import importlib
 
-__version__ = _version("g13-linux")
 __author__ = "AreteDriver"
 __license__ = "MIT"
 
-from .daemon import G13Daemon
-from .device import G13_PRODUCT_ID, G13_VENDOR_ID, open_g13, read_event
-from .mapper import G13Mapper
+# Public names are imported on first access (PEP 562), so importing a
+# subpackage such as g13_linux.gui does not load the daemon and its deps
+_LAZY_EXPORTS = {
+    "G13Daemon": ".daemon",
+    "G13_PRODUCT_ID": ".device",
+    "G13_VENDOR_ID": ".device",
+    "open_g13": ".device",
+    "read_event": ".device",
+    "G13Mapper": ".mapper",
+}
 
 __all__ = [
     "open_g13",
@@ -37,3 +43,20 @@ __all__ = [
     "G13_VENDOR_ID",
     "G13_PRODUCT_ID",
 ]
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("g13-linux")
+    elif name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), "__version__", *_LAZY_EXPORTS])
@@ -7,6 +7,7 @@ profiles, macros, and static assets.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 # Package directory: src/g13_linux/
@@ -19,11 +20,13 @@ _SOURCE_ROOT: Path = _PACKAGE_DIR.parent.parent
 _USER_CONFIG_DIR: Path = Path.home() / ".config" / "g13-linux"
 
 
+@functools.cache
 def _is_source_checkout() -> bool:
     """Check if we're running from a source checkout.
 
     Returns True if both configs/ and pyproject.toml exist at the
     computed source root, indicating a development environment.
+    The answer cannot change while the process runs, so it is computed once.
     """
     return (_SOURCE_ROOT / "configs").is_dir() and (_SOURCE_ROOT / "pyproject.toml").is_file()
 
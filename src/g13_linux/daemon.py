@@ -6,12 +6,16 @@ Coordinates input handling, LCD menu, LED effects, and key mapping.
 """
 
 import asyncio
+import functools
 import logging
+import os
+import queue
+import selectors
 import signal
 import sys
 import threading
 import time
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from .device import open_g13
 from .gui.models.event_decoder import EventDecoder
@@ -21,17 +25,26 @@ from .hardware.backlight import G13Backlight
 from .hardware.lcd import G13LCD
 from .input.handler import InputHandler
 from .input.navigation import NavigationController
+from .led.colors import parse_hex_color
 from .led.controller import LEDController
 from .mapper import G13Mapper
 from .menu.manager import ScreenManager
 from .menu.screen import InputEvent
 from .menu.screens.idle import IdleScreen
-from .server import G13Server
 from .settings import SettingsManager
 
+if TYPE_CHECKING:
+    # Imported on demand in _start_server: aiohttp dominates import time
+    from .server import G13Server
+
 logger = logging.getLogger(__name__)
 
 
+def _discard_broadcast(coro):
+    """Broadcast scheduler used while the server loop is not running."""
+    coro.close()
+
+
 class G13Daemon:
     """
     Main daemon for G13 device control.
@@ -46,6 +59,33 @@ class G13Daemon:
     # Update intervals
     RENDER_FPS = 20
     RENDER_INTERVAL = 1.0 / RENDER_FPS
+    # Min time between joystick-only WebSocket broadcasts; moves in between
+    # are coalesced and only the latest position is sent
+    JOYSTICK_BROADCAST_INTERVAL = RENDER_INTERVAL
+
+    # Max time the HID read loop blocks with no device activity (seconds)
+    IDLE_TIMEOUT = 1.0
+
+    # Read timeouts for devices without a pollable fd (milliseconds). The first
+    # read of a cycle waits for input; later drain reads only poll, and must
+    # stay positive because pyusb treats a timeout of 0 as "wait forever".
+    FALLBACK_WAIT_TIMEOUT_MS = 100
+    FALLBACK_DRAIN_TIMEOUT_MS = 1
+
+    # Nice increment for the server thread, so HTTP/WebSocket work yields to input
+    SERVER_NICE = 5
+
+    # Largest HID input report the G13 sends (bytes)
+    MAX_REPORT_SIZE = 64
+
+    # Report bytes carrying device state: joystick X/Y (1-2) and button bitmaps (3-7)
+    REPORT_STATE_BYTES = slice(1, 8)
+
+    # Button bits of report bytes 3-7 read as one little-endian int; status
+    # flags such as byte 5 bit 7 (always set) are masked out
+    KEY_BITS_MASK = sum(
+        1 << ((byte_idx - 3) * 8 + bit) for byte_idx, bit in EventDecoder.BUTTON_MAP.values()
+    )
 
     def __init__(
         self,
@@ -71,22 +111,46 @@ class G13Daemon:
         self._screen_manager: ScreenManager | None = None
         self._input_handler: InputHandler | None = None
         self._nav_controller: NavigationController | None = None
+        # Menu input from the HID thread, handled on the render thread
+        self._nav_events: queue.SimpleQueue[InputEvent] = queue.SimpleQueue()
 
         self._running = False
         self._render_thread: threading.Thread | None = None
+        self._pacing_thread: threading.Thread | None = None
+        self._render_event = threading.Event()  # Set when a screen is marked dirty
+        self._render_tick = threading.Event()  # Set by pacing thread, cleared per frame
+        self._pacing_active = threading.Event()  # Set while screens stay dirty frame to frame
+        self._skipped_frames = 0
         self._server_thread: threading.Thread | None = None
-        self._start_time: datetime | None = None
+        self._start_monotonic: float | None = None
+        self._uptime_cache: tuple[int, str] = (-1, "0:00")  # (seconds, formatted)
         self._key_count = 0
 
+        # Self-pipe used to wake the HID read loop on shutdown
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._prev_wakeup_fd: int | None = None  # Restored when run() exits
+
         # Event decoder for button state tracking (WebSocket broadcasts)
         self._event_decoder = EventDecoder()
-        self._last_joystick = (128, 128)  # Track joystick for change detection
+        self._last_report_state = b""  # REPORT_STATE_BYTES of the last handled report
+        self._last_key_bits = 0  # KEY_BITS_MASK bits of the last handled report
+        self._read_buf = bytearray(self.MAX_REPORT_SIZE)  # Reused by readinto-capable devices
+        # Last broadcast joystick position, for change detection
+        self._last_jx = 128
+        self._last_jy = 128
+
+        # Input changes accumulated over one drain cycle, broadcast together
+        self._batch_pressed: list[str] = []
+        self._batch_released: list[str] = []
+        self._batch_joystick: tuple[int, int] | None = None
+        self._joystick_sent_at = float("-inf")  # time.monotonic() of last joystick broadcast
 
         # Mode state (M1, M2, M3)
         self._current_mode = "M1"
 
         # Lock for shared mutable state accessed from multiple threads
-        # Protects: _current_mode, _last_joystick
+        # Protects: _current_mode, _last_jx/_last_jy
         self._state_lock = threading.Lock()
 
         # Server settings
@@ -96,27 +160,45 @@ class G13Daemon:
         self._static_dir = static_dir
         self._server: G13Server | None = None
         self._server_loop: asyncio.AbstractEventLoop | None = None
+        # Swapped to run_coroutine_threadsafe on the server loop while it runs
+        self._schedule_broadcast = _discard_broadcast
+
+        # profile_manager, macro_manager and settings_manager are created on
+        # first access (see the cached properties below), not here
 
-        # Profile manager
-        self.profile_manager = ProfileManager()
+    @functools.cached_property
+    def profile_manager(self) -> ProfileManager:
+        """Profile manager, created on first access."""
+        return ProfileManager()
 
-        # Macro manager
-        self.macro_manager = MacroManager()
+    @functools.cached_property
+    def macro_manager(self) -> MacroManager:
+        """Macro manager, created on first access (only the server uses it)."""
+        return MacroManager()
 
-        # Settings manager
-        self.settings_manager = SettingsManager()
+    @functools.cached_property
+    def settings_manager(self) -> SettingsManager:
+        """Settings manager, created on first access (loads settings from disk)."""
+        return SettingsManager()
 
     @property
     def uptime(self) -> str:
         """Get daemon uptime as formatted string."""
-        if not self._start_time:
+        if self._start_monotonic is None:
             return "0:00"
-        delta = datetime.now() - self._start_time
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
+        total = int(time.monotonic() - self._start_monotonic)
+        cached_total, cached_text = self._uptime_cache
+        if total == cached_total:
+            return cached_text
+
+        hours, remainder = divmod(total, 3600)
         minutes, seconds = divmod(remainder, 60)
         if hours:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+            text = f"{hours}:{minutes:02d}:{seconds:02d}"
+        else:
+            text = f"{minutes}:{seconds:02d}"
+        self._uptime_cache = (total, text)
+        return text
 
     @property
     def key_count(self) -> int:
@@ -151,6 +233,7 @@ class G13Daemon:
         self._screen_manager.profile_manager = self.profile_manager
         self._screen_manager.settings_manager = self.settings_manager
         self._screen_manager.daemon = self
+        self._screen_manager.render_event = self._render_event
 
         # Create idle screen
         idle_screen = IdleScreen(
@@ -228,7 +311,7 @@ class G13Daemon:
 
         # Broadcast mode change to WebSocket clients
         if self._server and old_mode != mode:
-            self._broadcast_async(self._server._broadcast({"type": "mode_changed", "mode": mode}))
+            self._server.queue_broadcast({"type": "mode_changed", "mode": mode})
 
         logger.info(f"Mode changed: {old_mode} -> {mode}")
 
@@ -240,8 +323,9 @@ class G13Daemon:
             return
 
         # Try to load 'default' or 'example' profile, otherwise first available
-        for name in ["default", "example", profiles[0]]:
-            if name in profiles:
+        available = set(profiles)
+        for name in ("default", "example", profiles[0]):
+            if name in available:
                 try:
                     self.load_profile(name)
                     logger.info(f"Loaded profile: {name}")
@@ -264,18 +348,13 @@ class G13Daemon:
 
             # Apply backlight color
             if self._led_controller and hasattr(profile, "backlight"):
-                color = profile.backlight.get("color", "#FFFFFF")
-                if color.startswith("#") and len(color) == 7:
-                    r = int(color[1:3], 16)
-                    g = int(color[3:5], 16)
-                    b = int(color[5:7], 16)
-                    self._led_controller.set_color(r, g, b)
+                rgb = parse_hex_color(profile.backlight.get("color", "#FFFFFF"))
+                if rgb:
+                    self._led_controller.set_color(*rgb)
 
             # Update mapper with new mappings
             if self._mapper:
-                from dataclasses import asdict
-
-                self._mapper.load_profile(asdict(profile))
+                self._mapper.load_profile(profile.to_dict())
 
             # Force idle screen refresh
             if self._screen_manager and self._screen_manager.current:
@@ -304,22 +383,20 @@ class G13Daemon:
                 sys.exit(1)
 
         self._running = True
-        self._start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
 
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
+        # The C-level handler writes each signal to the wake pipe before any
+        # Python code runs, so select() in the read loop returns immediately
+        self._prev_wakeup_fd = signal.set_wakeup_fd(self._wake_w, warn_on_full_buffer=False)
 
-        # Start input handler
-        self._input_handler.start()
-
-        # Start render thread
-        self._render_thread = threading.Thread(target=self._render_loop, daemon=True, name="Render")
-        self._render_thread.start()
-
-        # Start WebSocket/HTTP server if enabled
+        self._start_background_threads()
         if self._enable_server:
-            self._start_server()
             # Give server time to start, then broadcast connected
             time.sleep(0.1)
             self._broadcast_device_connected()
@@ -337,29 +414,170 @@ class G13Daemon:
 
         # Main loop - handle key mapping
         try:
-            while self._running:
-                try:
-                    data = self._device.read(timeout_ms=100)
-                    if data:
-                        self._handle_raw_report(data)
-                except Exception as e:
-                    logger.debug(f"Read error: {e}")
-                    time.sleep(0.01)
+            self._read_loop()
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt, stopping daemon")
         finally:
+            self._restore_wakeup_fd()
             self.stop()
 
+    def _device_fd(self) -> int | None:
+        """Return the device file descriptor, or None if it cannot be polled."""
+        fileno = getattr(self._device, "fileno", None)
+        if not callable(fileno):
+            return None
+        try:
+            fd = fileno()
+        except (OSError, ValueError):
+            return None
+        return fd if isinstance(fd, int) else None
+
+    def _device_readinto(self):
+        """Return the device's readinto method, or None if it only supports read()."""
+        if getattr(type(self._device), "readinto", None) is None:
+            return None
+        return self._device.readinto
+
+    def _read_loop(self):
+        """
+        Dispatch HID reports until stopped.
+
+        Alternates a blocking wait (_wait_for_data) with a non-blocking drain
+        of every queued report (_drain_reports). With a pollable device fd the
+        wait is a select() so an idle G13 causes no wakeups; devices without
+        one (libusb) wait inside the first, timed read of each drain.
+
+        This is the only reader of the device: reports reach the menu
+        InputHandler through _handle_raw_report, and the wait is shortened
+        while it has a stick repeat or a held joystick broadcast pending.
+        """
+        fd = self._device_fd()
+        with selectors.DefaultSelector() as sel:
+            if fd is not None:
+                sel.register(fd, selectors.EVENT_READ)
+                if self._wake_r is not None:
+                    sel.register(self._wake_r, selectors.EVENT_READ)
+                first_timeout_ms = drain_timeout_ms = 0
+            else:
+                sel = None
+                first_timeout_ms = self.FALLBACK_WAIT_TIMEOUT_MS
+                drain_timeout_ms = self.FALLBACK_DRAIN_TIMEOUT_MS
+
+            while self._running:
+                try:
+                    timeout = min(self._input_tick(), self._joystick_flush_delay())
+                    if self._wait_for_data(sel, timeout):
+                        self._drain_reports(first_timeout_ms, drain_timeout_ms)
+                    self._flush_input_batch()
+                except Exception as e:
+                    logger.debug("Read error: %s", e)
+                    time.sleep(0.01)
+
+    def _input_tick(self) -> float:
+        """Run InputHandler stick repeat; return how long the next wait may block."""
+        if self._input_handler is None:
+            return self.IDLE_TIMEOUT
+        due = self._input_handler.tick()
+        return self.IDLE_TIMEOUT if due is None else min(due, self.IDLE_TIMEOUT)
+
+    def _wait_for_data(
+        self, sel: selectors.BaseSelector | None, timeout: float | None = None
+    ) -> bool:
+        """
+        Block until the device has a report queued.
+
+        Args:
+            sel: Selector watching the device fd and wake pipe, or None if the
+                device cannot be polled (the drain's timed read waits instead)
+            timeout: Max seconds to block (default IDLE_TIMEOUT)
+
+        Returns:
+            True if reports are ready to drain, False on timeout or wake-up
+        """
+        if sel is None:
+            return True
+
+        ready = False
+        if timeout is None:
+            timeout = self.IDLE_TIMEOUT
+        for key, _ in sel.select(timeout=timeout):
+            if key.fd == self._wake_r:
+                self._drain_wake_pipe()
+            else:
+                ready = True
+        return ready
+
+    def _drain_reports(self, first_timeout_ms: int = 0, drain_timeout_ms: int = 0) -> int:
+        """
+        Dispatch every queued report to _handle_raw_report.
+
+        Only the first read may wait; the rest use drain_timeout_ms, so a
+        burst never ends with a stalled timeout read.
+
+        Args:
+            first_timeout_ms: Timeout for the first read of the cycle
+            drain_timeout_ms: Timeout for each following read (0 = non-blocking
+                for hidraw; pyusb devices need a small positive value)
+
+        Returns:
+            Number of reports dispatched
+        """
+        readinto = self._device_readinto()
+        view = memoryview(self._read_buf)
+        count = 0
+        timeout_ms = first_timeout_ms
+        while self._running:
+            if readinto is not None:
+                # Zero-copy: reports land in the reused buffer
+                n = readinto(self._read_buf, timeout_ms=timeout_ms)
+                if not n:
+                    break
+                data = view[:n]
+            else:
+                data = self._device.read(timeout_ms=timeout_ms)
+                if not data:
+                    break
+            self._handle_raw_report(data)
+            count += 1
+            timeout_ms = drain_timeout_ms
+        return count
+
+    def _wake(self):
+        """Wake the HID read loop out of select()."""
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass  # Pipe full or closed - loop is already awake or gone
+
+    def _drain_wake_pipe(self):
+        """Discard pending wake-up bytes."""
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except OSError:
+            pass  # Drained (EAGAIN)
+
+    def _close_wake_pipe(self):
+        """Close the self-pipe file descriptors."""
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wake_r = self._wake_w = None
+
     def _stop_components(self):
         """Stop all daemon components."""
         if self._enable_server:
             self._stop_server()
-        if self._input_handler:
-            self._input_handler.stop()
         if self._led_controller:
             self._led_controller.stop_effect()
         if self._render_thread and self._render_thread.is_alive():
             self._render_thread.join(timeout=1.0)
+        if self._pacing_thread and self._pacing_thread.is_alive():
+            self._pacing_thread.join(timeout=1.0)
 
     def _close_hardware(self):
         """Close hardware resources safely."""
@@ -383,15 +601,69 @@ class G13Daemon:
 
         logger.info("Stopping G13 daemon...")
         self._running = False
+        self._wake()
+        self._wake_render_threads()
 
         self._stop_components()
         self._close_hardware()
+        self._close_wake_pipe()
 
         logger.info("G13 daemon stopped")
         print("\nG13 daemon stopped.")
 
+    def _start_background_threads(self):
+        """Start the render, pacing and (if enabled) server threads, then set CPU affinity."""
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True, name="Render")
+        self._render_thread.start()
+        self._pacing_thread = threading.Thread(
+            target=self._pacing_loop, daemon=True, name="RenderPacing"
+        )
+        self._pacing_thread.start()
+
+        if self._enable_server:
+            self._start_server()
+
+        # Only after every long-lived thread exists: new threads inherit the
+        # creating thread's mask, so pinning main first would leak its CPU
+        self._apply_cpu_affinity()
+
+    def _apply_cpu_affinity(self):
+        """
+        Reserve one CPU for the HID read (main) thread.
+
+        The main thread is pinned to the last CPU the process may run on and
+        every other long-lived thread to the remaining CPUs, each by its own
+        TID. Threads they spawn later inherit the shared mask. Skipped on
+        single-CPU systems, non-Linux platforms, or when the scheduler call is
+        refused.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+        except OSError:
+            return
+        if len(cpus) < 2:
+            return
+
+        hid_cpus = {cpus[-1]}
+        shared_cpus = set(cpus[:-1])
+        targets = [("HID read", threading.get_native_id(), hid_cpus)]
+        for thread in (self._render_thread, self._pacing_thread, self._server_thread):
+            if thread and thread.native_id is not None:
+                targets.append((thread.name, thread.native_id, shared_cpus))
+
+        for label, tid, mask in targets:
+            try:
+                os.sched_setaffinity(tid, mask)
+                logger.debug("Pinned %s thread to CPUs %s", label, sorted(mask))
+            except OSError as e:
+                logger.debug("Could not pin %s thread: %s", label, e)
+
     def _start_server(self):
         """Start the WebSocket/HTTP server in a background thread."""
+        from .server import G13Server
+
         self._server = G13Server(
             self, self._server_host, self._server_port, static_dir=self._static_dir
         )
@@ -403,20 +675,32 @@ class G13Daemon:
 
     def _run_server_loop(self):
         """Run the asyncio event loop for the server."""
+        # Linux applies nice per thread: deprioritize only the server
+        try:
+            os.nice(self.SERVER_NICE)
+        except OSError as e:
+            logger.debug("Could not lower server thread priority: %s", e)
+
         self._server_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._server_loop)
 
         try:
             self._server_loop.run_until_complete(self._server.start())
+            self._schedule_broadcast = functools.partial(
+                asyncio.run_coroutine_threadsafe, loop=self._server_loop
+            )
             self._server_loop.run_forever()
         except Exception as e:
             logger.error(f"Server error: {e}")
         finally:
+            self._schedule_broadcast = _discard_broadcast
             self._server_loop.close()
 
     def _stop_server(self):
         """Stop the WebSocket/HTTP server."""
         if self._server and self._server_loop:
+            self._schedule_broadcast = _discard_broadcast
+
             # Schedule server stop in the event loop
             future = asyncio.run_coroutine_threadsafe(self._server.stop(), self._server_loop)
             try:
@@ -434,81 +718,236 @@ class G13Daemon:
             logger.info("Server stopped")
 
     def _handle_signal(self, signum, frame):
-        """Handle shutdown signals."""
+        """Handle shutdown signals (the wakeup fd has already woken the read loop)."""
         self._running = False
 
+    def _restore_wakeup_fd(self):
+        """Detach the wake pipe from signal delivery before it is closed."""
+        if self._prev_wakeup_fd is None:
+            return
+        try:
+            signal.set_wakeup_fd(self._prev_wakeup_fd)
+        except ValueError:
+            pass  # Not on the main thread
+        self._prev_wakeup_fd = None
+
     def _on_input_event(self, event: InputEvent):
         """
         Handle input events from InputHandler.
 
-        Routes events to navigation controller for menu handling.
+        Runs on the HID thread, so the event is only queued for the render
+        thread, which owns the screen stack; see _dispatch_nav_events().
 
         Args:
             event: Input event
         """
         if self._nav_controller:
-            self._nav_controller.on_input(event)
+            self._nav_events.put(event)
+            self._render_event.set()
 
-    def _handle_raw_report(self, data: bytes):
+    def _dispatch_nav_events(self):
+        """Route queued input events to the navigation controller (render thread)."""
+        get_event = self._nav_events.get_nowait
+        while True:
+            try:
+                event = get_event()
+            except queue.Empty:
+                break
+            if self._nav_controller:
+                self._nav_controller.on_input(event)
+
+    def _handle_raw_report(self, data: bytes | memoryview | list[int]):
         """
-        Handle raw HID report for key mapping and WebSocket broadcasting.
+        Handle raw HID report for menu input, key mapping and WebSocket broadcasting.
 
-        Passes report to mapper for key translation and broadcasts
-        button events to connected WebSocket clients.
+        Passes report to the InputHandler for menu navigation, decodes it
+        once, feeds the button changes to the mapper for key translation, and
+        accumulates button and joystick changes for the next
+        _flush_input_batch() broadcast.
+        Reports whose state bytes match the previous report (the device
+        re-sending an unchanged state) are dropped before any decoding.
 
         Args:
-            data: Raw HID report bytes
+            data: Raw HID report; a memoryview into the read buffer is only
+                valid until the next read, so it must not be retained
         """
+        state_bytes = bytes(data[self.REPORT_STATE_BYTES])
+        if state_bytes == self._last_report_state:
+            return
+        self._last_report_state = state_bytes
+
+        if self._input_handler:
+            self._input_handler.process_report(data)
+
+        # Count keys going down: bits set now that were clear in the last report
+        key_bits = int.from_bytes(state_bytes[2:], "little") & self.KEY_BITS_MASK
+        self._key_count += (key_bits & ~self._last_key_bits).bit_count()
+        self._last_key_bits = key_bits
+
+        broadcast = self._enable_server and self._server
+        if not (self._mapper or broadcast):
+            return
+
+        # Decode once, for both the mapper and the WebSocket batch
+        try:
+            state = self._event_decoder.decode_report(data)
+            pressed, released = self._event_decoder.get_button_changes(state)
+        except Exception as e:
+            logger.debug("Event decode error: %s", e)
+            return
+
         if self._mapper:
-            # Track key presses (rough count based on mapper activity)
-            self._mapper.handle_raw_report(data)
-            self._key_count += 1
+            for button in pressed:
+                self._mapper.handle_button_event(button, is_pressed=True)
+            for button in released:
+                self._mapper.handle_button_event(button, is_pressed=False)
 
-        # Decode state and broadcast button changes
-        if self._enable_server and self._server:
-            try:
-                state = self._event_decoder.decode_report(data)
-                pressed, released = self._event_decoder.get_button_changes(state)
-
-                # Broadcast button events
-                for button in pressed:
-                    self.broadcast_button_event(button, pressed=True)
-                for button in released:
-                    self.broadcast_button_event(button, pressed=False)
-
-                # Broadcast joystick position if changed significantly
-                joystick = (state.joystick_x, state.joystick_y)
-                with self._state_lock:
-                    changed = self._joystick_changed(joystick)
-                    if changed:
-                        self._last_joystick = joystick
-                if changed:
-                    self._broadcast_joystick(joystick)
+        if not broadcast:
+            return
 
-            except Exception as e:
-                logger.debug(f"Event decode error: {e}")
+        # Accumulate button events for the drain cycle's batch
+        for button in pressed:
+            # A re-press cancels a release seen earlier in the batch
+            if button in self._batch_released:
+                self._batch_released.remove(button)
+            if button not in self._batch_pressed:
+                self._batch_pressed.append(button)
+        for button in released:
+            if button not in self._batch_released:
+                self._batch_released.append(button)
+
+        # Record joystick position if changed significantly. Only this
+        # thread writes _last_jx/_last_jy, so the compare needs no lock;
+        # it is taken just to publish a new pair to last_joystick readers
+        jx = state.joystick_x
+        jy = state.joystick_y
+        if self._joystick_changed(jx, jy):
+            with self._state_lock:
+                self._last_jx = jx
+                self._last_jy = jy
+            self._batch_joystick = (jx, jy)
+
+    def _flush_input_batch(self):
+        """
+        Broadcast input changes accumulated since the last flush as one message.
 
-    def _joystick_changed(self, new_pos: tuple[int, int], threshold: int = 5) -> bool:
-        """Check if joystick position changed enough to broadcast."""
-        dx = abs(new_pos[0] - self._last_joystick[0])
-        dy = abs(new_pos[1] - self._last_joystick[1])
-        return dx > threshold or dy > threshold
-
-    def _broadcast_joystick(self, position: tuple[int, int]):
-        """Broadcast joystick position to WebSocket clients."""
-        if self._server and self._server_loop and self._server_loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self._server._broadcast({"type": "joystick", "x": position[0], "y": position[1]}),
-                self._server_loop,
+        Button changes go out at once, carrying any pending joystick move. A
+        joystick-only batch is held until JOYSTICK_BROADCAST_INTERVAL has
+        passed since the last joystick broadcast, and later moves overwrite
+        it meanwhile, so a wobbling stick sends at most one position per
+        interval.
+        """
+        pressed, released = self._batch_pressed, self._batch_released
+        joystick = self._batch_joystick
+        if not (pressed or released) and (joystick is None or self._joystick_flush_delay() > 0):
+            return
+
+        self._batch_pressed, self._batch_released = [], []
+        self._batch_joystick = None
+        if joystick is not None:
+            self._joystick_sent_at = time.monotonic()
+
+        if self._server:
+            self._server.queue_broadcast(
+                self._server.input_batch_message(pressed, released, joystick)
             )
 
+    def _joystick_flush_delay(self) -> float:
+        """Seconds until a held joystick move may be broadcast (IDLE_TIMEOUT if none)."""
+        if self._batch_joystick is None:
+            return self.IDLE_TIMEOUT
+        due = self._joystick_sent_at + self.JOYSTICK_BROADCAST_INTERVAL
+        return max(0.0, due - time.monotonic())
+
+    def _joystick_changed(self, x: int, y: int, threshold: int = 5) -> bool:
+        """Check if joystick position changed enough to broadcast."""
+        dx = x - self._last_jx
+        dy = y - self._last_jy
+        return dx > threshold or dx < -threshold or dy > threshold or dy < -threshold
+
+    @property
+    def last_joystick(self) -> tuple[int, int]:
+        """Last broadcast joystick position as (x, y)."""
+        with self._state_lock:
+            return (self._last_jx, self._last_jy)
+
+    def _wake_render_threads(self):
+        """Release the render and pacing threads from any wait so they see _running."""
+        self._render_event.set()
+        self._render_tick.set()
+        self._pacing_active.set()
+
+    def _pacing_loop(self):
+        """
+        Background thread that ticks the render loop every RENDER_INTERVAL.
+
+        Ticks only run while _pacing_active is set, i.e. while screens keep
+        marking themselves dirty between frames; otherwise the thread blocks
+        without waking. Ticks land on a fixed schedule. A tick the render
+        thread has not consumed yet, or one missed because this thread woke
+        late, is counted as a skipped frame instead of being queued.
+        """
+        interval = self.RENDER_INTERVAL
+        monotonic = time.monotonic
+
+        while self._running:
+            self._pacing_active.wait()
+            next_tick = monotonic() + interval
+            while self._running and self._pacing_active.is_set():
+                delay = next_tick - monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if not self._running or not self._pacing_active.is_set():
+                    break
+
+                late = monotonic() - next_tick
+                if late >= interval:
+                    # Woke whole intervals late (e.g. system suspend) - count
+                    # the missed ticks and resync instead of bursting
+                    missed = int(late // interval)
+                    self._skipped_frames += missed
+                    next_tick += missed * interval
+                next_tick += interval
+
+                if self._render_tick.is_set():
+                    self._skipped_frames += 1
+                    logger.debug("Render frame skipped (total %d)", self._skipped_frames)
+                self._render_tick.set()
+
     def _render_loop(self):
-        """Background thread for LCD rendering."""
-        last_update = time.time()
+        """
+        Background thread for LCD rendering, woken by dirty screens or frame ticks.
+
+        With nothing dirty the thread blocks until a screen is marked dirty or
+        a clock screen's next_update_in() deadline passes. If a screen is
+        marked dirty again while a frame renders, the pacing thread is started
+        and later frames follow its ticks, capping the rate at RENDER_FPS.
+        Menu input queued by the HID thread is handled at the start of each
+        frame, so screens are only mutated on this thread.
+        """
+        perf_counter = time.perf_counter
+        last_update = perf_counter()
 
         while self._running:
+            if self._pacing_active.is_set():
+                self._render_tick.wait()
+            else:
+                timeout = self._screen_manager.next_update_delay() if self._screen_manager else None
+                self._render_event.wait(timeout)
+            if not self._running:
+                break
+            # Clear before reading screen state: a mark_dirty() from another
+            # thread during this frame sets the event again and is drawn next.
+            # A tick arriving during the frame stays set and starts the next one.
+            self._render_event.clear()
+            self._render_tick.clear()
+
             try:
-                now = time.time()
+                # Menu input first, so this frame already shows its effect
+                self._dispatch_nav_events()
+
+                # One monotonic, vDSO-backed clock read per frame
+                now = perf_counter()
                 dt = now - last_update
                 last_update = now
 
@@ -517,14 +956,13 @@ class G13Daemon:
                     self._screen_manager.update(dt)
                     self._screen_manager.render()
 
-                # Sleep for target frame time
-                elapsed = time.time() - now
-                sleep_time = max(0, self.RENDER_INTERVAL - elapsed)
-                time.sleep(sleep_time)
-
             except Exception as e:
                 logger.error(f"Render error: {e}")
-                time.sleep(self.RENDER_INTERVAL)
+
+            if self._render_event.is_set():
+                self._pacing_active.set()
+            else:
+                self._pacing_active.clear()
 
     def set_backlight_color(self, r: int, g: int, b: int):
         """
@@ -565,11 +1003,9 @@ class G13Daemon:
             logger.error(f"Failed to save profile: {e}")
             return False
 
-        # Reload mappings into mapper
+        # Patch the single changed mapping into the mapper
         if self._mapper:
-            from dataclasses import asdict
-
-            self._mapper.load_profile(asdict(profile))
+            self._mapper.update_mapping(button, key)
 
         logger.info(f"Updated mapping: {button} -> {key}")
         return True
@@ -588,17 +1024,19 @@ class G13Daemon:
     # Server broadcast helpers
 
     def _broadcast_async(self, coro):
-        """Schedule an async broadcast in the server's event loop."""
-        if self._server and self._server_loop and self._server_loop.is_running():
-            asyncio.run_coroutine_threadsafe(coro, self._server_loop)
+        """
+        Schedule an async broadcast in the server's event loop.
+
+        Costs a Future and a loop wakeup per call; hot paths use
+        G13Server.queue_broadcast instead.
+        """
+        self._schedule_broadcast(coro)
 
     def broadcast_button_event(self, button: str, pressed: bool):
         """Broadcast button press/release to WebSocket clients."""
         if self._server:
-            if pressed:
-                self._broadcast_async(self._server.broadcast_button_pressed(button))
-            else:
-                self._broadcast_async(self._server.broadcast_button_released(button))
+            event_type = "button_pressed" if pressed else "button_released"
+            self._server.queue_broadcast({"type": event_type, "button": button})
 
     def broadcast_profile_change(self, name: str):
         """Broadcast profile activation to WebSocket clients."""
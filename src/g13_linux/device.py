@@ -1,6 +1,7 @@
 import fcntl
 import glob
 import os
+import select
 
 G13_VENDOR_ID = 0x046D
 G13_PRODUCT_ID = 0xC21C
@@ -29,13 +30,51 @@ class HidrawDevice:
         self._fd = self._file.fileno()
         os.set_blocking(self._fd, False)
 
-    def read(self, size):
+    def fileno(self):
+        """Return the hidraw file descriptor, for use with select/selectors."""
+        return self._fd
+
+    def read(self, size=64, timeout_ms=0):
+        """
+        Read an input report.
+
+        Args:
+            size: Maximum report size in bytes
+            timeout_ms: Time to wait for a report (0 = non-blocking)
+
+        Returns:
+            List of bytes or None if no report is available
+        """
+        if timeout_ms and self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout_ms / 1000)
+            if not ready:
+                return None
         try:
             data = self._file.read(size)
             return list(data) if data else None
         except BlockingIOError:
             return None
 
+    def readinto(self, buf, timeout_ms=0):
+        """
+        Read an input report into a caller-owned buffer.
+
+        Args:
+            buf: Writable buffer (e.g. bytearray) sized for the largest report
+            timeout_ms: Time to wait for a report (0 = non-blocking)
+
+        Returns:
+            Number of bytes read, 0 if no report is available
+        """
+        if timeout_ms and self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout_ms / 1000)
+            if not ready:
+                return 0
+        try:
+            return self._file.readinto(buf) or 0
+        except BlockingIOError:
+            return 0
+
     def write(self, data):
         """Write an output report to the device."""
         return self._file.write(bytes(data))
@@ -1,5 +1,22 @@
 """G13 GUI Dialogs."""
 
-from .calibration_dialog import CalibrationDialog
+import importlib
+
+# Re-exports are imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    "CalibrationDialog": ".calibration_dialog",
+}
 
 __all__ = ["CalibrationDialog"]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_EXPORTS])
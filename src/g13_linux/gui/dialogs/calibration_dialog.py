@@ -54,7 +54,7 @@ BUTTON_ORDER = [
 ]
 
 # Special items that need two clicks (top-left and bottom-right)
-TWO_CLICK_ITEMS = {"LCD", "STICK"}
+TWO_CLICK_ITEMS = frozenset({"LCD", "STICK"})
 
 # Default button sizes
 BUTTON_SIZES = {
@@ -66,6 +66,29 @@ BUTTON_SIZES = {
     "STICK": (35, 35),
 }
 
+# Row groups in the generated code, each with its comment line
+OUTPUT_GROUPS = [
+    ("# M-keys row", ["M1", "M2", "M3", "MR"]),
+    ("# Row 1: G1-G7", ["G1", "G2", "G3", "G4", "G5", "G6", "G7"]),
+    ("# Row 2: G8-G14", ["G8", "G9", "G10", "G11", "G12", "G13", "G14"]),
+    ("# Row 3: G15-G19", ["G15", "G16", "G17", "G18", "G19"]),
+    ("# Row 4: G20-G22", ["G20", "G21", "G22"]),
+    ("# Thumb buttons", ["LEFT", "DOWN", "STICK"]),
+]
+
+# Button name -> index into OUTPUT_GROUPS (buttons follow BUTTON_ORDER within groups)
+_GROUP_OF = {name: i for i, (_, names) in enumerate(OUTPUT_GROUPS) for name in names}
+
+# Status label styles
+_STATUS_STYLE = "font-size: 14px; font-weight: bold; padding: 8px; border-radius: 4px; "
+STATUS_STYLE_NEXT = _STATUS_STYLE + "background: #333; color: #0f0;"
+STATUS_STYLE_FIRST_CORNER = _STATUS_STYLE + "background: #036; color: #0ff;"
+STATUS_STYLE_SECOND_CORNER = _STATUS_STYLE + "background: #630; color: #ff0;"
+STATUS_STYLE_DONE = _STATUS_STYLE + "background: #060; color: #fff;"
+
+# Delay before regenerating the code preview, so rapid clicks coalesce
+OUTPUT_DEBOUNCE_MS = 100
+
 
 def get_button_size(name: str) -> tuple[int, int]:
     """Get default size for a button."""
@@ -78,6 +101,10 @@ def get_button_size(name: str) -> tuple[int, int]:
     return BUTTON_SIZES.get(name, (30, 25))
 
 
+# Default size of every calibrated button, resolved once at import
+BUTTON_SIZE_BY_NAME = {name: get_button_size(name) for name in BUTTON_ORDER}
+
+
 class ClickableImageLabel(QLabel):
     """Clickable image label that reports click positions."""
 
@@ -112,10 +139,17 @@ class CalibrationDialog(QDialog):
             return
 
         self.original_pixmap = QPixmap(str(self.image_path))
+        # Device image with every placed button painted on it
+        self._overlay = self.original_pixmap.copy()
         self.positions: dict[str, tuple[int, int, int, int]] = {}
         self.current_idx = 0
         self._pending_first_click: tuple[int, int] | None = None
 
+        self._preview_pending = False
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.timeout.connect(self._generate_output)
+
         self._init_ui()
         self._update_status()
 
@@ -140,10 +174,8 @@ class CalibrationDialog(QDialog):
 
         # Status/instruction label
         self.status_label = QLabel()
-        self.status_label.setStyleSheet(
-            "font-size: 14px; font-weight: bold; padding: 8px; "
-            "background: #333; color: #0f0; border-radius: 4px;"
-        )
+        self.status_label.setStyleSheet(STATUS_STYLE_NEXT)
+        self._status_style = STATUS_STYLE_NEXT
         left_layout.addWidget(self.status_label)
 
         # Clickable image
@@ -234,32 +266,26 @@ class CalibrationDialog(QDialog):
 
             if is_two_click and self._pending_first_click is not None:
                 self.status_label.setText(f"Click BOTTOM-RIGHT corner of: {btn}")
-                self.status_label.setStyleSheet(
-                    "font-size: 14px; font-weight: bold; padding: 8px; "
-                    "background: #630; color: #ff0; border-radius: 4px;"
-                )
+                self._set_status_style(STATUS_STYLE_SECOND_CORNER)
             elif is_two_click:
                 self.status_label.setText(f"Click TOP-LEFT corner of: {btn} [2-click item]")
-                self.status_label.setStyleSheet(
-                    "font-size: 14px; font-weight: bold; padding: 8px; "
-                    "background: #036; color: #0ff; border-radius: 4px;"
-                )
+                self._set_status_style(STATUS_STYLE_FIRST_CORNER)
             else:
                 self.status_label.setText(f"Click TOP-LEFT corner of: {btn}")
-                self.status_label.setStyleSheet(
-                    "font-size: 14px; font-weight: bold; padding: 8px; "
-                    "background: #333; color: #0f0; border-radius: 4px;"
-                )
+                self._set_status_style(STATUS_STYLE_NEXT)
 
             self.apply_btn.setEnabled(False)
         else:
             self.status_label.setText("✓ All buttons mapped!")
-            self.status_label.setStyleSheet(
-                "font-size: 14px; font-weight: bold; padding: 8px; "
-                "background: #060; color: #fff; border-radius: 4px;"
-            )
+            self._set_status_style(STATUS_STYLE_DONE)
             self.apply_btn.setEnabled(True)
 
+    def _set_status_style(self, style: str):
+        """Apply a status label style, skipping Qt's restyle if unchanged."""
+        if style != self._status_style:
+            self.status_label.setStyleSheet(style)
+            self._status_style = style
+
     def _on_click(self, x: int, y: int):
         """Handle click on image."""
         if self.current_idx >= len(BUTTON_ORDER):
@@ -273,7 +299,7 @@ class CalibrationDialog(QDialog):
                 # First click - store top-left corner
                 self._pending_first_click = (x, y)
                 self._update_status()
-                self._update_preview()
+                self._schedule_preview()
                 return
             else:
                 # Second click - calculate width/height from corners
@@ -284,46 +310,74 @@ class CalibrationDialog(QDialog):
                 self._pending_first_click = None
         else:
             # Regular single-click button
-            w, h = get_button_size(btn_name)
+            w, h = BUTTON_SIZE_BY_NAME[btn_name]
             self.positions[btn_name] = (x, y, w, h)
 
         self.current_idx += 1
 
-        self._update_preview()
+        painter = QPainter(self._overlay)
+        self._draw_position(painter, btn_name)
+        painter.end()
+
+        self._schedule_preview()
         self._update_status()
-        self._generate_output()
+        self._schedule_output()
 
-    def _update_preview(self):
-        """Update the image with button overlays."""
-        pixmap = QPixmap(str(self.image_path))
-        painter = QPainter(pixmap)
+    def _draw_position(self, painter: QPainter, name: str):
+        """Draw one placed button's rectangle and label."""
+        x, y, w, h = self.positions[name]
 
-        for name, (x, y, w, h) in self.positions.items():
-            # Use different colors for different element types
-            if name == "LCD":
-                painter.setPen(QPen(QColor(0, 200, 255), 2))  # Cyan for LCD
-            elif name == "STICK":
-                painter.setPen(QPen(QColor(255, 100, 0), 2))  # Orange for joystick
-            else:
-                painter.setPen(QPen(QColor(0, 255, 0), 2))  # Green for buttons
+        # Use different colors for different element types
+        if name == "LCD":
+            painter.setPen(QPen(QColor(0, 200, 255), 2))  # Cyan for LCD
+        elif name == "STICK":
+            painter.setPen(QPen(QColor(255, 100, 0), 2))  # Orange for joystick
+        else:
+            painter.setPen(QPen(QColor(0, 255, 0), 2))  # Green for buttons
+
+        painter.drawRect(x, y, w, h)
 
-            painter.drawRect(x, y, w, h)
+        # Draw label
+        painter.setPen(QColor(255, 255, 0))
+        painter.drawText(x + 2, y + h - 3, name)
 
-            # Draw label
-            painter.setPen(QColor(255, 255, 0))
-            painter.drawText(x + 2, y + h - 3, name)
+    def _rebuild_overlay(self):
+        """Repaint the overlay from scratch (after a placement is removed)."""
+        self._overlay = self.original_pixmap.copy()
+        painter = QPainter(self._overlay)
+        for name in self.positions:
+            self._draw_position(painter, name)
+        painter.end()
+
+    def _schedule_preview(self):
+        """Repaint the preview once control returns to the event loop."""
+        if not self._preview_pending:
+            self._preview_pending = True
+            QTimer.singleShot(0, self._update_preview)
+
+    def _update_preview(self):
+        """Update the image with button overlays."""
+        self._preview_pending = False
 
         # Show pending first click for two-click items
-        if self._pending_first_click is not None:
-            x, y = self._pending_first_click
-            painter.setPen(QPen(QColor(255, 0, 255), 3))  # Magenta marker
-            painter.drawLine(x - 10, y, x + 10, y)
-            painter.drawLine(x, y - 10, x, y + 10)
-            painter.drawEllipse(x - 5, y - 5, 10, 10)
+        if self._pending_first_click is None:
+            self.image_label.setPixmap(self._overlay)
+            return
 
+        pixmap = self._overlay.copy()
+        painter = QPainter(pixmap)
+        x, y = self._pending_first_click
+        painter.setPen(QPen(QColor(255, 0, 255), 3))  # Magenta marker
+        painter.drawLine(x - 10, y, x + 10, y)
+        painter.drawLine(x, y - 10, x, y + 10)
+        painter.drawEllipse(x - 5, y - 5, 10, 10)
         painter.end()
         self.image_label.setPixmap(pixmap)
 
+    def _schedule_output(self):
+        """Regenerate the code preview once clicking pauses."""
+        self._output_timer.start(OUTPUT_DEBOUNCE_MS)
+
     def _generate_output(self):
         """Generate the Python code."""
         lines = [
@@ -341,25 +395,20 @@ class CalibrationDialog(QDialog):
             "G13_BUTTON_POSITIONS = {",
         ]
 
-        # Group by row for readability
-        groups = [
-            ("# M-keys row", ["M1", "M2", "M3", "MR"]),
-            ("# Row 1: G1-G7", ["G1", "G2", "G3", "G4", "G5", "G6", "G7"]),
-            ("# Row 2: G8-G14", ["G8", "G9", "G10", "G11", "G12", "G13", "G14"]),
-            ("# Row 3: G15-G19", ["G15", "G16", "G17", "G18", "G19"]),
-            ("# Row 4: G20-G22", ["G20", "G21", "G22"]),
-            ("# Thumb buttons", ["LEFT", "DOWN", "STICK"]),
-        ]
-
-        for comment, buttons in groups:
-            has_any = any(b in self.positions for b in buttons)
-            if has_any:
-                lines.append(f"    {comment}")
-                for name in buttons:
-                    if name in self.positions:
-                        x, y, w, h = self.positions[name]
-                        lines.append(f'    "{name}": _box({x}, {y}, {w}, {h}),')
-                lines.append("")
+        # Group by row for readability, in one pass over the placed buttons
+        group = None
+        for name in BUTTON_ORDER:
+            if name not in self.positions or name not in _GROUP_OF:
+                continue
+            if _GROUP_OF[name] != group:
+                if group is not None:
+                    lines.append("")
+                group = _GROUP_OF[name]
+                lines.append(f"    {OUTPUT_GROUPS[group][0]}")
+            x, y, w, h = self.positions[name]
+            lines.append(f'    "{name}": _box({x}, {y}, {w}, {h}),')
+        if group is not None:
+            lines.append("")
 
         lines.append("}")
         lines.append("")
@@ -383,7 +432,7 @@ class CalibrationDialog(QDialog):
         # If we're in the middle of a two-click item, cancel it
         if self._pending_first_click is not None:
             self._pending_first_click = None
-            self._update_preview()
+            self._schedule_preview()
             self._update_status()
             return
 
@@ -392,16 +441,19 @@ class CalibrationDialog(QDialog):
             btn_name = BUTTON_ORDER[self.current_idx]
             if btn_name in self.positions:
                 del self.positions[btn_name]
-            self._update_preview()
+                self._rebuild_overlay()
+            self._schedule_preview()
             self._update_status()
-            self._generate_output()
+            self._schedule_output()
 
     def _reset_all(self):
         """Reset all button placements."""
         self.positions.clear()
         self.current_idx = 0
         self._pending_first_click = None
-        self.image_label.setPixmap(self.original_pixmap)
+        self._output_timer.stop()
+        self._overlay = self.original_pixmap.copy()
+        self._schedule_preview()
         self._update_status()
         self.output_text.clear()
 
@@ -416,12 +468,17 @@ class CalibrationDialog(QDialog):
         # Move to next button without recording position
         self.current_idx += 1
         self._update_status()
-        self._generate_output()
+        self._schedule_output()
 
     def _copy_to_clipboard(self):
         """Copy generated code to clipboard."""
         from PyQt6.QtWidgets import QApplication
 
+        # Flush a pending debounced update so the copy is current
+        if self._output_timer.isActive():
+            self._output_timer.stop()
+            self._generate_output()
+
         QApplication.clipboard().setText(self.output_text.toPlainText())
         self.copy_btn.setText("Copied!")
         QTimer.singleShot(2000, lambda: self.copy_btn.setText("Copy to Clipboard"))
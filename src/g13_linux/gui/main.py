@@ -14,42 +14,40 @@ import os
 import sys
 from pathlib import Path
 
-from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QApplication, QMessageBox
-
-from .resources.styles import DARK_THEME
-
 # Lock file path - use /tmp for root, ~/.cache for user
 LOCK_FILE = Path("/tmp/g13-linux-gui.lock")
-_lock_file_handle = None
+_lock_fd: int | None = None
 
 
 def acquire_instance_lock() -> bool:
     """Try to acquire single-instance lock. Returns True if acquired."""
-    global _lock_file_handle
+    global _lock_fd
+    try:
+        fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    except OSError:
+        return False
     try:
-        _lock_file_handle = open(LOCK_FILE, "w")
-        fcntl.flock(_lock_file_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-        _lock_file_handle.write(str(os.getpid()))
-        _lock_file_handle.flush()
-        return True
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # Truncate only once the lock is held, so a losing attempt cannot
+        # clobber the running instance's PID
+        os.ftruncate(fd, 0)
+        os.write(fd, b"%d\n" % os.getpid())
     except OSError:
-        if _lock_file_handle:
-            _lock_file_handle.close()
-            _lock_file_handle = None
+        os.close(fd)
         return False
+    _lock_fd = fd
+    return True
 
 
 def release_instance_lock():
     """Release the single-instance lock."""
-    global _lock_file_handle
-    if _lock_file_handle:
+    global _lock_fd
+    if _lock_fd is not None:
         try:
-            fcntl.flock(_lock_file_handle.fileno(), fcntl.LOCK_UN)
-            _lock_file_handle.close()
+            os.close(_lock_fd)  # Closing the descriptor drops the flock
         except OSError:
-            pass  # Best-effort unlock, file may already be closed
-        _lock_file_handle = None
+            pass  # Best-effort close, descriptor may already be closed
+        _lock_fd = None
     try:
         LOCK_FILE.unlink(missing_ok=True)
     except OSError:
@@ -64,9 +62,11 @@ def main():
     if use_libusb:
         sys.argv.remove("--libusb")
 
-    # Check for PyQt6
+    # Check for PyQt6 (imported here so the module loads without Qt)
     try:
         from PyQt6.QtCore import QT_VERSION_STR
+        from PyQt6.QtGui import QFont, QFontDatabase
+        from PyQt6.QtWidgets import QApplication, QMessageBox
 
         mode = "libusb" if use_libusb else "hidraw"
         print(f"Starting G13LogitechOPS GUI (Qt {QT_VERSION_STR}, {mode} mode)")
@@ -96,15 +96,18 @@ def main():
     app.setOrganizationName("AreteDriver")
     app.setApplicationVersion("1.5.3")
 
-    # Set default font (try platform-specific fonts)
-    font = QFont("Segoe UI", 10)
-    if not font.exactMatch():
-        font = QFont("Ubuntu", 10)
-    if not font.exactMatch():
-        font = QFont("Noto Sans", 10)
-    app.setFont(font)
+    # Set default font (first installed platform-specific font, one font DB query)
+    families = set(QFontDatabase.families())
+    for family in ("Segoe UI", "Ubuntu", "Noto Sans"):
+        if family in families:
+            app.setFont(QFont(family, 10))
+            break
+    else:
+        app.setFont(QFont("Noto Sans", 10))
 
     # Apply dark theme stylesheet
+    from .resources.styles import DARK_THEME
+
     app.setStyleSheet(DARK_THEME)
 
     # Import after QApplication is created
@@ -11,7 +11,36 @@ through systematic testing by pressing each button and recording the raw USB dat
 from dataclasses import dataclass
 
 
-@dataclass
+def _build_button_table(
+    button_map: dict[str, tuple[int, int]],
+    other_buttons: list[str],
+    m_shift: int,
+    other_shift: int,
+) -> tuple[tuple[str | None, ...], int]:
+    """
+    Build the bit index -> button name table for EventDecoder's combined bitmask.
+
+    Returns:
+        Tuple of (table indexed by bit, mask of OTHER_BUTTONS bits in raw bytes 6-7)
+    """
+    names: dict[int, str] = {}
+    for i in range(1, 23):
+        names[i] = f"G{i}"
+    for i in range(1, 4):
+        names[m_shift + i] = f"M{i}"
+
+    other_mask = 0
+    for name in other_buttons:
+        byte_idx, bit_pos = button_map[name]
+        bit = (byte_idx - 6) * 8 + bit_pos
+        other_mask |= 1 << bit
+        names[other_shift + bit] = name
+
+    table = tuple(names.get(i) for i in range(max(names) + 1))
+    return table, other_mask
+
+
+@dataclass(slots=True)
 class G13ButtonState:
     """Represents decoded button and joystick states from a USB HID report"""
 
@@ -91,13 +120,17 @@ class EventDecoder:
 
     def __init__(self):
         self.last_state: G13ButtonState | None = None
+        # Bitmask of last_state as computed by get_button_changes
+        self._last_bits_state: G13ButtonState | None = None
+        self._last_bits = 0
 
-    def decode_report(self, data: bytes | list) -> G13ButtonState:
+    def decode_report(self, data: bytes | bytearray | memoryview | list) -> G13ButtonState:
         """
         Decode 8-byte HID report into structured data.
 
         Args:
-            data: Raw 8-byte report from device (or padded to 64 bytes)
+            data: Raw 8-byte report from device (or padded to 64 bytes), as
+                bytes, a list of ints, or any buffer-protocol object
 
         Returns:
             Decoded button and joystick state
@@ -105,8 +138,9 @@ class EventDecoder:
         Raises:
             ValueError: If data is less than 8 bytes
         """
-        # Convert list to bytes if needed
-        if isinstance(data, list):
+        # Snapshot lists and buffers; callers may reuse a read buffer, and the
+        # state keeps raw_data for the next get_button_changes comparison
+        if not isinstance(data, bytes):
             data = bytes(data)
 
         if len(data) < 8:
@@ -181,6 +215,14 @@ class EventDecoder:
     # Buttons to check directly from raw data (not G1-G22 or M1-M3)
     OTHER_BUTTONS = ["BD", "L1", "L2", "L3", "L4", "MR", "LEFT", "DOWN", "STICK"]
 
+    # Combined button bitmask used by get_button_changes: G1-G22 at bits 1-22,
+    # M1-M3 at bits 24-26, and raw bytes 6-7 (OTHER_BUTTONS) from bit 32 up
+    _M_SHIFT = 23
+    _OTHER_SHIFT = 32
+    _BUTTON_TABLE, _OTHER_MASK = _build_button_table(
+        BUTTON_MAP, OTHER_BUTTONS, _M_SHIFT, _OTHER_SHIFT
+    )
+
     def _get_bitmask_buttons(self, bitmask: int, prefix: str, count: int) -> list[str]:
         """Extract pressed button names from a bitmask."""
         return [f"{prefix}{i}" for i in range(1, count + 1) if bitmask & (1 << i)]
@@ -228,23 +270,45 @@ class EventDecoder:
         Returns:
             Tuple of (pressed_buttons, released_buttons)
         """
+        cur = self._button_bits(new_state)
         if self.last_state is None:
             # First state - consider all pressed buttons as new
-            pressed = self.get_pressed_buttons(new_state)
-            self.last_state = new_state
-            return (pressed, [])
-
-        old_pressed = set(self.get_pressed_buttons(self.last_state))
-        new_pressed = set(self.get_pressed_buttons(new_state))
+            prev = 0
+        elif self.last_state is self._last_bits_state:
+            prev = self._last_bits
+        else:
+            prev = self._button_bits(self.last_state)
 
-        pressed = list(new_pressed - old_pressed)
-        released = list(old_pressed - new_pressed)
+        # Walk only the bits that differ, lowest first
+        pressed = []
+        released = []
+        table = self._BUTTON_TABLE
+        diff = cur ^ prev
+        while diff:
+            bit = diff & -diff
+            name = table[bit.bit_length() - 1]
+            if cur & bit:
+                pressed.append(name)
+            else:
+                released.append(name)
+            diff ^= bit
 
         # Update last_state for next comparison
         self.last_state = new_state
+        self._last_bits_state = new_state
+        self._last_bits = cur
 
         return (pressed, released)
 
+    def _button_bits(self, state: G13ButtonState) -> int:
+        """Pack a state's pressed buttons into the _BUTTON_TABLE bitmask."""
+        bits = state.g_buttons | (state.m_buttons << self._M_SHIFT)
+        raw = state.raw_data
+        if raw and len(raw) >= 8:
+            other = (raw[6] | (raw[7] << 8)) & self._OTHER_MASK
+            bits |= other << self._OTHER_SHIFT
+        return bits
+
     def analyze_raw_report(self, data: bytes) -> str:
         """
         Analyze raw report for reverse engineering.
@@ -5,13 +5,43 @@ Manages CRUD operations for G13 button mapping profiles.
 """
 
 import json
-from dataclasses import asdict, dataclass, field
+import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from g13_linux._paths import get_profiles_dir
 
-
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Mappings for a new profile: every button unbound
+_DEFAULT_MAPPINGS = {
+    # G keys (G1-G22)
+    **{f"G{i}": "KEY_RESERVED" for i in range(1, 23)},
+    # M keys (M1-M3)
+    **{f"M{i}": "KEY_RESERVED" for i in range(1, 4)},
+    # Thumb buttons (adjacent to joystick)
+    "LEFT": "KEY_RESERVED",
+    "DOWN": "KEY_RESERVED",
+    # Joystick click (press down on stick)
+    "STICK": "KEY_RESERVED",
+}
+
+# Templates for the nested ProfileData defaults; each profile gets its own copy
+_DEFAULT_LCD = {"enabled": True, "default_text": ""}
+_DEFAULT_BACKLIGHT = {"color": "#FFFFFF", "brightness": 100}
+_DEFAULT_JOYSTICK = {
+    "mode": "analog",  # "analog", "digital", or "disabled"
+    "deadzone": 20,
+    "sensitivity": 1.0,
+    "key_up": "KEY_UP",
+    "key_down": "KEY_DOWN",
+    "key_left": "KEY_LEFT",
+    "key_right": "KEY_RIGHT",
+    "allow_diagonals": True,
+}
+
+
+@dataclass(slots=True)
 class ProfileData:
     """
     Profile data structure matching JSON format.
@@ -32,20 +62,26 @@ class ProfileData:
     description: str = ""
     version: str = "0.1.0"
     mappings: dict = field(default_factory=dict)  # str | dict values
-    lcd: dict = field(default_factory=lambda: {"enabled": True, "default_text": ""})
-    backlight: dict = field(default_factory=lambda: {"color": "#FFFFFF", "brightness": 100})
-    joystick: dict = field(
-        default_factory=lambda: {
-            "mode": "analog",  # "analog", "digital", or "disabled"
-            "deadzone": 20,
-            "sensitivity": 1.0,
-            "key_up": "KEY_UP",
-            "key_down": "KEY_DOWN",
-            "key_left": "KEY_LEFT",
-            "key_right": "KEY_RIGHT",
-            "allow_diagonals": True,
+    lcd: dict = field(default_factory=_DEFAULT_LCD.copy)
+    backlight: dict = field(default_factory=_DEFAULT_BACKLIGHT.copy)
+    joystick: dict = field(default_factory=_DEFAULT_JOYSTICK.copy)
+
+    def to_dict(self) -> dict:
+        """
+        Return the profile as a dict with the same keys and values as asdict().
+
+        Unlike asdict() this is a shallow, non-recursive conversion: nested
+        dicts are shared with the profile, so callers must not mutate them.
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "version": self.version,
+            "mappings": self.mappings,
+            "lcd": self.lcd,
+            "backlight": self.backlight,
+            "joystick": self.joystick,
         }
-    )
 
 
 class ProfileManager:
@@ -58,13 +94,29 @@ class ProfileManager:
         self.profiles_dir = Path(profiles_dir)
         self.current_profile: ProfileData | None = None
         self.current_name: str | None = None  # Filename (without .json)
+        # (profiles_dir st_mtime_ns, profile names) from the last directory scan
+        self._names_cache: tuple[int, tuple[str, ...]] | None = None
 
         # Ensure profiles directory exists
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
 
     def list_profiles(self) -> list[str]:
         """Return list of available profile names"""
-        return [p.stem for p in self.profiles_dir.glob("*.json")]
+        return list(self._profile_names())
+
+    def _profile_names(self) -> tuple[str, ...]:
+        """
+        Return profile names, rescanning the directory only when it changed.
+
+        Adding, removing or renaming a file updates the directory's mtime;
+        this manager's own saves and deletes also drop the cache, covering
+        changes within the filesystem's timestamp granularity.
+        """
+        mtime = self.profiles_dir.stat().st_mtime_ns
+        if self._names_cache is None or self._names_cache[0] != mtime:
+            names = tuple(p.stem for p in self.profiles_dir.glob("*.json"))
+            self._names_cache = (mtime, names)
+        return self._names_cache[1]
 
     def load_profile(self, name: str) -> ProfileData:
         """
@@ -80,19 +132,38 @@ class ProfileManager:
             FileNotFoundError: If profile doesn't exist
             ValueError: If profile JSON is invalid
         """
+        profile = self._read_profile(name)
+        self.current_profile = profile
+        self.current_name = name  # Track the filename
+        return profile
+
+    def load_all(self) -> dict[str, ProfileData]:
+        """
+        Load every profile without changing the current profile
+
+        Profiles that are missing or invalid are logged and skipped.
+
+        Returns:
+            Dict of profile name (without .json) to ProfileData, in list_profiles() order
+        """
+        profiles = {}
+        for name in self._profile_names():
+            try:
+                profiles[name] = self._read_profile(name)
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping profile %s: %s", name, e)
+        return profiles
+
+    def _read_profile(self, name: str) -> ProfileData:
+        """Read and parse a profile file; raises as documented on load_profile()."""
         path = self.profiles_dir / f"{name}.json"
 
         if not path.exists():
             raise FileNotFoundError(f"Profile '{name}' not found at {path}")
 
         try:
-            with open(path) as f:
-                data = json.load(f)
-            profile = ProfileData(**data)
-            self.current_profile = profile
-            self.current_name = name  # Track the filename
-            return profile
-        except (json.JSONDecodeError, TypeError) as e:
+            return ProfileData(**json.loads(path.read_bytes()))
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError) as e:
             raise ValueError(f"Invalid profile JSON in '{name}': {e}")
 
     def save_profile(self, profile: ProfileData, name: str | None = None):
@@ -106,8 +177,9 @@ class ProfileManager:
         save_name = name or profile.name
         path = self.profiles_dir / f"{save_name}.json"
 
-        with open(path, "w") as f:
-            json.dump(asdict(profile), f, indent=2)
+        # One write of the encoded text: json.dump() issues a write per token
+        path.write_text(json.dumps(profile.to_dict(), indent=2))
+        self._names_cache = None
 
         self.current_profile = profile
 
@@ -121,31 +193,12 @@ class ProfileManager:
         Returns:
             New ProfileData with default mappings
         """
-        # Create default mappings for all buttons
-        default_mappings = {}
-
-        # G keys (G1-G22)
-        for i in range(1, 23):
-            default_mappings[f"G{i}"] = "KEY_RESERVED"
-
-        # M keys (M1-M3)
-        for i in range(1, 4):
-            default_mappings[f"M{i}"] = "KEY_RESERVED"
-
-        # Thumb buttons (adjacent to joystick)
-        default_mappings["LEFT"] = "KEY_RESERVED"
-        default_mappings["DOWN"] = "KEY_RESERVED"
-
-        # Joystick click (press down on stick)
-        default_mappings["STICK"] = "KEY_RESERVED"
-
         profile = ProfileData(
             name=name,
             description="",
             version="0.1.0",
-            mappings=default_mappings,
-            lcd={"enabled": True, "default_text": ""},
-            backlight={"color": "#FFFFFF", "brightness": 100},
+            # Shallow copy: values are strings, and callers edit the dict
+            mappings=_DEFAULT_MAPPINGS.copy(),
         )
 
         return profile
@@ -166,6 +219,7 @@ class ProfileManager:
             raise FileNotFoundError(f"Profile '{name}' not found")
 
         path.unlink()
+        self._names_cache = None
 
         # Clear current profile if it was the deleted one
         if self.current_profile and self.current_profile.name == name:
@@ -173,8 +227,7 @@ class ProfileManager:
 
     def profile_exists(self, name: str) -> bool:
         """Check if a profile exists"""
-        path = self.profiles_dir / f"{name}.json"
-        return path.exists()
+        return name in self._profile_names()
 
     def export_profile(self, name: str, export_path: str) -> None:
         """
@@ -197,10 +250,8 @@ class ProfileManager:
         if export_path.suffix.lower() != ".json":
             export_path = export_path.with_suffix(".json")
 
-        # Copy the profile file
-        import shutil
-
-        shutil.copy2(source_path, export_path)
+        # Copy the profile file (contents only; timestamps don't matter for an export)
+        export_path.write_bytes(source_path.read_bytes())
 
     def import_profile(self, import_path: str, new_name: str | None = None) -> str:
         """
@@ -241,9 +292,10 @@ class ProfileManager:
             profile_name = profile.name or import_path.stem
 
         # Check for conflicts and generate unique name if needed
+        existing = set(self._profile_names())
         original_name = profile_name
         counter = 1
-        while self.profile_exists(profile_name):
+        while profile_name in existing:
             profile_name = f"{original_name}_{counter}"
             counter += 1
 
@@ -30,7 +30,9 @@ class ButtonMapperWidget(QWidget):
         super().__init__(parent)
         self.setMinimumSize(KEYBOARD_WIDTH, KEYBOARD_HEIGHT)
         self.buttons = {}
-        self.background_image = self._load_background_image()
+        # Full-size image as loaded; resizes rescale from this, not from disk
+        self._source_image = self._load_background_image()
+        self.background_image = self._source_image
         self._init_buttons()
         self._init_lcd_preview()
         # Joystick position (0-255 for X and Y, 128 = center)
@@ -119,15 +121,13 @@ class ButtonMapperWidget(QWidget):
         )
 
         # Scale background image to current size
-        if self.background_image:
-            self.background_image = self._load_background_image()
-            if self.background_image:
-                self.background_image = self.background_image.scaled(
-                    self.width(),
-                    self.height(),
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+        if self._source_image:
+            self.background_image = self._source_image.scaled(
+                self.width(),
+                self.height(),
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
 
     def set_button_mapping(self, button_id: str, key_name: str):
         """Update button label with mapped key"""
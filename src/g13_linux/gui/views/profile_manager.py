@@ -4,19 +4,23 @@ Profile Manager Widget
 UI for managing G13 button configuration profiles.
 """
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
     QInputDialog,
     QLabel,
     QListWidget,
+    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
+# Clicks closer together than this produce a single profile_selected
+SELECTION_COALESCE_MS = 50
+
 
 class ProfileManagerWidget(QWidget):
     """Profile management UI"""
@@ -29,6 +33,12 @@ class ProfileManagerWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Rapid clicks restart the timer; only the last one reaches the controller
+        self._pending_selection: str | None = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(SELECTION_COALESCE_MS)
+        self._selection_timer.timeout.connect(self._emit_pending_selection)
         self._init_ui()
 
     def _init_ui(self):
@@ -41,7 +51,8 @@ class ProfileManagerWidget(QWidget):
 
         # Profile list
         self.profile_list = QListWidget()
-        self.profile_list.itemClicked.connect(lambda item: self.profile_selected.emit(item.text()))
+        self._item_by_name: dict[str, QListWidgetItem] = {}
+        self.profile_list.itemClicked.connect(self._queue_selection)
         layout.addWidget(self.profile_list)
 
         # Buttons
@@ -82,19 +93,66 @@ class ProfileManagerWidget(QWidget):
         self.setLayout(layout)
 
     def update_profile_list(self, profiles: list):
-        """Update the profile list"""
+        """
+        Update the profile list
+
+        Removed names are taken out and new ones inserted at their position,
+        so an unchanged list touches no items and the selection stays put.
+        A reordered list is rebuilt.
+        """
+        current = list(self._item_by_name)
+        if current == profiles:
+            return
+
+        wanted = set(profiles)
+        kept = [name for name in current if name in wanted]
+        if kept != [name for name in profiles if name in self._item_by_name]:
+            self._rebuild_profile_list(profiles)
+            return
+
+        for name in current:
+            if name not in wanted:
+                item = self._item_by_name.pop(name)
+                self.profile_list.takeItem(self.profile_list.row(item))
+
+        # Survivors are already in order; each new name goes in at its final row
+        for row, name in enumerate(profiles):
+            if name not in self._item_by_name:
+                item = QListWidgetItem(name)
+                self.profile_list.insertItem(row, item)
+                self._item_by_name[name] = item
+
+        # Keep the map in row order for the next comparison
+        self._item_by_name = {name: self._item_by_name[name] for name in profiles}
+
+    def _rebuild_profile_list(self, profiles: list):
+        """Replace every item, restoring the selection by name."""
         current_selection = None
         if self.profile_list.currentItem():
             current_selection = self.profile_list.currentItem().text()
 
         self.profile_list.clear()
-        self.profile_list.addItems(profiles)
+        self._item_by_name = {}
+        for name in profiles:
+            item = QListWidgetItem(name)
+            self.profile_list.addItem(item)
+            self._item_by_name[name] = item
 
         # Restore selection if possible
-        if current_selection and current_selection in profiles:
-            items = self.profile_list.findItems(current_selection, Qt.MatchFlag.MatchExactly)
-            if items:
-                self.profile_list.setCurrentItem(items[0])
+        item = self._item_by_name.get(current_selection)
+        if item is not None:
+            self.profile_list.setCurrentItem(item)
+
+    def _queue_selection(self, item: QListWidgetItem):
+        """Remember the clicked profile and (re)start the coalescing timer."""
+        self._pending_selection = item.text()
+        self._selection_timer.start()
+
+    def _emit_pending_selection(self):
+        """Emit profile_selected for the last clicked profile."""
+        name, self._pending_selection = self._pending_selection, None
+        if name is not None:
+            self.profile_selected.emit(name)
 
     def _on_new_profile(self):
         """Create new profile"""
@@ -4,6 +4,25 @@ GUI Widgets Module
 Reusable custom PyQt6 widgets.
 """
 
-from .lcd_preview import LCDPreviewEmbedded, LCDPreviewWidget
+import importlib
+
+# Re-exports are imported on first access (PEP 562), so importing one
+# widget module does not load the others
+_LAZY_EXPORTS = {
+    "LCDPreviewWidget": ".lcd_preview",
+    "LCDPreviewEmbedded": ".lcd_preview",
+}
 
 __all__ = ["LCDPreviewWidget", "LCDPreviewEmbedded"]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -5,6 +5,7 @@ Dialog for selecting keyboard key mappings with combo key support.
 """
 
 from evdev import ecodes
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -19,6 +20,90 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+# Typing pauses shorter than this are folded into one search filter pass
+SEARCH_DEBOUNCE_MS = 100
+
+# Key lists for the tabs. They never change at runtime, so they are built once.
+_COMMON_KEYS = (
+    "KEY_1",
+    "KEY_2",
+    "KEY_3",
+    "KEY_4",
+    "KEY_5",
+    "KEY_6",
+    "KEY_7",
+    "KEY_8",
+    "KEY_9",
+    "KEY_0",
+    "KEY_A",
+    "KEY_B",
+    "KEY_C",
+    "KEY_D",
+    "KEY_E",
+    "KEY_F",
+    "KEY_G",
+    "KEY_H",
+    "KEY_I",
+    "KEY_J",
+    "KEY_K",
+    "KEY_L",
+    "KEY_M",
+    "KEY_N",
+    "KEY_O",
+    "KEY_P",
+    "KEY_Q",
+    "KEY_R",
+    "KEY_S",
+    "KEY_T",
+    "KEY_U",
+    "KEY_V",
+    "KEY_W",
+    "KEY_X",
+    "KEY_Y",
+    "KEY_Z",
+    "KEY_ENTER",
+    "KEY_SPACE",
+    "KEY_ESC",
+    "KEY_TAB",
+    "KEY_BACKSPACE",
+    "KEY_DELETE",
+    "KEY_HOME",
+    "KEY_END",
+    "KEY_PAGEUP",
+    "KEY_PAGEDOWN",
+    "KEY_UP",
+    "KEY_DOWN",
+    "KEY_LEFT",
+    "KEY_RIGHT",
+)
+
+_FUNCTION_KEYS = tuple(f"KEY_F{i}" for i in range(1, 25))
+
+_MODIFIER_KEYS = (
+    "KEY_LEFTCTRL",
+    "KEY_RIGHTCTRL",
+    "KEY_LEFTSHIFT",
+    "KEY_RIGHTSHIFT",
+    "KEY_LEFTALT",
+    "KEY_RIGHTALT",
+    "KEY_LEFTMETA",
+    "KEY_RIGHTMETA",
+)
+
+_ALL_KEYS = tuple(sorted(name for name in dir(ecodes) if name.startswith("KEY_")))
+
+# Modifier key code -> index of its checkbox in KeySelectorDialog._modifier_checks
+_MODIFIER_INDEX = {
+    "KEY_LEFTCTRL": 0,
+    "KEY_RIGHTCTRL": 0,
+    "KEY_LEFTALT": 1,
+    "KEY_RIGHTALT": 1,
+    "KEY_LEFTSHIFT": 2,
+    "KEY_RIGHTSHIFT": 2,
+    "KEY_LEFTMETA": 3,
+    "KEY_RIGHTMETA": 3,
+}
+
 
 class KeySelectorDialog(QDialog):
     """Dialog for selecting key mappings with combo key support.
@@ -34,6 +119,11 @@ class KeySelectorDialog(QDialog):
         self.selected_key = None
         self._main_key = None
         self._current_mapping = current_mapping
+        # Preview requests made in one event loop pass share a single update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._do_update_preview)
         self._init_ui()
         self._load_current_mapping()
 
@@ -66,90 +156,36 @@ class KeySelectorDialog(QDialog):
         mod_group.setLayout(mod_layout)
         layout.addWidget(mod_group)
 
+        # (checkbox, key code, preview name), in combo order
+        self._modifier_checks = (
+            (self.ctrl_check, "KEY_LEFTCTRL", "Ctrl"),
+            (self.alt_check, "KEY_LEFTALT", "Alt"),
+            (self.shift_check, "KEY_LEFTSHIFT", "Shift"),
+            (self.meta_check, "KEY_LEFTMETA", "Super"),
+        )
+
         # Connect modifier changes to preview update
-        for check in [self.ctrl_check, self.alt_check, self.shift_check, self.meta_check]:
+        for check, _key, _name in self._modifier_checks:
             check.toggled.connect(self._update_preview)
 
         # Tabs for different key categories
-        tabs = QTabWidget()
-
-        # Tab 1: Common keys (excluding modifiers for cleaner selection)
-        common_keys = [
-            "KEY_1",
-            "KEY_2",
-            "KEY_3",
-            "KEY_4",
-            "KEY_5",
-            "KEY_6",
-            "KEY_7",
-            "KEY_8",
-            "KEY_9",
-            "KEY_0",
-            "KEY_A",
-            "KEY_B",
-            "KEY_C",
-            "KEY_D",
-            "KEY_E",
-            "KEY_F",
-            "KEY_G",
-            "KEY_H",
-            "KEY_I",
-            "KEY_J",
-            "KEY_K",
-            "KEY_L",
-            "KEY_M",
-            "KEY_N",
-            "KEY_O",
-            "KEY_P",
-            "KEY_Q",
-            "KEY_R",
-            "KEY_S",
-            "KEY_T",
-            "KEY_U",
-            "KEY_V",
-            "KEY_W",
-            "KEY_X",
-            "KEY_Y",
-            "KEY_Z",
-            "KEY_ENTER",
-            "KEY_SPACE",
-            "KEY_ESC",
-            "KEY_TAB",
-            "KEY_BACKSPACE",
-            "KEY_DELETE",
-            "KEY_HOME",
-            "KEY_END",
-            "KEY_PAGEUP",
-            "KEY_PAGEDOWN",
-            "KEY_UP",
-            "KEY_DOWN",
-            "KEY_LEFT",
-            "KEY_RIGHT",
-        ]
-        tabs.addTab(self._create_key_list(common_keys), "Common Keys")
+        self._tabs = QTabWidget()
 
-        # Tab 2: Function keys
-        fn_keys = [f"KEY_F{i}" for i in range(1, 25)]
-        tabs.addTab(self._create_key_list(fn_keys), "Function Keys")
+        # Tab 1: Common keys (excluding modifiers for cleaner selection).
+        # The default tab, so it is the only one built up front.
+        self._tabs.addTab(self._create_key_list(_COMMON_KEYS), "Common Keys")
 
+        # The other lists, "All Keys" especially, are built on first view
+        self._pending_tabs: dict[int, tuple[str, ...]] = {}
+        # Tab 2: Function keys
+        self._add_lazy_tab(_FUNCTION_KEYS, "Function Keys")
         # Tab 3: Modifiers only (for single modifier mapping)
-        modifier_keys = [
-            "KEY_LEFTCTRL",
-            "KEY_RIGHTCTRL",
-            "KEY_LEFTSHIFT",
-            "KEY_RIGHTSHIFT",
-            "KEY_LEFTALT",
-            "KEY_RIGHTALT",
-            "KEY_LEFTMETA",
-            "KEY_RIGHTMETA",
-        ]
-        tabs.addTab(self._create_key_list(modifier_keys), "Modifiers")
-
+        self._add_lazy_tab(_MODIFIER_KEYS, "Modifiers")
         # Tab 4: All keys
-        all_keys = sorted([name for name in dir(ecodes) if name.startswith("KEY_")])
-        tabs.addTab(self._create_key_list(all_keys), "All Keys")
+        self._add_lazy_tab(_ALL_KEYS, "All Keys")
+        self._tabs.currentChanged.connect(self._materialize_tab)
 
-        layout.addWidget(tabs)
+        layout.addWidget(self._tabs)
 
         # Label for combo (optional)
         label_layout = QHBoxLayout()
@@ -204,21 +240,31 @@ class KeySelectorDialog(QDialog):
 
             # Set modifiers
             for key in keys:
-                if key in ("KEY_LEFTCTRL", "KEY_RIGHTCTRL"):
-                    self.ctrl_check.setChecked(True)
-                elif key in ("KEY_LEFTALT", "KEY_RIGHTALT"):
-                    self.alt_check.setChecked(True)
-                elif key in ("KEY_LEFTSHIFT", "KEY_RIGHTSHIFT"):
-                    self.shift_check.setChecked(True)
-                elif key in ("KEY_LEFTMETA", "KEY_RIGHTMETA"):
-                    self.meta_check.setChecked(True)
-                else:
+                index = _MODIFIER_INDEX.get(key)
+                if index is None:
                     # Non-modifier key is the main key
                     self._main_key = key
+                else:
+                    self._modifier_checks[index][0].setChecked(True)
 
             self.label_edit.setText(label)
             self._update_preview()
 
+    def _add_lazy_tab(self, keys: tuple[str, ...], title: str):
+        """Add an empty tab page whose key list is built when first shown."""
+        page = QWidget()
+        page_layout = QVBoxLayout()
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page.setLayout(page_layout)
+        index = self._tabs.addTab(page, title)
+        self._pending_tabs[index] = keys
+
+    def _materialize_tab(self, index: int):
+        """Build the key list for a lazy tab the first time it is shown."""
+        keys = self._pending_tabs.pop(index, None)
+        if keys is not None:
+            self._tabs.widget(index).layout().addWidget(self._create_key_list(keys))
+
     def _create_key_list(self, keys):
         """Create a searchable key list widget"""
         widget = QWidget()
@@ -232,74 +278,66 @@ class KeySelectorDialog(QDialog):
         # List
         list_widget = QListWidget()
         list_widget.addItems(keys)
-        list_widget.itemDoubleClicked.connect(self._on_key_selected)
         list_widget.itemClicked.connect(self._on_key_selected)
+        list_widget.itemDoubleClicked.connect(self._on_key_activated)
         layout.addWidget(list_widget)
 
-        # Search functionality
-        def filter_list(text):
-            list_widget.clear()
-            filtered = [k for k in keys if text.upper() in k]
-            list_widget.addItems(filtered)
+        # Search functionality: hide non-matching rows instead of rebuilding
+        # the items, once typing pauses
+        filter_timer = QTimer(widget)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
+        def filter_list():
+            text = search.text().upper()
+            for row, key in enumerate(keys):
+                list_widget.setRowHidden(row, text not in key)
 
-        search.textChanged.connect(filter_list)
+        filter_timer.timeout.connect(filter_list)
+        search.textChanged.connect(lambda _text: filter_timer.start())
 
         widget.setLayout(layout)
         return widget
 
     def _on_key_selected(self, item):
-        """Handle key selection"""
-        self._main_key = item.text()
+        """Handle key selection, ignoring clicks on the key already selected."""
+        key = item.text()
+        if key == self._main_key:
+            return
+        self._main_key = key
         self._update_preview()
 
+    def _on_key_activated(self, item):
+        """Select the double-clicked key and accept the dialog."""
+        self._on_key_selected(item)
+        self.accept()
+
+    def _selected_modifiers(self) -> list[tuple[str, str]]:
+        """Get (key code, preview name) for each checked modifier, reading each box once."""
+        return [(key, name) for check, key, name in self._modifier_checks if check.isChecked()]
+
     def _get_modifier_keys(self) -> list[str]:
         """Get list of selected modifier key codes."""
-        mods = []
-        if self.ctrl_check.isChecked():
-            mods.append("KEY_LEFTCTRL")
-        if self.alt_check.isChecked():
-            mods.append("KEY_LEFTALT")
-        if self.shift_check.isChecked():
-            mods.append("KEY_LEFTSHIFT")
-        if self.meta_check.isChecked():
-            mods.append("KEY_LEFTMETA")
-        return mods
+        return [key for key, _name in self._selected_modifiers()]
 
     def _update_preview(self):
+        """Schedule a preview label update for the next event loop pass."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         """Update the preview label."""
         if not self._main_key:
             self.preview_label.setText("(select a key)")
             return
 
-        mods = self._get_modifier_keys()
-        label = self.label_edit.text().strip()
+        # Simple key, or modifiers joined with the key for a combo
+        mod_names = [name for _key, name in self._selected_modifiers()]
+        text = "+".join(mod_names + [self._main_key.replace("KEY_", "")])
 
-        if mods:
-            # Combo key
-            mod_names = []
-            if self.ctrl_check.isChecked():
-                mod_names.append("Ctrl")
-            if self.alt_check.isChecked():
-                mod_names.append("Alt")
-            if self.shift_check.isChecked():
-                mod_names.append("Shift")
-            if self.meta_check.isChecked():
-                mod_names.append("Super")
-
-            key_name = self._main_key.replace("KEY_", "")
-            combo_str = "+".join(mod_names + [key_name])
-
-            if label:
-                self.preview_label.setText(f"{combo_str} ({label})")
-            else:
-                self.preview_label.setText(combo_str)
-        else:
-            # Simple key
-            key_name = self._main_key.replace("KEY_", "")
-            if label:
-                self.preview_label.setText(f"{key_name} ({label})")
-            else:
-                self.preview_label.setText(key_name)
+        label = self.label_edit.text().strip()
+        if label:
+            text = f"{text} ({label})"
+        self.preview_label.setText(text)
 
     def accept(self):
         """Build the selected_key value and accept dialog."""
@@ -217,12 +217,12 @@ class G13LCD:
         x = max(0, (self.WIDTH - text_width) // 2)
         self.write_text(text, x, y, send)
 
-    def write_bitmap(self, bitmap: bytes):
+    def write_bitmap(self, bitmap: bytes | bytearray | memoryview):
         """
         Write raw bitmap to LCD.
 
         Args:
-            bitmap: Raw bitmap data (960 bytes for full frame)
+            bitmap: Raw bitmap data (960 bytes for full frame); copied before returning
         """
         if len(bitmap) > self.FRAMEBUFFER_SIZE:
             raise ValueError(f"Bitmap too large: max {self.FRAMEBUFFER_SIZE} bytes")
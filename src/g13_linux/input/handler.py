@@ -14,13 +14,27 @@ from ..menu.screen import InputEvent
 
 logger = logging.getLogger(__name__)
 
+# Menu buttons as bits of (report[7] << 8 | report[6]), in emission order.
+# Byte/bit positions match EventDecoder.
+_NAV_BUTTONS = (
+    (1 << 11, InputEvent.STICK_PRESS),  # byte 7, bit 3
+    (1 << 0, InputEvent.BUTTON_BD),  # byte 6, bit 0
+    (1 << 9, InputEvent.BUTTON_LEFT),  # byte 7, bit 1
+    (1 << 5, InputEvent.BUTTON_M1),  # byte 6, bit 5
+    (1 << 6, InputEvent.BUTTON_M2),  # byte 6, bit 6
+    (1 << 7, InputEvent.BUTTON_M3),  # byte 6, bit 7
+    (1 << 8, InputEvent.BUTTON_MR),  # byte 7, bit 0
+)
+_NAV_MASK = sum(bit for bit, _ in _NAV_BUTTONS)
+
 
 class InputHandler:
     """
     Handles G13 input for menu navigation.
 
     Reads from device and emits InputEvents based on thumbstick
-    and button states.
+    and button states. Callers that already read the device (the daemon)
+    skip start() and drive the handler with process_report() and tick().
     """
 
     # Thumbstick thresholds
@@ -46,15 +60,17 @@ class InputHandler:
         # Thumbstick state
         self._stick_x = self.STICK_CENTER
         self._stick_y = self.STICK_CENTER
-        self._stick_pressed = False
 
         # Direction repeat tracking
         self._repeat_direction: InputEvent | None = None
         self._repeat_start_time: float = 0
         self._last_repeat_time: float = 0
 
-        # Button state for edge detection
-        self._button_state: dict[str, bool] = {}
+        # Last report handled by the polling loop, to skip unchanged repeats
+        self._last_report = None
+
+        # Button bits (stick click included) from the previous report, for edge detection
+        self._button_bits = 0
 
     def start(self):
         """Start input polling thread."""
@@ -74,18 +90,45 @@ class InputHandler:
             self._thread = None
         logger.info("Input handler stopped")
 
+    def process_report(self, data: bytes):
+        """
+        Handle a HID report read by the caller instead of the polling thread.
+
+        Args:
+            data: Raw HID report bytes
+        """
+        self._process_report(data)
+
+    def tick(self) -> float | None:
+        """
+        Run stick auto-repeat when reports are fed via process_report().
+
+        Returns:
+            Seconds until the next repeat is due, or None if no direction is held
+        """
+        now = time.monotonic()
+        self._check_stick_repeat(now)
+        if not self._repeat_direction:
+            return None
+
+        if now - self._repeat_start_time < self.STICK_REPEAT_DELAY:
+            return self._repeat_start_time + self.STICK_REPEAT_DELAY - now
+        return max(0.0, self._last_repeat_time + self.STICK_REPEAT_RATE - now)
+
     def _poll_loop(self):
         """Main polling loop."""
         while self._running:
             try:
                 data = self.device.read(timeout_ms=100)
-                if data:
+                if data and data != self._last_report:
+                    self._last_report = data
                     self._process_report(data)
                 else:
-                    # Check for stick repeat even without new data
+                    # No data, or the same report again: decoding it would
+                    # change nothing, but a stick repeat may be due
                     self._check_stick_repeat()
             except Exception as e:
-                logger.debug(f"Input read: {e}")
+                logger.debug("Input read: %s", e)
                 time.sleep(0.01)
 
     def _process_report(self, data: bytes):
@@ -104,11 +147,10 @@ class InputHandler:
         # Process thumbstick
         self._process_thumbstick(state.joystick_x, state.joystick_y)
 
-        # Process stick button
-        self._process_stick_button(state.raw_data)
-
-        # Process navigation buttons
-        self._process_buttons(state.raw_data)
+        # Process stick button and navigation buttons; the decoder has
+        # already checked the report holds both button bytes
+        data = state.raw_data
+        self._process_buttons(data[6] | data[7] << 8)
 
     def _process_thumbstick(self, x: int, y: int):
         """
@@ -121,40 +163,44 @@ class InputHandler:
         self._stick_x = x
         self._stick_y = y
 
-        # Determine direction
-        direction = None
+        threshold = self.STICK_THRESHOLD
+        dx = x - self.STICK_CENTER
+        dy = y - self.STICK_CENTER
+
+        # Resting inside the dead zone is the common case; stop any repeat
+        if -threshold <= dx <= threshold and -threshold <= dy <= threshold:
+            self._repeat_direction = None
+            return
 
-        # Y axis (up/down) - note: Y may be inverted
-        if y < self.STICK_CENTER - self.STICK_THRESHOLD:
+        # Y axis (up/down) takes priority - note: Y may be inverted
+        if dy < -threshold:
             direction = InputEvent.STICK_UP
-        elif y > self.STICK_CENTER + self.STICK_THRESHOLD:
+        elif dy > threshold:
             direction = InputEvent.STICK_DOWN
-
-        # X axis (left/right) - only if no Y direction
-        if direction is None:
-            if x < self.STICK_CENTER - self.STICK_THRESHOLD:
-                direction = InputEvent.STICK_LEFT
-            elif x > self.STICK_CENTER + self.STICK_THRESHOLD:
-                direction = InputEvent.STICK_RIGHT
+        elif dx < -threshold:
+            direction = InputEvent.STICK_LEFT
+        else:
+            direction = InputEvent.STICK_RIGHT
 
         # Handle direction changes and repeats
         if direction != self._repeat_direction:
-            if direction:
-                # New direction - emit immediately
-                self._emit(direction)
-                self._repeat_direction = direction
-                self._repeat_start_time = time.time()
-                self._last_repeat_time = time.time()
-            else:
-                # Back to center - stop repeating
-                self._repeat_direction = None
-
-    def _check_stick_repeat(self):
-        """Check if stick repeat should trigger."""
+            # New direction - emit immediately
+            self._emit(direction)
+            self._repeat_direction = direction
+            self._repeat_start_time = self._last_repeat_time = time.monotonic()
+
+    def _check_stick_repeat(self, now: float | None = None):
+        """
+        Check if stick repeat should trigger.
+
+        Args:
+            now: time.monotonic() reading to use; read here if None
+        """
         if not self._repeat_direction:
             return
 
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         elapsed = now - self._repeat_start_time
 
         # Wait for initial delay
@@ -166,54 +212,24 @@ class InputHandler:
             self._emit(self._repeat_direction)
             self._last_repeat_time = now
 
-    def _process_stick_button(self, data: bytes):
+    def _process_buttons(self, bits: int):
         """
-        Process thumbstick button press.
+        Process the stick button and navigation buttons (BD, LEFT, M1-M3, MR).
 
         Args:
-            data: Raw HID report
+            bits: Report bytes 6 and 7 as (byte 7 << 8 | byte 6)
         """
-        if len(data) < 8:
-            return
-
-        # STICK button is byte 7, bit 3
-        is_pressed = bool(data[7] & 0x08)
-
-        if is_pressed and not self._stick_pressed:
-            self._emit(InputEvent.STICK_PRESS)
-
-        self._stick_pressed = is_pressed
-
-    def _process_buttons(self, data: bytes):
-        """
-        Process navigation buttons (BD, M1-M3, MR).
-
-        Args:
-            data: Raw HID report
-        """
-        if len(data) < 8:
-            return
-
-        # Button mappings from EventDecoder
-        button_map = {
-            "BD": (6, 0, InputEvent.BUTTON_BD),
-            "LEFT": (7, 1, InputEvent.BUTTON_LEFT),
-            "M1": (6, 5, InputEvent.BUTTON_M1),
-            "M2": (6, 6, InputEvent.BUTTON_M2),
-            "M3": (6, 7, InputEvent.BUTTON_M3),
-            "MR": (7, 0, InputEvent.BUTTON_MR),
-        }
-
-        for name, (byte_idx, bit_pos, event) in button_map.items():
-            is_pressed = bool(data[byte_idx] & (1 << bit_pos))
-            was_pressed = self._button_state.get(name, False)
-
-            # Emit on rising edge only
-            if is_pressed and not was_pressed:
+        bits &= _NAV_MASK
+        if bits == self._button_bits:
+            return  # No button changed (the usual case)
+
+        # Emit on rising edge only
+        pressed = bits & ~self._button_bits
+        self._button_bits = bits
+        for bit, event in _NAV_BUTTONS:
+            if pressed & bit:
                 self._emit(event)
 
-            self._button_state[name] = is_pressed
-
     def _emit(self, event: InputEvent):
         """
         Emit input event to callback.
@@ -58,7 +58,7 @@ class NavigationController:
         Args:
             event: Input event to handle
         """
-        logger.debug(f"Input: {event.value} (state: {self.state.value})")
+        logger.debug("Input: %s (state: %s)", event.value, self.state.value)
 
         if self.state == NavigationState.IDLE:
             self._handle_idle_input(event)
@@ -4,13 +4,56 @@ LCD Canvas
 Drawing primitives for the G13 160x43 monochrome display.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .fonts import FONT_5X7, Font
+
 if TYPE_CHECKING:
-    from .fonts import Font
     from .icons import Icon
 
+# Region operations for Canvas._apply_region()
+_SET = 0
+_CLEAR = 1
+_INVERT = 2
+
+
+@functools.cache
+def _byte_table(op: int, mask: int) -> bytes:
+    """
+    Build a bytes.translate() table applying a bit mask to every byte.
+
+    Args:
+        op: _SET, _CLEAR or _INVERT
+        mask: Bits to set, clear or toggle
+
+    Returns:
+        256-byte table mapping each byte value to its result
+    """
+    if op == _SET:
+        return bytes(b | mask for b in range(256))
+    if op == _CLEAR:
+        return bytes(b & ~mask for b in range(256))
+    return bytes(b ^ mask for b in range(256))
+
+
+@functools.cache
+def _shift_tables(rows: int, shift: int, invert: bool) -> tuple[bytes, bytes]:
+    """
+    Build bytes.translate() tables placing column bytes across two row blocks.
+
+    Args:
+        rows: Mask of source rows to keep (bit 0 is top row)
+        shift: Destination y position modulo 8
+        invert: Invert each source byte before masking
+
+    Returns:
+        (upper block table, lower block table)
+    """
+    placed = [((~b if invert else b) & rows) << shift for b in range(256)]
+    return bytes(v & 0xFF for v in placed), bytes(v >> 8 for v in placed)
+
 
 @dataclass
 class Canvas:
@@ -25,6 +68,8 @@ class Canvas:
     HEIGHT = 43
     BUFFER_ROWS = 48  # Buffer has 48 rows (6 bytes × 8 bits)
     FRAMEBUFFER_SIZE = 960  # 160 × 6
+    _BLANK_FRAME = bytes(FRAMEBUFFER_SIZE)
+    _FULL_FRAME = b"\xff" * FRAMEBUFFER_SIZE
 
     def __init__(self, width: int = 160, height: int = 43):
         """Initialize canvas with given dimensions."""
@@ -34,11 +79,12 @@ class Canvas:
 
     def clear(self):
         """Clear canvas (all pixels off)."""
-        self._buffer = bytearray(self.FRAMEBUFFER_SIZE)
+        # Overwrite in place: no new buffer, and views of it stay valid
+        self._buffer[:] = self._BLANK_FRAME
 
     def fill(self):
         """Fill canvas (all pixels on)."""
-        self._buffer = bytearray([0xFF] * self.FRAMEBUFFER_SIZE)
+        self._buffer[:] = self._FULL_FRAME
 
     def set_pixel(self, x: int, y: int, on: bool = True):
         """
@@ -88,8 +134,7 @@ class Canvas:
             width: Line width
             on: Pixel state
         """
-        for i in range(width):
-            self.set_pixel(x + i, y, on)
+        self._apply_region(x, y, width, 1, _SET if on else _CLEAR)
 
     def draw_vline(self, x: int, y: int, height: int, on: bool = True):
         """
@@ -101,8 +146,7 @@ class Canvas:
             height: Line height
             on: Pixel state
         """
-        for i in range(height):
-            self.set_pixel(x, y + i, on)
+        self._apply_region(x, y, 1, height, _SET if on else _CLEAR)
 
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, on: bool = True):
         """
@@ -113,14 +157,28 @@ class Canvas:
             x2, y2: End point
             on: Pixel state
         """
+        # Axis-aligned lines are plain region fills
+        if y1 == y2:
+            self.draw_hline(min(x1, x2), y1, abs(x2 - x1) + 1, on)
+            return
+        if x1 == x2:
+            self.draw_vline(x1, min(y1, y2), abs(y2 - y1) + 1, on)
+            return
+
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
         sy = 1 if y1 < y2 else -1
         err = dx - dy
+        buf = self._buffer
 
         while True:
-            self.set_pixel(x1, y1, on)
+            # set_pixel(x1, y1, on), inlined
+            if 0 <= x1 < self.width and 0 <= y1 < self.height:
+                if on:
+                    buf[x1 + (y1 >> 3) * self.WIDTH] |= 1 << (y1 & 7)
+                else:
+                    buf[x1 + (y1 >> 3) * self.WIDTH] &= ~(1 << (y1 & 7))
             if x1 == x2 and y1 == y2:
                 break
             e2 = 2 * err
@@ -144,9 +202,7 @@ class Canvas:
             on: Pixel state
         """
         if filled:
-            for py in range(height):
-                for px in range(width):
-                    self.set_pixel(x + px, y + py, on)
+            self._apply_region(x, y, width, height, _SET if on else _CLEAR)
         else:
             # Top and bottom
             self.draw_hline(x, y, width, on)
@@ -170,38 +226,54 @@ class Canvas:
         Returns:
             Width of rendered text in pixels
         """
-        from .fonts import FONT_5X7
-
         if font is None:
             font = FONT_5X7
 
-        cursor_x = x
-        char_spacing = 1
-
-        for char in text:
-            glyph = font.get_glyph(char)
-            if glyph is None:
-                continue
+        # Glyph rows (bit 0 = top row) that land inside the canvas
+        rows = sum(1 << row for row in range(font.char_height) if 0 <= y + row < self.height)
+        block = y // 8
+        shift = y % 8
+        advance = font.char_width + 1
 
-            # Render each column of the glyph
-            for col_idx, col_data in enumerate(glyph):
-                px = cursor_x + col_idx
-                if px >= self.width:
-                    break
-
-                for row in range(font.char_height):
-                    py = y + row
-                    if py >= self.height:
-                        continue
-                    if col_data & (1 << row):
-                        self.set_pixel(px, py, on)
-
-            cursor_x += font.char_width + char_spacing
-            if cursor_x >= self.width:
-                break
+        if text.isascii():
+            cells = map(font.cell_table(shift, rows).__getitem__, text.encode("ascii"))
+        else:
+            cells = (font.shifted_cell(char, shift, rows) for char in text)
+        cells = [cell for cell in cells if cell is not None]
+        # Stop after the first character that reaches the right edge
+        del cells[max(1, -((x - self.width) // advance)) :]
+        cursor_x = x + len(cells) * advance
+
+        # Clip the rendered line to the canvas columns
+        first = max(0, -x)
+        last = min(cursor_x, self.width) - x
+        if first < last:
+            upper = b"".join([cell[0] for cell in cells])
+            lower = b"".join([cell[1] for cell in cells])
+            self._merge_block(block, x + first, upper[first:last], on)
+            self._merge_block(block + 1, x + first, lower[first:last], on)
 
         return cursor_x - x
 
+    def _merge_block(self, block: int, x: int, data: bytes, on: bool):
+        """
+        OR (or AND-NOT, when on is False) bytes into one row block.
+
+        Args:
+            block: Row block index; blocks outside the buffer are ignored
+            x: First column
+            data: One byte per column, already clipped to the canvas width
+            on: Pixel state
+        """
+        if not 0 <= block < self.BUFFER_ROWS // 8 or not data.strip(b"\x00"):
+            return
+        start = block * self.WIDTH + x
+        end = start + len(data)
+        current = int.from_bytes(self._buffer[start:end], "little")
+        bits = int.from_bytes(data, "little")
+        merged = current | bits if on else current & ~bits
+        self._buffer[start:end] = merged.to_bytes(len(data), "little")
+
     def draw_text_centered(self, y: int, text: str, font: "Font | None" = None, on: bool = True):
         """
         Draw text centered horizontally.
@@ -212,8 +284,6 @@ class Canvas:
             font: Font to use
             on: Pixel state
         """
-        from .fonts import FONT_5X7
-
         if font is None:
             font = FONT_5X7
 
@@ -230,17 +300,52 @@ class Canvas:
             icon: Icon to draw
             on: Pixel state (inverts icon if False)
         """
-        for row in range(icon.height):
-            for col in range(icon.width):
-                byte_idx = col + (row // 8) * icon.width
-                if byte_idx >= len(icon.data):
-                    continue
-                bit = row % 8
-                pixel_on = bool(icon.data[byte_idx] & (1 << bit))
-                if on:
-                    self.set_pixel(x + col, y + row, pixel_on)
-                else:
-                    self.set_pixel(x + col, y + row, not pixel_on)
+        # Icon data uses the canvas's row-block packing, so each icon byte
+        # replaces up to 8 pixel rows at once: shifted by the block's y % 8,
+        # it straddles at most two canvas row blocks
+        col_start = max(0, -x)
+        col_end = min(icon.width, self.width - x)
+        if col_start >= col_end:
+            return
+
+        for icon_block in range(0, (icon.height + 7) // 8):
+            top = y + icon_block * 8
+            # Icon rows in this block that exist and land inside the canvas
+            rows = sum(
+                1 << r
+                for r in range(min(8, icon.height - icon_block * 8))
+                if 0 <= top + r < self.height
+            )
+            if not rows:
+                continue
+            base = icon_block * icon.width
+            columns = icon.data[base + col_start : base + col_end]
+            if not columns:
+                continue
+            block = top // 8
+            shift = top % 8
+            mask = rows << shift
+            upper, lower = _shift_tables(rows, shift, not on)
+            self._replace_block(block, x + col_start, columns.translate(upper), mask & 0xFF)
+            self._replace_block(block + 1, x + col_start, columns.translate(lower), mask >> 8)
+
+    def _replace_block(self, block: int, x: int, data: bytes, mask: int):
+        """
+        Replace the masked bits of a run of bytes in one row block.
+
+        Args:
+            block: Row block index; blocks outside the buffer are ignored
+            x: First column
+            data: One byte per column, with no bits set outside mask
+            mask: Bits of each buffer byte to replace
+        """
+        if not mask or not 0 <= block < self.BUFFER_ROWS // 8:
+            return
+        start = block * self.WIDTH + x
+        end = start + len(data)
+        cleared = self._buffer[start:end].translate(_byte_table(_CLEAR, mask))
+        merged = int.from_bytes(cleared, "little") | int.from_bytes(data, "little")
+        self._buffer[start:end] = merged.to_bytes(len(data), "little")
 
     def draw_progress_bar(
         self,
@@ -286,10 +391,38 @@ class Canvas:
             x, y: Top-left corner
             width, height: Dimensions
         """
-        for py in range(height):
-            for px in range(width):
-                current = self.get_pixel(x + px, y + py)
-                self.set_pixel(x + px, y + py, not current)
+        self._apply_region(x, y, width, height, _INVERT)
+
+    def _apply_region(self, x: int, y: int, width: int, height: int, op: int):
+        """
+        Set, clear or invert every pixel of a rectangle, clipped to the canvas.
+
+        Works one row block (8 pixel rows) at a time: the rows the rectangle
+        covers in that block form one bit mask, applied to the whole run of
+        bytes with a single slice operation.
+
+        Args:
+            x, y: Top-left corner
+            width, height: Dimensions
+            op: _SET, _CLEAR or _INVERT
+        """
+        x0, x1 = max(x, 0), min(x + width, self.width)
+        y0, y1 = max(y, 0), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        buf = self._buffer
+        for block in range(y0 // 8, (y1 - 1) // 8 + 1):
+            top = block * 8
+            lo = max(y0 - top, 0)
+            hi = min(y1 - top, 8)
+            mask = (0xFF << lo) & (0xFF >> (8 - hi))
+            start = block * self.WIDTH + x0
+            end = block * self.WIDTH + x1
+            if mask == 0xFF and op != _INVERT:
+                buf[start:end] = (b"\xff" if op == _SET else b"\x00") * (end - start)
+            else:
+                buf[start:end] = buf[start:end].translate(_byte_table(op, mask))
 
     def blit(self, other: "Canvas", x: int, y: int):
         """
@@ -299,10 +432,29 @@ class Canvas:
             other: Source canvas
             x, y: Position to place source
         """
-        for py in range(other.height):
-            for px in range(other.width):
-                if other.get_pixel(px, py):
-                    self.set_pixel(x + px, y + py, True)
+        # Both canvases share the row-block packing, so each source row block
+        # is ORed in whole: shifted by y % 8 it straddles at most two blocks
+        col_start = max(0, -x)
+        col_end = min(other.width, self.width - x)
+        if col_start >= col_end:
+            return
+
+        for src_block in range((other.height + 7) // 8):
+            top = y + src_block * 8
+            # Source rows in this block that exist and land inside the canvas
+            rows = sum(
+                1 << r
+                for r in range(min(8, other.height - src_block * 8))
+                if 0 <= top + r < self.height
+            )
+            if not rows:
+                continue
+            base = src_block * other.WIDTH
+            columns = other._buffer[base + col_start : base + col_end]
+            upper, lower = _shift_tables(rows, top % 8, False)
+            block = top // 8
+            self._merge_block(block, x + col_start, columns.translate(upper), True)
+            self._merge_block(block + 1, x + col_start, columns.translate(lower), True)
 
     def to_bytes(self) -> bytes:
         """
@@ -313,6 +465,18 @@ class Canvas:
         """
         return bytes(self._buffer)
 
+    def buffer_view(self) -> memoryview:
+        """
+        Get a read-only view of the framebuffer without copying it.
+
+        The view follows later drawing, so consumers must use it right away
+        (LCD writes copy it) and take to_bytes() to keep a snapshot.
+
+        Returns:
+            960-byte read-only memoryview
+        """
+        return memoryview(self._buffer).toreadonly()
+
     def from_bytes(self, data: bytes):
         """
         Load framebuffer from bytes.
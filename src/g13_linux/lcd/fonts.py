@@ -4,7 +4,7 @@ LCD Fonts
 Bitmap font definitions for G13 LCD display.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -14,6 +14,10 @@ class Font:
     char_width: int
     char_height: int
     glyphs: dict[int, list[int]]  # ASCII code -> column bytes
+    # (char, shift, rows) -> shifted_cell() result
+    _cells: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # (shift, rows) -> cell_table() result
+    _tables: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def get_glyph(self, char: str) -> list[int] | None:
         """
@@ -31,6 +35,64 @@ class Font:
         # Return '?' for unknown characters
         return self.glyphs.get(63)
 
+    def shifted_cell(self, char: str, shift: int, rows: int) -> tuple[bytes, bytes] | None:
+        """
+        Get a character cell pre-shifted for the LCD's row-block packing.
+
+        The cell is the glyph plus one blank spacing column. Each column is
+        masked to ``rows`` and shifted down by ``shift`` pixels. The result
+        is split into the bytes for the row block the text starts in and the
+        block below it. Results are cached per font.
+
+        Args:
+            char: Character to look up
+            shift: Text y position modulo 8
+            rows: Mask of glyph rows to keep (bit 0 is top row)
+
+        Returns:
+            (upper block bytes, lower block bytes), each char_width + 1 long,
+            or None if the font has no glyph for the character
+        """
+        key = (char, shift, rows)
+        try:
+            return self._cells[key]
+        except KeyError:
+            pass
+
+        glyph = self.get_glyph(char)
+        cell = None
+        if glyph is not None:
+            columns = [(col & rows) << shift for col in glyph]
+            columns += [0] * (self.char_width + 1 - len(columns))
+            cell = (bytes(c & 0xFF for c in columns), bytes(c >> 8 for c in columns))
+        self._cells[key] = cell
+        return cell
+
+    def cell_table(self, shift: int, rows: int) -> tuple[tuple[bytes, bytes] | None, ...]:
+        """
+        Get the shifted cells of every ASCII character, indexed by code.
+
+        Lets a line of ASCII text be rendered by indexing with its encoded
+        bytes rather than one shifted_cell() lookup per character. Tables are
+        cached per font.
+
+        Args:
+            shift: Text y position modulo 8
+            rows: Mask of glyph rows to keep (bit 0 is top row)
+
+        Returns:
+            128 shifted_cell() results, one per ASCII code
+        """
+        key = (shift, rows)
+        try:
+            return self._tables[key]
+        except KeyError:
+            pass
+
+        table = tuple(self.shifted_cell(chr(code), shift, rows) for code in range(128))
+        self._tables[key] = table
+        return table
+
 
 # 5x7 font - standard small font
 # Each character is 5 columns, 7 rows high
@@ -4,8 +4,12 @@ RGB Color Utilities
 Provides RGB dataclass and color manipulation functions.
 """
 
+import re
 from dataclasses import dataclass
 
+# Strict #RRGGBB, as stored in profiles and sent by the web UI
+_HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}")
+
 
 @dataclass
 class RGB:
@@ -99,6 +103,24 @@ NAMED_COLORS: dict[str, RGB] = {
 }
 
 
+def parse_hex_color(color: str) -> tuple[int, int, int] | None:
+    """
+    Parse a #RRGGBB string into an (r, g, b) tuple.
+
+    The six digits are decoded in one bytes.fromhex() call.
+
+    Args:
+        color: Color string
+
+    Returns:
+        (r, g, b) tuple, or None if color is not exactly #RRGGBB
+    """
+    if not _HEX_COLOR_RE.fullmatch(color):
+        return None
+    r, g, b = bytes.fromhex(color[1:])
+    return r, g, b
+
+
 def blend(color1: RGB, color2: RGB, factor: float) -> RGB:
     """
     Blend two colors.
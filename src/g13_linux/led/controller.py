@@ -195,14 +195,23 @@ class LEDController:
             self.start_effect(EffectType.ALERT, color=color, count=count)
 
     def _effect_loop(self):
-        """Background thread for running effects."""
+        """
+        Background thread for running effects.
+
+        Frames are scheduled against a monotonic deadline so the time spent
+        sending a color does not stretch the frame interval. Frames that
+        repeat the previous color (e.g. a solid effect) skip the USB write.
+        """
+        last_color = None
+        deadline = time.monotonic()
         while not self._effect_stop.is_set():
             try:
                 if self._effect_generator:
                     color = next(self._effect_generator)
-                    self._apply_color(color)
+                    if color != last_color:
+                        self._apply_color(color)
+                        last_color = color
                     self._current_color = color
-                time.sleep(self.FRAME_INTERVAL)
             except StopIteration:
                 # Finite effect completed
                 logger.debug("Effect completed")
@@ -212,6 +221,13 @@ class LEDController:
                 logger.error(f"Effect error: {e}")
                 break
 
+            deadline += self.FRAME_INTERVAL
+            now = time.monotonic()
+            if deadline < now:
+                # Fell behind (slow USB write); resync instead of bursting
+                deadline = now
+            self._effect_stop.wait(deadline - now)
+
     def _apply_color(self, color: RGB):
         """Send color to hardware."""
         with self._lock:
@@ -11,6 +11,11 @@ from enum import Enum
 
 from .colors import RGB, blend, dim, hsv_to_rgb
 
+# One sine period, scaled to 0.0-1.0, sampled for pulse() and fade(). A
+# power of two, so elapsed time maps to a step with a bit mask
+_WAVE_STEPS = 1024
+_WAVE = tuple((math.sin(2 * math.pi * i / _WAVE_STEPS) + 1) / 2 for i in range(_WAVE_STEPS))
+
 
 class EffectType(Enum):
     """Available LED effect types."""
@@ -47,13 +52,8 @@ def pulse(color: RGB, speed: float = 1.0) -> Generator[RGB, None, None]:
     Yields:
         RGB colors varying in brightness
     """
-    start_time = time.time()
-    while True:
-        elapsed = time.time() - start_time
-        # Sine wave oscillation between 0.2 and 1.0 brightness
-        phase = (math.sin(elapsed * speed * 2 * math.pi) + 1) / 2
-        brightness = 0.2 + phase * 0.8
-        yield dim(color, 1.0 - brightness)
+    # Sine wave oscillation between 0.2 and 1.0 brightness
+    yield from _cycle(tuple(dim(color, 1.0 - (0.2 + phase * 0.8)) for phase in _WAVE), speed)
 
 
 def rainbow(speed: float = 1.0) -> Generator[RGB, None, None]:
@@ -85,12 +85,25 @@ def fade(color1: RGB, color2: RGB, speed: float = 1.0) -> Generator[RGB, None, N
     Yields:
         RGB colors blending between the two
     """
+    yield from _cycle(tuple(blend(color1, color2, phase) for phase in _WAVE), speed)
+
+
+def _cycle(colors: tuple[RGB, ...], speed: float) -> Generator[RGB, None, None]:
+    """
+    Step through one precomputed wave cycle of colors in real time.
+
+    Args:
+        colors: _WAVE_STEPS colors, one per sample of the wave
+        speed: Cycles per second
+
+    Yields:
+        The color for the current point in the cycle
+    """
+    steps_per_second = speed * _WAVE_STEPS
     start_time = time.time()
     while True:
-        elapsed = time.time() - start_time
-        # Oscillate between 0 and 1
-        phase = (math.sin(elapsed * speed * 2 * math.pi) + 1) / 2
-        yield blend(color1, color2, phase)
+        step = int((time.time() - start_time) * steps_per_second)
+        yield colors[step & (_WAVE_STEPS - 1)]
 
 
 def alert(color: RGB = None, count: int = 3) -> Generator[RGB, None, None]:
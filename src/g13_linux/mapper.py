@@ -37,6 +37,20 @@ class G13Mapper:
             if keycodes:
                 self.button_map[button_id] = keycodes
 
+    def update_mapping(self, button_id: str, mapping: str | dict):
+        """
+        Replace a single button's mapping without reloading the whole profile.
+
+        Args:
+            button_id: Button ID (e.g., "G1")
+            mapping: Simple key name or combo dict, as in load_profile
+        """
+        keycodes = self._parse_mapping(mapping)
+        if keycodes:
+            self.button_map[button_id] = keycodes
+        else:
+            self.button_map.pop(button_id, None)
+
     def _parse_mapping(self, mapping: str | dict) -> list[int]:
         """Parse a mapping entry into a list of keycodes."""
         if isinstance(mapping, str):
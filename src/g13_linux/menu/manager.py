@@ -38,6 +38,10 @@ class ScreenManager:
         self._overlay_timer: threading.Timer | None = None
         self._lock = threading.Lock()
 
+        # Set whenever a screen is marked dirty; the daemon's render loop
+        # waits on it (replaced by the daemon's own event when injected)
+        self.render_event = threading.Event()
+
         # Injected dependencies (set by daemon)
         self.led_controller = None
         self.profile_manager = None
@@ -164,6 +168,26 @@ class ScreenManager:
         if self.current:
             self.current.on_input(event)
 
+    def request_render(self):
+        """Wake the render loop; called when a screen is marked dirty."""
+        self.render_event.set()
+
+    def next_update_delay(self) -> float | None:
+        """
+        Seconds until an active screen next needs update(), for the render loop's idle wait.
+
+        Returns:
+            Shortest delay requested by the current screen or overlay, or
+            None to wait until something is marked dirty
+        """
+        delays = []
+        for screen in (self.current, self._overlay):
+            if screen is not None:
+                delay = screen.next_update_in()
+                if delay is not None:
+                    delays.append(delay)
+        return min(delays) if delays else None
+
     def update(self, dt: float):
         """
         Update all active screens.
@@ -207,7 +231,7 @@ class ScreenManager:
 
         # Send to LCD
         if self.lcd:
-            self.lcd.write_bitmap(self._canvas.to_bytes())
+            self.lcd.write_bitmap(self._canvas.buffer_view())
 
         return True
 
@@ -47,8 +47,10 @@ class Screen(ABC):
         self._dirty = True
 
     def mark_dirty(self):
-        """Mark screen as needing re-render."""
+        """Mark screen as needing re-render and wake the render loop."""
         self._dirty = True
+        if self.manager is not None:
+            self.manager.request_render()
 
     @property
     def is_dirty(self) -> bool:
@@ -96,7 +98,7 @@ class Screen(ABC):
 
     def update(self, dt: float):
         """
-        Update screen state (called periodically).
+        Update screen state (called on each render loop wake-up).
 
         Args:
             dt: Time delta since last update in seconds
@@ -104,3 +106,14 @@ class Screen(ABC):
         Override for time-based updates (animations, clock, etc.)
         """
         pass
+
+    def next_update_in(self) -> float | None:
+        """
+        Seconds until update() must run again even if nothing marks the screen dirty.
+
+        Returns:
+            Delay in seconds, or None if the screen only changes on input
+
+        Override together with update() for time-based screens (clocks).
+        """
+        return None
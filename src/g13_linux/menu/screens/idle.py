@@ -4,6 +4,7 @@ Idle Screen
 Default status screen showing profile and quick info.
 """
 
+import time
 from datetime import datetime
 
 from ...lcd.canvas import Canvas
@@ -11,6 +12,13 @@ from ...lcd.fonts import FONT_4X6, FONT_5X7, FONT_8X8
 from ..screen import InputEvent, Screen
 
 
+def _until_clock_change(show_seconds: bool) -> float:
+    """Seconds until the displayed second (or minute) rolls over."""
+    period = 1.0 if show_seconds else 60.0
+    # Small margin so update() runs just after the boundary, not just before
+    return period - (time.time() % period) + 0.005
+
+
 class IdleScreen(Screen):
     """
     Default idle screen showing current profile and status.
@@ -67,6 +75,13 @@ class IdleScreen(Screen):
                 self._last_second = now.minute
                 self.mark_dirty()
 
+    def next_update_in(self) -> float:
+        """Wake for the next clock change."""
+        show_seconds = True
+        if self.settings_manager:
+            show_seconds = self.settings_manager.clock_show_seconds
+        return _until_clock_change(show_seconds)
+
     def render(self, canvas: Canvas):
         """Render idle screen."""
         # Get current profile name
@@ -176,6 +191,10 @@ class ClockScreen(Screen):
                 self._last_second = now.minute
                 self.mark_dirty()
 
+    def next_update_in(self) -> float:
+        """Wake for the next clock change."""
+        return _until_clock_change(self.show_seconds)
+
     def render(self, canvas: Canvas):
         """Render large clock."""
         now = datetime.now()
@@ -4,6 +4,7 @@ Profiles Screen
 Profile selection and management.
 """
 
+from ...led.colors import parse_hex_color
 from ..items import MenuItem
 from .base_menu import MenuScreen
 from .toast import ToastScreen
@@ -116,12 +117,9 @@ class ProfilesScreen(MenuScreen):
         # Apply backlight color
         led = getattr(self.manager, "led_controller", None)
         if led and hasattr(profile, "backlight"):
-            color = profile.backlight.get("color", "#FFFFFF")
-            if color.startswith("#") and len(color) == 7:
-                r = int(color[1:3], 16)
-                g = int(color[3:5], 16)
-                b = int(color[5:7], 16)
-                led.set_color(r, g, b)
+            rgb = parse_hex_color(profile.backlight.get("color", "#FFFFFF"))
+            if rgb:
+                led.set_color(*rgb)
 
     def _create_profile(self):
         """Create new profile (placeholder)."""
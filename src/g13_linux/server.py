@@ -5,8 +5,10 @@ Provides remote control API for the G13 daemon.
 Supports WebSocket for real-time updates and REST API for CRUD operations.
 """
 
+import asyncio
 import json
 import logging
+import queue
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,6 +16,8 @@ from typing import TYPE_CHECKING
 from aiohttp import web
 
 from ._paths import get_static_dir
+from .gui.models.macro_types import MacroStep, PlaybackMode
+from .led.colors import parse_hex_color
 
 if TYPE_CHECKING:
     from .daemon import G13Daemon
@@ -56,6 +60,13 @@ class G13Server:
         self._site: web.TCPSite | None = None
         self._clients: set[web.WebSocketResponse] = set()
 
+        # Cross-thread broadcasts: producers enqueue, _broadcast_pump drains
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._broadcast_queue: queue.SimpleQueue[dict] = queue.SimpleQueue()
+        self._broadcast_wake: asyncio.Event | None = None
+        self._wake_pending = False
+        self._pump_task: asyncio.Task | None = None
+
         # Static file serving
         if static_dir is None:
             self._static_dir = DEFAULT_STATIC_DIR
@@ -73,12 +84,21 @@ class G13Server:
         self._site = web.TCPSite(self._runner, self.host, self.port)
         await self._site.start()
 
+        self._loop = asyncio.get_running_loop()
+        self._broadcast_wake = asyncio.Event()
+        self._pump_task = asyncio.create_task(self._broadcast_pump())
+
         logger.info(f"G13 server started at http://{self.host}:{self.port}")
         if self._serve_static:
             logger.info(f"Serving web GUI from {self._static_dir}")
 
     async def stop(self):
         """Stop the server."""
+        if self._pump_task:
+            self._pump_task.cancel()
+            self._pump_task = None
+        self._loop = None
+
         # Close all WebSocket connections
         for ws in list(self._clients):
             await ws.close()
@@ -358,6 +378,51 @@ class G13Server:
             except Exception:
                 self._clients.discard(ws)
 
+    def queue_broadcast(self, message: dict):
+        """
+        Queue a message for broadcast from any thread.
+
+        Only the first message queued while the pump is idle wakes the event
+        loop; later ones ride along in the same drain.
+
+        Args:
+            message: JSON-serializable message dict
+        """
+        loop = self._loop
+        if loop is None:
+            return
+
+        self._broadcast_queue.put_nowait(message)
+        if not self._wake_pending:
+            self._wake_pending = True
+            try:
+                loop.call_soon_threadsafe(self._broadcast_wake.set)
+            except RuntimeError:
+                # Loop closed during shutdown
+                pass
+
+    async def _broadcast_pump(self):
+        """Drain queued messages into _broadcast whenever queue_broadcast wakes us."""
+        while True:
+            await self._broadcast_wake.wait()
+            self._broadcast_wake.clear()
+            try:
+                # Reset before draining so a message queued mid-drain re-wakes us
+                self._wake_pending = False
+                while True:
+                    try:
+                        message = self._broadcast_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    await self._broadcast(message)
+            except Exception:
+                logger.exception("Broadcast pump error")
+                if not self._broadcast_queue.empty():
+                    # Drain the rest on the next pass instead of stranding it
+                    self._broadcast_wake.set()
+            finally:
+                self._wake_pending = False
+
     def _get_state(self) -> dict:
         """Get current G13 state."""
         profile_name = None
@@ -377,7 +442,7 @@ class G13Server:
             pressed_keys = self.daemon._event_decoder.get_pressed_buttons()
 
         # Get joystick position
-        joystick_x, joystick_y = self.daemon._last_joystick
+        joystick_x, joystick_y = self.daemon.last_joystick
 
         return {
             "connected": self.daemon._device is not None,
@@ -397,11 +462,9 @@ class G13Server:
             return
 
         # Parse hex color
-        if color.startswith("#") and len(color) == 7:
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            self.daemon._led_controller.set_color(r, g, b)
+        rgb = parse_hex_color(color)
+        if rgb:
+            self.daemon._led_controller.set_color(*rgb)
 
         if brightness is not None:
             self.daemon._led_controller.set_brightness(brightness)
@@ -416,6 +479,30 @@ class G13Server:
         """Broadcast button release event."""
         await self._broadcast({"type": "button_released", "button": button})
 
+    @staticmethod
+    def input_batch_message(
+        pressed: list[str],
+        released: list[str],
+        joystick: tuple[int, int] | None = None,
+    ) -> dict:
+        """
+        Build one ``input_batch`` message for all input changes of a HID drain cycle.
+
+        Clients apply ``pressed`` before ``released``.
+
+        Args:
+            pressed: Buttons pressed during the cycle
+            released: Buttons released during the cycle
+            joystick: Final joystick position if it moved, else None
+
+        Returns:
+            Message dict for queue_broadcast()
+        """
+        message = {"type": "input_batch", "pressed": pressed, "released": released}
+        if joystick is not None:
+            message["joystick"] = {"x": joystick[0], "y": joystick[1]}
+        return message
+
     async def broadcast_profile_activated(self, name: str):
         """Broadcast profile activation event."""
         await self._broadcast({"type": "profile_activated", "name": name})
@@ -445,26 +532,19 @@ class G13Server:
     async def _api_list_profiles(self, request: web.Request) -> web.Response:
         """GET /api/profiles - List available profiles."""
         pm = self.daemon.profile_manager
+        loaded = pm.load_all()
         profiles = []
 
+        # Profiles that failed to load still appear, with an empty description
         for name in pm.list_profiles():
-            try:
-                profile = pm.load_profile(name)
-                profiles.append(
-                    {
-                        "name": name,
-                        "filename": f"{name}.json",
-                        "description": profile.description or "",
-                    }
-                )
-            except Exception:
-                profiles.append(
-                    {
-                        "name": name,
-                        "filename": f"{name}.json",
-                        "description": "",
-                    }
-                )
+            profile = loaded.get(name)
+            profiles.append(
+                {
+                    "name": name,
+                    "filename": f"{name}.json",
+                    "description": (profile.description if profile else "") or "",
+                }
+            )
 
         response = web.json_response({"profiles": profiles})
         return self._add_cors_headers(response)
@@ -564,8 +644,6 @@ class G13Server:
 
     def _update_macro_fields(self, macro, data: dict):
         """Update macro fields from request data."""
-        from .gui.models.macro_types import MacroStep, PlaybackMode
-
         simple_fields = [
             "name",
             "description",
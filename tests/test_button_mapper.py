@@ -412,3 +412,20 @@ class TestButtonMapperBackgroundImage:
                     # Should have None since image is invalid
         finally:
             os.unlink(temp_path)
+
+    def test_resize_rescales_without_reloading(self, qapp):
+        """Resizing rescales the loaded image instead of reading it again."""
+        from PyQt6.QtGui import QPixmap
+
+        from g13_linux.gui.views.button_mapper import ButtonMapperWidget
+
+        source = QPixmap(1024, 1024)
+        source.fill(Qt.GlobalColor.red)
+        with patch.object(ButtonMapperWidget, "_load_background_image", return_value=source):
+            widget = ButtonMapperWidget()
+            widget.resize(1200, 1100)
+            widget.resizeEvent(None)
+
+            assert ButtonMapperWidget._load_background_image.call_count == 1
+        assert widget.background_image.width() == widget.width()
+        assert widget.background_image.height() == widget.height()
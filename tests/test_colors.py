@@ -8,7 +8,15 @@ import pytest
 # Add src to path without importing through __init__.py
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from g13_linux.led.colors import NAMED_COLORS, RGB, blend, brighten, dim, hsv_to_rgb
+from g13_linux.led.colors import (
+    NAMED_COLORS,
+    RGB,
+    blend,
+    brighten,
+    dim,
+    hsv_to_rgb,
+    parse_hex_color,
+)
 
 
 class TestRGBCreation:
@@ -88,6 +96,20 @@ class TestRGBFromHex:
             RGB.from_hex("#GGGGGG")
 
 
+class TestParseHexColor:
+    """Tests for parse_hex_color."""
+
+    def test_parses_rrggbb(self):
+        """parse_hex_color splits #RRGGBB into components."""
+        assert parse_hex_color("#FF8000") == (255, 128, 0)
+        assert parse_hex_color("#abcdef") == (171, 205, 239)
+
+    @pytest.mark.parametrize("color", ["#FFF", "FF8000", "#GGGGGG", "#FF8000\n", "#+F8000", ""])
+    def test_rejects_malformed(self, color):
+        """parse_hex_color returns None for anything but exactly #RRGGBB."""
+        assert parse_hex_color(color) is None
+
+
 class TestRGBFromName:
     """Tests for RGB.from_name class method."""
 
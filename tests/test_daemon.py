@@ -0,0 +1,713 @@
+"""Tests for G13Daemon HID read loop and helpers."""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from g13_linux.daemon import G13Daemon, _discard_broadcast
+from g13_linux.gui.models.profile_manager import ProfileData
+from g13_linux.menu.screen import InputEvent
+
+
+@pytest.fixture
+def daemon():
+    """G13Daemon with managers mocked out (no disk access)."""
+    with (
+        patch("g13_linux.daemon.ProfileManager"),
+        patch("g13_linux.daemon.MacroManager"),
+        patch("g13_linux.daemon.SettingsManager"),
+    ):
+        d = G13Daemon(enable_server=False)
+        yield d
+    d._close_wake_pipe()
+
+
+@pytest.fixture
+def pipe_device():
+    """Device backed by a real pipe so select() works on its fd."""
+    r, w = os.pipe()
+    device = MagicMock()
+    device.fileno.return_value = r
+    yield device, w
+    os.close(r)
+    os.close(w)
+
+
+class TestLazyManagers:
+    """Managers are created on first access, not in __init__."""
+
+    def test_managers_not_created_by_init(self):
+        with (
+            patch("g13_linux.daemon.ProfileManager") as profile_cls,
+            patch("g13_linux.daemon.MacroManager") as macro_cls,
+            patch("g13_linux.daemon.SettingsManager") as settings_cls,
+        ):
+            G13Daemon(enable_server=False)
+
+        profile_cls.assert_not_called()
+        macro_cls.assert_not_called()
+        settings_cls.assert_not_called()
+
+    def test_manager_created_once_on_access(self):
+        with patch("g13_linux.daemon.ProfileManager") as profile_cls:
+            d = G13Daemon(enable_server=False)
+            first = d.profile_manager
+            assert d.profile_manager is first
+
+        profile_cls.assert_called_once_with()
+
+
+def test_server_imported_on_demand():
+    """Importing the daemon does not pull in the server (and aiohttp)."""
+    code = "import sys, g13_linux.daemon; print('g13_linux.server' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "False"
+
+
+class TestDeviceFd:
+    """_device_fd detection."""
+
+    def test_device_without_fileno(self, daemon):
+        daemon._device = MagicMock(spec=["read"])
+        assert daemon._device_fd() is None
+
+    def test_device_with_non_int_fileno(self, daemon):
+        daemon._device = MagicMock()
+        assert daemon._device_fd() is None
+
+    def test_device_with_fd(self, daemon):
+        daemon._device = MagicMock()
+        daemon._device.fileno.return_value = 7
+        assert daemon._device_fd() == 7
+
+
+class TestReadLoop:
+    """_read_loop select-and-drain behavior."""
+
+    def test_drains_all_pending_reports(self, daemon, pipe_device):
+        device, w = pipe_device
+        reports = [bytes([1] * 8), bytes([2] * 8), None]
+        device.read.side_effect = reports
+        daemon._device = device
+        daemon._running = True
+        handled = []
+
+        def handle(data):
+            handled.append(data)
+            if len(handled) == 2:
+                daemon._running = False
+
+        daemon._handle_raw_report = handle
+        os.write(w, b"x")
+        daemon._read_loop()
+
+        assert handled == reports[:2]
+        device.read.assert_called_with(timeout_ms=0)
+
+    def test_wake_pipe_interrupts_select(self, daemon, pipe_device):
+        device, _ = pipe_device
+        daemon._device = device
+        daemon._wake_r, daemon._wake_w = os.pipe()
+        daemon._wake()
+
+        def stop():
+            daemon._running = False
+
+        daemon._running = True
+        with patch.object(daemon, "_drain_wake_pipe", side_effect=stop):
+            daemon._read_loop()
+
+        device.read.assert_not_called()
+
+    def test_signal_wakeup_fd_interrupts_select(self, daemon, pipe_device):
+        device, _ = pipe_device
+        daemon._device = device
+        daemon._wake_r, daemon._wake_w = os.pipe()
+        os.set_blocking(daemon._wake_r, False)
+        os.set_blocking(daemon._wake_w, False)
+        prev = signal.set_wakeup_fd(daemon._wake_w, warn_on_full_buffer=False)
+        daemon._prev_wakeup_fd = prev
+        old_handler = signal.signal(signal.SIGUSR1, daemon._handle_signal)
+        try:
+            daemon._running = True
+            threading.Timer(0.05, os.kill, (os.getpid(), signal.SIGUSR1)).start()
+            start = time.monotonic()
+            daemon._read_loop()
+            elapsed = time.monotonic() - start
+        finally:
+            signal.signal(signal.SIGUSR1, old_handler)
+            daemon._restore_wakeup_fd()
+
+        assert not daemon._running
+        assert elapsed < daemon.IDLE_TIMEOUT
+        assert signal.set_wakeup_fd(-1) == prev
+        signal.set_wakeup_fd(prev)
+
+    def test_fallback_timed_reads_without_fd(self, daemon):
+        device = MagicMock(spec=["read"])
+        daemon._device = device
+        daemon._running = True
+        timeouts = []
+
+        def read(timeout_ms):
+            timeouts.append(timeout_ms)
+            if len(timeouts) == 3:
+                daemon._running = False
+                return None
+            return bytes([0] * 8)
+
+        device.read.side_effect = read
+        daemon._handle_raw_report = MagicMock()
+        daemon._read_loop()
+
+        # Only the first read of a drain cycle waits; pyusb reads 0 as
+        # "no timeout", so the drain reads poll with a 1 ms timeout instead
+        assert timeouts == [100, 1, 1]
+        assert daemon._handle_raw_report.call_count == 2
+
+
+class TestDrainReports:
+    """_drain_reports non-blocking drain."""
+
+    def test_returns_count_and_stops_on_empty(self, daemon):
+        daemon._device = MagicMock()
+        daemon._device.read.side_effect = [bytes([1] * 8), bytes([2] * 8), None]
+        daemon._handle_raw_report = MagicMock()
+        daemon._running = True
+
+        assert daemon._drain_reports() == 2
+        assert daemon._device.read.call_count == 3
+
+    def test_readinto_device_reuses_buffer(self, daemon):
+        class ReadintoDevice:
+            def __init__(self, reports):
+                self.reports = list(reports)
+
+            def readinto(self, buf, timeout_ms=0):
+                if not self.reports:
+                    return 0
+                report = self.reports.pop(0)
+                buf[: len(report)] = report
+                return len(report)
+
+        daemon._device = ReadintoDevice([bytes([1] * 8), bytes([2] * 8)])
+        seen = []
+        daemon._handle_raw_report = lambda data: seen.append((type(data), bytes(data)))
+        daemon._running = True
+
+        assert daemon._drain_reports() == 2
+        assert seen == [(memoryview, bytes([1] * 8)), (memoryview, bytes([2] * 8))]
+
+    def test_stops_when_not_running(self, daemon):
+        daemon._device = MagicMock()
+        daemon._running = False
+
+        assert daemon._drain_reports() == 0
+        daemon._device.read.assert_not_called()
+
+    def test_wait_without_selector_is_immediate(self, daemon):
+        assert daemon._wait_for_data(None) is True
+
+    def test_input_tick_without_handler_uses_idle_timeout(self, daemon):
+        assert daemon._input_tick() == daemon.IDLE_TIMEOUT
+
+    def test_input_tick_shortened_by_pending_repeat(self, daemon):
+        daemon._input_handler = MagicMock()
+        daemon._input_handler.tick.return_value = 0.15
+        assert daemon._input_tick() == 0.15
+
+        daemon._input_handler.tick.return_value = None
+        assert daemon._input_tick() == daemon.IDLE_TIMEOUT
+
+    def test_reports_fed_to_input_handler(self, daemon):
+        daemon._input_handler = MagicMock()
+        report = bytes([1, 128, 128, 0, 0, 0, 0, 0x08])
+        daemon._handle_raw_report(report)
+        daemon._handle_raw_report(report)
+
+        daemon._input_handler.process_report.assert_called_once_with(report)
+
+
+class TestInputBatch:
+    """Per-drain-cycle batching of WebSocket input broadcasts."""
+
+    @pytest.fixture
+    def server_daemon(self, daemon):
+        daemon._enable_server = True
+        daemon._server = MagicMock()
+        daemon._event_decoder = MagicMock()
+        daemon._event_decoder.decode_report.return_value = MagicMock(joystick_x=128, joystick_y=128)
+        return daemon
+
+    def test_changes_accumulate_until_flush(self, server_daemon):
+        decoder = server_daemon._event_decoder
+        decoder.get_button_changes.side_effect = [(["G1"], []), (["G2"], ["G1"])]
+
+        server_daemon._handle_raw_report(bytes([1, 0, 0, 1, 0, 0, 0, 0]))
+        server_daemon._handle_raw_report(bytes([1, 0, 0, 2, 0, 0, 0, 0]))
+        server_daemon._server.queue_broadcast.assert_not_called()
+
+        server_daemon._flush_input_batch()
+        server_daemon._server.input_batch_message.assert_called_once_with(
+            ["G1", "G2"], ["G1"], None
+        )
+        server_daemon._server.queue_broadcast.assert_called_once_with(
+            server_daemon._server.input_batch_message.return_value
+        )
+
+    def test_repress_cancels_release(self, server_daemon):
+        decoder = server_daemon._event_decoder
+        decoder.get_button_changes.side_effect = [([], ["G1"]), (["G1"], [])]
+
+        server_daemon._handle_raw_report(bytes([1, 0, 0, 1, 0, 0, 0, 0]))
+        server_daemon._handle_raw_report(bytes([1, 0, 0, 2, 0, 0, 0, 0]))
+        server_daemon._flush_input_batch()
+
+        server_daemon._server.input_batch_message.assert_called_once_with(["G1"], [], None)
+
+    def test_joystick_included_when_moved(self, server_daemon):
+        server_daemon._event_decoder.get_button_changes.return_value = ([], [])
+        server_daemon._event_decoder.decode_report.return_value = MagicMock(
+            joystick_x=200, joystick_y=128
+        )
+
+        server_daemon._handle_raw_report(bytes(8))
+        server_daemon._flush_input_batch()
+
+        server_daemon._server.input_batch_message.assert_called_once_with([], [], (200, 128))
+
+    def test_joystick_only_batches_are_rate_limited(self, server_daemon):
+        server_daemon._event_decoder.get_button_changes.return_value = ([], [])
+        decoder = server_daemon._event_decoder
+        server = server_daemon._server
+
+        with patch("g13_linux.daemon.time.monotonic", return_value=10.0):
+            decoder.decode_report.return_value = MagicMock(joystick_x=200, joystick_y=128)
+            server_daemon._handle_raw_report(bytes([1, 200, 128, 0, 0, 0, 0, 0]))
+            server_daemon._flush_input_batch()
+            # Moves within the interval are held, the latest overwriting earlier ones
+            decoder.decode_report.return_value = MagicMock(joystick_x=100, joystick_y=128)
+            server_daemon._handle_raw_report(bytes([1, 100, 128, 0, 0, 0, 0, 0]))
+            decoder.decode_report.return_value = MagicMock(joystick_x=30, joystick_y=128)
+            server_daemon._handle_raw_report(bytes([1, 30, 128, 0, 0, 0, 0, 0]))
+            server_daemon._flush_input_batch()
+            held_delay = server_daemon._joystick_flush_delay()
+        assert server.input_batch_message.call_count == 1
+        assert held_delay == pytest.approx(server_daemon.JOYSTICK_BROADCAST_INTERVAL)
+
+        due = 10.0 + server_daemon.JOYSTICK_BROADCAST_INTERVAL
+        with patch("g13_linux.daemon.time.monotonic", return_value=due):
+            server_daemon._flush_input_batch()
+        server.input_batch_message.assert_called_with([], [], (30, 128))
+        assert server.input_batch_message.call_count == 2
+
+    def test_button_change_sends_held_joystick(self, server_daemon):
+        decoder = server_daemon._event_decoder
+        decoder.get_button_changes.side_effect = [([], []), (["G1"], [])]
+        server_daemon._joystick_sent_at = time.monotonic()  # Just broadcast one
+        decoder.decode_report.return_value = MagicMock(joystick_x=200, joystick_y=128)
+        server_daemon._handle_raw_report(bytes([1, 200, 128, 0, 0, 0, 0, 0]))
+        server_daemon._flush_input_batch()
+        server_daemon._server.input_batch_message.assert_not_called()
+
+        server_daemon._handle_raw_report(bytes([1, 200, 128, 1, 0, 0, 0, 0]))
+        server_daemon._flush_input_batch()
+        server_daemon._server.input_batch_message.assert_called_once_with(["G1"], [], (200, 128))
+
+    def test_unchanged_report_skipped(self, server_daemon):
+        server_daemon._event_decoder.get_button_changes.return_value = ([], [])
+        server_daemon._mapper = MagicMock()
+        report = [1, 128, 128, 1, 0, 0x80, 0, 0]
+
+        server_daemon._handle_raw_report(report)
+        server_daemon._handle_raw_report(list(report))
+        server_daemon._handle_raw_report(bytes(report))
+
+        server_daemon._event_decoder.decode_report.assert_called_once()
+        assert server_daemon.key_count == 1
+
+    def test_mapper_and_batch_share_one_decode(self, server_daemon):
+        server_daemon._mapper = MagicMock()
+        server_daemon._event_decoder.get_button_changes.return_value = (["G2"], ["G1"])
+
+        server_daemon._handle_raw_report(bytes([1, 128, 128, 2, 0, 0, 0, 0]))
+
+        server_daemon._event_decoder.decode_report.assert_called_once()
+        server_daemon._mapper.handle_raw_report.assert_not_called()
+        assert server_daemon._mapper.handle_button_event.call_args_list == [
+            call("G2", is_pressed=True),
+            call("G1", is_pressed=False),
+        ]
+        assert server_daemon._batch_pressed == ["G2"]
+        assert server_daemon._batch_released == ["G1"]
+
+    def test_mapper_without_server_gets_button_events(self, daemon):
+        daemon._mapper = MagicMock()
+        daemon._handle_raw_report(bytes([1, 128, 128, 1, 0, 0, 0, 0]))
+        daemon._handle_raw_report(bytes([1, 128, 128, 0, 0, 0, 0, 0]))
+
+        assert daemon._mapper.handle_button_event.call_args_list == [
+            call("G1", is_pressed=True),
+            call("G1", is_pressed=False),
+        ]
+        assert daemon._batch_pressed == []
+
+    def test_key_count_counts_presses_only(self, daemon):
+        # G1 down (byte 5 status flag also set), G2 joins, all up, G1 again
+        for buttons in ([1, 0, 0x80], [3, 0, 0x80], [0, 0, 0x80], [1, 0, 0x80]):
+            daemon._handle_raw_report(bytes([1, 128, 128, *buttons, 0, 0]))
+
+        assert daemon.key_count == 3
+
+    def test_joystick_threshold(self, server_daemon):
+        assert not server_daemon._joystick_changed(133, 123)
+        assert server_daemon._joystick_changed(134, 128)
+        assert server_daemon._joystick_changed(128, 122)
+
+    def test_last_joystick_tracks_broadcast_position(self, server_daemon):
+        server_daemon._event_decoder.get_button_changes.return_value = ([], [])
+        server_daemon._event_decoder.decode_report.return_value = MagicMock(
+            joystick_x=40, joystick_y=250
+        )
+        server_daemon._handle_raw_report(bytes(8))
+        assert server_daemon.last_joystick == (40, 250)
+
+    def test_empty_batch_not_broadcast(self, server_daemon):
+        server_daemon._flush_input_batch()
+        server_daemon._server.queue_broadcast.assert_not_called()
+
+
+class TestUptime:
+    """uptime property formatting and caching."""
+
+    def test_not_started(self, daemon):
+        assert daemon.uptime == "0:00"
+
+    def test_minutes_seconds(self, daemon):
+        daemon._start_monotonic = 1000.0
+        with patch("g13_linux.daemon.time.monotonic", return_value=1065.5):
+            assert daemon.uptime == "1:05"
+
+    def test_hours(self, daemon):
+        daemon._start_monotonic = 0.0
+        with patch("g13_linux.daemon.time.monotonic", return_value=3723.0):
+            assert daemon.uptime == "1:02:03"
+
+    def test_cached_within_same_second(self, daemon):
+        daemon._start_monotonic = 0.0
+        with patch("g13_linux.daemon.time.monotonic", side_effect=[5.1, 5.9, 6.0]):
+            first = daemon.uptime
+            assert daemon.uptime is first
+            assert daemon.uptime == "0:06"
+
+
+class TestRenderLoop:
+    """_render_loop / _pacing_loop frame scheduling."""
+
+    def _start(self, daemon, target):
+        daemon._running = True
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def _stop(self, daemon, *threads):
+        daemon._running = False
+        daemon._wake_render_threads()
+        for thread in threads:
+            thread.join(timeout=2.0)
+            assert not thread.is_alive()
+
+    def test_renders_only_when_woken(self, daemon):
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+        thread = self._start(daemon, daemon._render_loop)
+        time.sleep(0.05)
+        before = daemon._screen_manager.render.call_count
+        daemon._render_event.set()
+        time.sleep(0.05)
+        after = daemon._screen_manager.render.call_count
+        self._stop(daemon, thread)
+
+        assert before == 0
+        assert after == 1
+
+    def test_render_clears_tick(self, daemon):
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+        thread = self._start(daemon, daemon._render_loop)
+        daemon._render_tick.set()
+        daemon._render_event.set()
+        time.sleep(0.05)
+        tick_pending = daemon._render_tick.is_set()
+        self._stop(daemon, thread)
+
+        assert not tick_pending
+
+    def test_update_receives_frame_delta(self, daemon):
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+        with patch("g13_linux.daemon.time.perf_counter", side_effect=[10.0, 10.25]):
+            thread = self._start(daemon, daemon._render_loop)
+            daemon._render_event.set()
+            time.sleep(0.05)
+            self._stop(daemon, thread)
+
+        daemon._screen_manager.update.assert_called_once_with(0.25)
+
+    def test_dirty_mark_during_frame_is_rendered(self, daemon):
+        daemon.RENDER_INTERVAL = 0.01
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+        # Another thread marks a screen dirty while the first frame renders
+        daemon._screen_manager.render.side_effect = lambda: (
+            daemon._render_event.set() if daemon._screen_manager.render.call_count == 1 else None
+        )
+        render = self._start(daemon, daemon._render_loop)
+        pacing = self._start(daemon, daemon._pacing_loop)
+        daemon._render_event.set()
+        time.sleep(0.1)
+        paced_after_clean_frame = daemon._pacing_active.is_set()
+        self._stop(daemon, render, pacing)
+
+        assert daemon._screen_manager.render.call_count == 2
+        assert not paced_after_clean_frame
+
+    def test_idle_wait_honours_screen_update_deadline(self, daemon):
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = 0.01
+        thread = self._start(daemon, daemon._render_loop)
+        time.sleep(0.1)
+        self._stop(daemon, thread)
+
+        assert daemon._screen_manager.update.call_count >= 2
+
+    def test_input_event_is_queued_not_handled_inline(self, daemon):
+        daemon._nav_controller = MagicMock()
+        daemon._on_input_event(InputEvent.STICK_PRESS)
+
+        daemon._nav_controller.on_input.assert_not_called()
+        assert daemon._render_event.is_set()
+
+    def test_render_thread_dispatches_input_before_rendering(self, daemon):
+        calls = []
+        daemon._nav_controller = MagicMock()
+        daemon._nav_controller.on_input.side_effect = lambda e: calls.append(("input", e))
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+        daemon._screen_manager.render.side_effect = lambda: calls.append(("render", None))
+        daemon._on_input_event(InputEvent.STICK_PRESS)
+        daemon._on_input_event(InputEvent.STICK_DOWN)
+        thread = self._start(daemon, daemon._render_loop)
+        time.sleep(0.05)
+        self._stop(daemon, thread)
+
+        assert calls == [
+            ("input", InputEvent.STICK_PRESS),
+            ("input", InputEvent.STICK_DOWN),
+            ("render", None),
+        ]
+
+    def test_pacing_idle_until_activated(self, daemon):
+        daemon.RENDER_INTERVAL = 0.01
+        thread = self._start(daemon, daemon._pacing_loop)
+        time.sleep(0.05)
+        ticked = daemon._render_tick.is_set()
+        self._stop(daemon, thread)
+
+        assert not ticked
+        assert daemon._skipped_frames == 0
+
+    def test_pacing_ticks_and_counts_skipped_frames(self, daemon):
+        daemon.RENDER_INTERVAL = 0.01
+        daemon._pacing_active.set()
+        thread = self._start(daemon, daemon._pacing_loop)
+        time.sleep(0.1)
+        self._stop(daemon, thread)
+
+        # Nothing consumed the ticks, so all but the first were skipped
+        assert daemon._render_tick.is_set()
+        assert daemon._skipped_frames >= 1
+
+    def test_pacing_counts_ticks_missed_while_asleep(self, daemon):
+        daemon.RENDER_INTERVAL = 0.01
+        daemon._pacing_active.set()
+        # Start at 0.0, wake 0.045 late for the first tick, then stop
+        clock = iter([0.0, 0.01, 0.055])
+
+        def monotonic():
+            value = next(clock, None)
+            if value is None:
+                daemon._running = False
+                return 1.0
+            return value
+
+        with (
+            patch("g13_linux.daemon.time.monotonic", side_effect=monotonic),
+            patch("g13_linux.daemon.time.sleep"),
+        ):
+            daemon._running = True
+            daemon._pacing_loop()
+
+        assert daemon._skipped_frames == 4
+        assert daemon._render_tick.is_set()
+
+    def test_slow_animated_render_keeps_tick(self, daemon):
+        daemon.RENDER_INTERVAL = 0.02
+        daemon._screen_manager = MagicMock()
+        daemon._screen_manager.next_update_delay.return_value = None
+
+        def slow_animated_render():
+            time.sleep(0.03)  # Longer than a frame interval
+            daemon._render_event.set()  # Animation marks the screen dirty again
+
+        daemon._screen_manager.render.side_effect = slow_animated_render
+        render = self._start(daemon, daemon._render_loop)
+        pacing = self._start(daemon, daemon._pacing_loop)
+        daemon._render_event.set()
+        time.sleep(0.3)
+        self._stop(daemon, render, pacing)
+
+        # Ticks landing mid-render start the next frame immediately, so the
+        # frame rate is bounded by render time (~10 frames), not halved by it
+        assert daemon._screen_manager.render.call_count >= 7
+
+
+class TestProfileMappings:
+    """load_profile / set_button_mapping mapper updates."""
+
+    def test_set_button_mapping_patches_mapper(self, daemon):
+        daemon._mapper = MagicMock()
+        profile = MagicMock(mappings={})
+        daemon.profile_manager.current_profile = profile
+
+        assert daemon.set_button_mapping("G1", "KEY_A") is True
+
+        assert profile.mappings["G1"] == "KEY_A"
+        daemon._mapper.update_mapping.assert_called_once_with("G1", "KEY_A")
+        daemon._mapper.load_profile.assert_not_called()
+
+    def test_set_button_mapping_without_profile(self, daemon):
+        daemon.profile_manager.current_profile = None
+        assert daemon.set_button_mapping("G1", "KEY_A") is False
+
+    @pytest.mark.parametrize(
+        "profiles, expected",
+        [
+            (["zeta", "example", "default"], "default"),
+            (["zeta", "example"], "example"),
+            (["zeta", "alpha"], "zeta"),
+        ],
+    )
+    def test_default_profile_preference(self, daemon, profiles, expected):
+        daemon.profile_manager.list_profiles.return_value = profiles
+        with patch.object(daemon, "load_profile") as load:
+            daemon._load_default_profile()
+        load.assert_called_once_with(expected)
+
+    def test_load_profile_reloads_mapper(self, daemon):
+        daemon._mapper = MagicMock()
+        profile = ProfileData(name="default", mappings={"G1": "KEY_A"})
+        daemon.profile_manager.load_profile.return_value = profile
+
+        assert daemon.load_profile("default") is True
+
+        loaded = daemon._mapper.load_profile.call_args[0][0]
+        assert loaded["mappings"] == {"G1": "KEY_A"}
+
+
+class TestBroadcastAsync:
+    """_broadcast_async scheduling."""
+
+    def test_discarded_without_server_loop(self, daemon):
+        async def message():
+            pass
+
+        coro = message()
+        daemon._broadcast_async(coro)
+        # Closed rather than left to warn "never awaited"
+        assert coro.cr_frame is None
+
+    def test_scheduled_on_running_server_loop(self, daemon):
+        daemon._server = MagicMock()
+        daemon._server.start = AsyncMock()
+        thread = threading.Thread(target=daemon._run_server_loop)
+        thread.start()
+        try:
+            for _ in range(100):
+                if daemon._schedule_broadcast is not _discard_broadcast:
+                    break
+                time.sleep(0.01)
+            ran = threading.Event()
+
+            async def message():
+                ran.set()
+
+            daemon._broadcast_async(message())
+            assert ran.wait(timeout=2.0)
+        finally:
+            daemon._server_loop.call_soon_threadsafe(daemon._server_loop.stop)
+            thread.join(timeout=2.0)
+        assert daemon._schedule_broadcast is _discard_broadcast
+
+
+class TestCpuAffinity:
+    """_apply_cpu_affinity thread placement."""
+
+    def test_hid_cpu_reserved_for_main_thread(self, daemon):
+        daemon._render_thread = MagicMock(native_id=4242)
+        daemon._pacing_thread = MagicMock(native_id=4243)
+        daemon._server_thread = MagicMock(native_id=4244)
+        with (
+            patch("g13_linux.daemon.os.sched_getaffinity", return_value={0, 1, 2, 3}),
+            patch("g13_linux.daemon.os.sched_setaffinity") as setaffinity,
+        ):
+            daemon._apply_cpu_affinity()
+
+        masks = {c.args[0]: c.args[1] for c in setaffinity.call_args_list}
+        assert masks == {
+            threading.get_native_id(): {3},
+            4242: {0, 1, 2},
+            4243: {0, 1, 2},
+            4244: {0, 1, 2},
+        }
+
+    def test_server_thread_started_before_pinning(self, daemon):
+        """The server thread must not inherit the HID CPU from the main thread."""
+        daemon._enable_server = True
+        order = []
+        with (
+            patch.object(daemon, "_render_loop"),
+            patch.object(daemon, "_pacing_loop"),
+            patch.object(daemon, "_start_server", side_effect=lambda: order.append("server")),
+            patch.object(
+                daemon, "_apply_cpu_affinity", side_effect=lambda: order.append("affinity")
+            ),
+        ):
+            daemon._start_background_threads()
+
+        assert order == ["server", "affinity"]
+
+    def test_single_cpu_not_pinned(self, daemon):
+        with (
+            patch("g13_linux.daemon.os.sched_getaffinity", return_value={0}),
+            patch("g13_linux.daemon.os.sched_setaffinity") as setaffinity,
+        ):
+            daemon._apply_cpu_affinity()
+
+        setaffinity.assert_not_called()
+
+    def test_permission_error_ignored(self, daemon):
+        with (
+            patch("g13_linux.daemon.os.sched_getaffinity", return_value={0, 1}),
+            patch("g13_linux.daemon.os.sched_setaffinity", side_effect=PermissionError),
+        ):
+            daemon._apply_cpu_affinity()
@@ -73,6 +73,57 @@ class TestHidrawDevice:
         result = device.read(64)
         assert result is None
 
+    def test_fileno(self):
+        device = HidrawDevice("/dev/hidraw0")
+        device._fd = 42
+        assert device.fileno() == 42
+
+    def test_read_timeout_no_data(self):
+        mock_file = MagicMock()
+        device = HidrawDevice("/dev/hidraw0")
+        device._file = mock_file
+        device._fd = 42
+        with patch("select.select", return_value=([], [], [])) as mock_select:
+            result = device.read(64, timeout_ms=100)
+        assert result is None
+        mock_select.assert_called_once_with([42], [], [], 0.1)
+        mock_file.read.assert_not_called()
+
+    def test_read_timeout_ready(self):
+        mock_file = MagicMock()
+        mock_file.read.return_value = b"\x01\x02"
+        device = HidrawDevice("/dev/hidraw0")
+        device._file = mock_file
+        device._fd = 42
+        with patch("select.select", return_value=([42], [], [])):
+            result = device.read(timeout_ms=100)
+        assert result == [1, 2]
+
+    def test_readinto_success(self):
+        mock_file = MagicMock()
+        mock_file.readinto.return_value = 8
+        device = HidrawDevice("/dev/hidraw0")
+        device._file = mock_file
+        buf = bytearray(64)
+        assert device.readinto(buf) == 8
+        mock_file.readinto.assert_called_once_with(buf)
+
+    def test_readinto_no_data(self):
+        mock_file = MagicMock()
+        mock_file.readinto.return_value = None  # Non-blocking read with nothing queued
+        device = HidrawDevice("/dev/hidraw0")
+        device._file = mock_file
+        assert device.readinto(bytearray(64)) == 0
+
+    def test_readinto_timeout_no_data(self):
+        mock_file = MagicMock()
+        device = HidrawDevice("/dev/hidraw0")
+        device._file = mock_file
+        device._fd = 42
+        with patch("select.select", return_value=([], [], [])):
+            assert device.readinto(bytearray(64), timeout_ms=100) == 0
+        mock_file.readinto.assert_not_called()
+
     def test_write(self):
         mock_file = MagicMock()
         mock_file.write.return_value = 5
@@ -79,6 +79,16 @@ class TestDecodeReport:
         assert state.joystick_x == 0x80
         assert state.joystick_y == 0x80
 
+    def test_decode_report_from_reused_buffer(self):
+        """Test that a memoryview report is copied, not referenced."""
+        decoder = EventDecoder()
+        buf = bytearray([0x00, 0x80, 0x80, 0x01, 0x00, 0x00, 0x00, 0x00])
+        state = decoder.decode_report(memoryview(buf))
+        buf[3] = 0x00
+
+        assert state.g_buttons == 1 << 1
+        assert state.raw_data == bytes([0x00, 0x80, 0x80, 0x01, 0x00, 0x00, 0x00, 0x00])
+
     def test_decode_g1_pressed(self):
         """Test decoding G1 button press (byte 3, bit 0)."""
         decoder = EventDecoder()
@@ -375,6 +385,42 @@ class TestGetButtonChanges:
         assert "G1" in released
 
 
+class TestButtonChangesFromReports:
+    """get_button_changes on decoded reports, including non G/M buttons."""
+
+    def test_other_buttons_press_and_release(self):
+        decoder = EventDecoder()
+        decoder.get_button_changes(decoder.decode_report(bytes(8)))
+
+        # G1, M2, BD and STICK pressed together
+        down = bytes([0x00, 0x80, 0x80, 0x01, 0x00, 0x00, 0x41, 0x08])
+        pressed, released = decoder.get_button_changes(decoder.decode_report(down))
+        assert pressed == ["G1", "M2", "BD", "STICK"]
+        assert released == []
+
+        # Release STICK and G1, press MR
+        change = bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x00, 0x41, 0x01])
+        pressed, released = decoder.get_button_changes(decoder.decode_report(change))
+        assert pressed == ["MR"]
+        assert released == ["G1", "STICK"]
+
+    def test_status_bit_ignored(self):
+        """Byte 5 bit 7 is a status flag, not a button."""
+        decoder = EventDecoder()
+        decoder.get_button_changes(decoder.decode_report(bytes(8)))
+        status = bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x80, 0x00, 0x00])
+        assert decoder.get_button_changes(decoder.decode_report(status)) == ([], [])
+
+    def test_matches_pressed_buttons_for_every_mapped_button(self):
+        for name, (byte_idx, bit_pos) in EventDecoder.BUTTON_MAP.items():
+            decoder = EventDecoder()
+            data = bytearray(8)
+            data[byte_idx] |= 1 << bit_pos
+            state = decoder.decode_report(bytes(data))
+            pressed, _ = decoder.get_button_changes(state)
+            assert pressed == decoder.get_pressed_buttons(state) == [name]
+
+
 class TestAnalyzeRawReport:
     """Tests for analyze_raw_report method."""
 
@@ -1,101 +1,79 @@
 """Tests for GUI main entry point."""
 
+import fcntl
+import os
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestInstanceLocking:
     """Test single-instance locking functions."""
 
-    def test_acquire_lock_success(self):
-        """Test acquiring lock when no other instance."""
+    @pytest.fixture
+    def main_module(self, tmp_path):
+        """gui.main with LOCK_FILE in a temp dir; releases any held lock after."""
         from g13_linux.gui import main as main_module
 
-        mock_file = MagicMock()
-        mock_file.fileno.return_value = 42
-
-        with patch("builtins.open", return_value=mock_file):
-            with patch("fcntl.flock") as mock_flock:
-                result = main_module.acquire_instance_lock()
-
-                assert result is True
-                mock_flock.assert_called_once()
-                mock_file.write.assert_called_once()
+        with patch.object(main_module, "LOCK_FILE", tmp_path / "gui.lock"):
+            yield main_module
+            main_module.release_instance_lock()
 
-        # Cleanup
-        main_module._lock_file_handle = None
+    def test_acquire_lock_success(self, main_module):
+        """Test acquiring lock when no other instance."""
+        assert main_module.acquire_instance_lock() is True
+        assert main_module.LOCK_FILE.read_text() == f"{os.getpid()}\n"
+        assert not os.get_inheritable(main_module._lock_fd)
 
-    def test_acquire_lock_failure_already_locked(self):
+    def test_acquire_lock_failure_already_locked(self, main_module):
         """Test acquiring lock when another instance holds it."""
-
-        from g13_linux.gui import main as main_module
-
-        mock_file = MagicMock()
-        mock_file.fileno.return_value = 42
-
-        with patch("builtins.open", return_value=mock_file):
-            with patch("fcntl.flock", side_effect=OSError("Resource busy")):
-                result = main_module.acquire_instance_lock()
-
-                assert result is False
-                mock_file.close.assert_called_once()
-
-        # Cleanup
-        main_module._lock_file_handle = None
-
-    def test_acquire_lock_failure_open_error(self):
+        main_module.LOCK_FILE.write_text("12345")
+        holder = os.open(main_module.LOCK_FILE, os.O_RDWR)
+        fcntl.flock(holder, fcntl.LOCK_EX)
+        try:
+            assert main_module.acquire_instance_lock() is False
+            assert main_module._lock_fd is None
+            # The losing attempt must not truncate the holder's PID
+            assert main_module.LOCK_FILE.read_text() == "12345"
+        finally:
+            os.close(holder)
+
+    def test_acquire_lock_failure_open_error(self, main_module):
         """Test acquiring lock when file cannot be opened."""
-        from g13_linux.gui import main as main_module
-
-        with patch("builtins.open", side_effect=OSError("Permission denied")):
-            result = main_module.acquire_instance_lock()
+        with patch("os.open", side_effect=OSError("Permission denied")):
+            assert main_module.acquire_instance_lock() is False
 
-            assert result is False
-
-    def test_release_lock(self):
+    def test_release_lock(self, main_module):
         """Test releasing the lock."""
-        from g13_linux.gui import main as main_module
+        main_module.acquire_instance_lock()
+        main_module.release_instance_lock()
 
-        mock_file = MagicMock()
-        mock_file.fileno.return_value = 42
-        main_module._lock_file_handle = mock_file
+        assert main_module._lock_fd is None
+        assert not main_module.LOCK_FILE.exists()
+        # Lock is free again
+        assert main_module.acquire_instance_lock() is True
 
-        with patch("fcntl.flock") as mock_flock:
-            with patch.object(Path, "unlink"):
-                main_module.release_instance_lock()
-
-                mock_flock.assert_called_once()
-                mock_file.close.assert_called_once()
-                assert main_module._lock_file_handle is None
-
-    def test_release_lock_when_no_handle(self):
+    def test_release_lock_when_no_handle(self, main_module):
         """Test releasing lock when none was acquired."""
-        from g13_linux.gui import main as main_module
-
-        main_module._lock_file_handle = None
+        # Should not raise
+        main_module.release_instance_lock()
 
-        with patch.object(Path, "unlink"):
-            # Should not raise
-            main_module.release_instance_lock()
+        assert main_module._lock_fd is None
 
-            assert main_module._lock_file_handle is None
-
-    def test_release_lock_handles_errors(self):
+    def test_release_lock_handles_errors(self, main_module):
         """Test release handles errors gracefully."""
-        from g13_linux.gui import main as main_module
+        main_module.acquire_instance_lock()
+        fd = main_module._lock_fd
+        os.close(fd)  # Descriptor already gone: os.close in release fails
 
-        mock_file = MagicMock()
-        mock_file.fileno.return_value = 42
-        mock_file.close.side_effect = OSError("Error closing")
-        main_module._lock_file_handle = mock_file
-
-        with patch("fcntl.flock", side_effect=OSError("Error unlocking")):
-            with patch.object(Path, "unlink", side_effect=OSError("Error unlinking")):
-                # Should not raise
-                main_module.release_instance_lock()
+        with patch.object(Path, "unlink", side_effect=OSError("Error unlinking")):
+            # Should not raise
+            main_module.release_instance_lock()
 
-                assert main_module._lock_file_handle is None
+        assert main_module._lock_fd is None
 
 
 class TestMainFunction:
@@ -107,11 +85,11 @@ class TestMainFunction:
 
         with patch.object(sys, "argv", ["g13-linux-gui"]):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=False):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app_cls.return_value = mock_app
 
-                    with patch("g13_linux.gui.main.QMessageBox") as mock_msgbox:
+                    with patch("PyQt6.QtWidgets.QMessageBox") as mock_msgbox:
                         result = main()
 
                         mock_msgbox.warning.assert_called_once()
@@ -124,7 +102,7 @@ class TestMainFunction:
         # Mock sys.argv without --libusb
         with patch.object(sys, "argv", ["g13-linux-gui"]):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=True):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app.exec.return_value = 0
                     mock_app_cls.return_value = mock_app
@@ -157,7 +135,7 @@ class TestMainFunction:
 
         with patch.object(sys, "argv", test_argv):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=True):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app.exec.return_value = 0
                     mock_app_cls.return_value = mock_app
@@ -187,7 +165,7 @@ class TestMainFunction:
 
         with patch.object(sys, "argv", ["g13-linux-gui"]):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=True):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app.exec.return_value = 0
                     mock_app_cls.return_value = mock_app
@@ -203,7 +181,7 @@ class TestMainFunction:
                             mock_ctrl.start.side_effect = Exception("No device")
                             mock_ctrl_cls.return_value = mock_ctrl
 
-                            with patch("g13_linux.gui.main.QMessageBox") as mock_msgbox:
+                            with patch("PyQt6.QtWidgets.QMessageBox") as mock_msgbox:
                                 result = main()
 
                                 # Should show warning but continue
@@ -217,14 +195,14 @@ class TestMainFunction:
 
         with patch.object(sys, "argv", ["g13-linux-gui"]):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=True):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app_cls.return_value = mock_app
 
                     with patch("g13_linux.gui.views.main_window.MainWindow") as mock_window_cls:
                         mock_window_cls.side_effect = Exception("Startup failed")
 
-                        with patch("g13_linux.gui.main.QMessageBox") as mock_msgbox:
+                        with patch("PyQt6.QtWidgets.QMessageBox") as mock_msgbox:
                             result = main()
 
                             mock_msgbox.critical.assert_called_once()
@@ -248,11 +226,11 @@ class TestMainImportErrors:
 
         with patch.object(sys, "argv", ["g13-linux-gui"]):
             with patch("g13_linux.gui.main.acquire_instance_lock", return_value=True):
-                with patch("g13_linux.gui.main.QApplication") as mock_app_cls:
+                with patch("PyQt6.QtWidgets.QApplication") as mock_app_cls:
                     mock_app = MagicMock()
                     mock_app_cls.return_value = mock_app
 
-                    with patch("g13_linux.gui.main.QMessageBox") as mock_msgbox:
+                    with patch("PyQt6.QtWidgets.QMessageBox") as mock_msgbox:
                         # Reload module to trigger fresh import attempt
                         # Mock the relative import to fail
                         original_import = importlib.import_module
@@ -287,3 +265,26 @@ class TestMainImportErrors:
 
                                 mock_msgbox.critical.assert_called_once()
                                 assert result == 1
+
+
+class TestImportCost:
+    """Importing the GUI entry point stays light until main() runs."""
+
+    def test_import_loads_neither_qt_nor_daemon(self):
+        code = (
+            "import sys, g13_linux.gui.main; "
+            "print(sorted(m for m in ('PyQt6', 'g13_linux.daemon') if m in sys.modules))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_package_exports_resolve_lazily(self):
+        import g13_linux
+        from g13_linux.daemon import G13Daemon
+
+        assert g13_linux.G13Daemon is G13Daemon
+        assert isinstance(g13_linux.__version__, str)
+        assert set(g13_linux.__all__) <= set(dir(g13_linux))
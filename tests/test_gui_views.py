@@ -540,6 +540,48 @@ class TestProfileManagerWidget:
         assert current is not None
         assert current.text() == "profile2"
 
+    def test_update_profile_list_unchanged_keeps_items(self, qapp):
+        """An unchanged list leaves the existing items in place."""
+        from g13_linux.gui.views.profile_manager import ProfileManagerWidget
+
+        widget = ProfileManagerWidget()
+        widget.update_profile_list(["a", "b"])
+        first = widget.profile_list.item(0)
+
+        widget.update_profile_list(["a", "b"])
+
+        assert widget.profile_list.item(0) is first
+
+    def test_update_profile_list_diffs_in_place(self, qapp):
+        """Additions land at their position; removals drop only their item."""
+        from g13_linux.gui.views.profile_manager import ProfileManagerWidget
+
+        widget = ProfileManagerWidget()
+        widget.update_profile_list(["a", "c", "d"])
+        widget.profile_list.setCurrentRow(2)  # Select d
+        item_d = widget.profile_list.item(2)
+
+        widget.update_profile_list(["a", "b", "d", "e"])
+
+        texts = [widget.profile_list.item(i).text() for i in range(widget.profile_list.count())]
+        assert texts == ["a", "b", "d", "e"]
+        assert widget.profile_list.item(2) is item_d
+        assert widget.profile_list.currentItem() is item_d
+
+    def test_update_profile_list_reorder_rebuilds(self, qapp):
+        """A reordered list is shown in the new order with the selection kept."""
+        from g13_linux.gui.views.profile_manager import ProfileManagerWidget
+
+        widget = ProfileManagerWidget()
+        widget.update_profile_list(["a", "b", "c"])
+        widget.profile_list.setCurrentRow(0)
+
+        widget.update_profile_list(["c", "b", "a"])
+
+        texts = [widget.profile_list.item(i).text() for i in range(widget.profile_list.count())]
+        assert texts == ["c", "b", "a"]
+        assert widget.profile_list.currentItem().text() == "a"
+
     def test_profile_selected_signal(self, qapp):
         """Test clicking profile emits signal."""
         from g13_linux.gui.views.profile_manager import ProfileManagerWidget
@@ -553,8 +595,27 @@ class TestProfileManagerWidget:
         # Simulate click
         item = widget.profile_list.item(0)
         widget.profile_list.itemClicked.emit(item)
+        assert received == []  # Held until the coalescing timer fires
+
+        widget._selection_timer.timeout.emit()
+        assert received == ["test_profile"]
+
+    def test_rapid_clicks_emit_once(self, qapp):
+        """Clicks inside the coalescing window emit only the last profile."""
+        from g13_linux.gui.views.profile_manager import ProfileManagerWidget
+
+        widget = ProfileManagerWidget()
+        widget.update_profile_list(["a", "b", "c"])
+        received = []
+        widget.profile_selected.connect(received.append)
+
+        for row in range(3):
+            widget.profile_list.itemClicked.emit(widget.profile_list.item(row))
+        assert widget._selection_timer.isActive()
 
-        assert "test_profile" in received
+        widget._selection_timer.timeout.emit()
+        widget._selection_timer.timeout.emit()  # A stale timeout emits nothing more
+        assert received == ["c"]
 
     def test_on_new_profile(self, qapp):
         """Test new profile dialog."""
@@ -15,7 +15,7 @@ from unittest.mock import MagicMock, patch
 from g13_linux.hardware.backlight import G13Backlight
 from g13_linux.input.handler import InputHandler, SimulatedInputHandler
 from g13_linux.input.navigation import NavigationController, NavigationState
-from g13_linux.led.colors import RGB
+from g13_linux.led.colors import RGB, dim
 from g13_linux.led.controller import LEDController
 from g13_linux.led.effects import (
     EffectType,
@@ -71,7 +71,7 @@ class TestInputHandlerInit:
         handler = InputHandler(MagicMock(), MagicMock())
         assert handler._stick_x == InputHandler.STICK_CENTER
         assert handler._stick_y == InputHandler.STICK_CENTER
-        assert handler._stick_pressed is False
+        assert handler._button_bits == 0
 
     def test_constants(self):
         assert InputHandler.STICK_CENTER == 128
@@ -214,7 +214,7 @@ class TestInputHandlerStickRepeat:
         self.events.clear()
 
         # Simulate time just before delay expires
-        self.handler._repeat_start_time = time.time()
+        self.handler._repeat_start_time = time.monotonic()
         self.handler._check_stick_repeat()
         assert self.events == []
 
@@ -224,7 +224,7 @@ class TestInputHandlerStickRepeat:
         self.events.clear()
 
         # Set times so delay and rate are both exceeded
-        now = time.time()
+        now = time.monotonic()
         self.handler._repeat_start_time = now - 0.5  # past REPEAT_DELAY (0.4)
         self.handler._last_repeat_time = now - 0.2  # past REPEAT_RATE (0.15)
 
@@ -236,13 +236,44 @@ class TestInputHandlerStickRepeat:
         self.handler._process_thumbstick(128, 10)  # UP
         self.events.clear()
 
-        now = time.time()
+        now = time.monotonic()
         self.handler._repeat_start_time = now - 0.5  # past delay
         self.handler._last_repeat_time = now - 0.05  # within rate (< 0.15)
 
         self.handler._check_stick_repeat()
         assert self.events == []
 
+    def test_repeat_uses_monotonic_clock(self):
+        """Wall-clock jumps (e.g. NTP) do not affect repeat timing."""
+        self.handler._process_thumbstick(128, 10)  # UP
+        self.events.clear()
+
+        with patch("time.time", return_value=time.time() + 3600):
+            self.handler._check_stick_repeat()
+        assert self.events == []
+
+    def test_tick_idle_returns_none(self):
+        assert self.handler.tick() is None
+
+    def test_tick_reports_time_until_first_repeat(self):
+        self.handler._process_thumbstick(128, 10)  # UP
+        self.events.clear()
+
+        due = self.handler.tick()
+        assert self.events == []
+        assert 0 < due <= InputHandler.STICK_REPEAT_DELAY
+
+    def test_tick_fires_repeat_and_reports_rate(self):
+        self.handler._process_thumbstick(128, 10)  # UP
+        self.events.clear()
+        now = time.monotonic()
+        self.handler._repeat_start_time = now - 0.5
+        self.handler._last_repeat_time = now - 0.2
+
+        due = self.handler.tick()
+        assert self.events == [InputEvent.STICK_UP]
+        assert 0 < due <= InputHandler.STICK_REPEAT_RATE
+
 
 class TestInputHandlerStickButton:
     """Stick button (press) detection."""
@@ -254,14 +285,14 @@ class TestInputHandlerStickButton:
     def test_stick_press_detected(self):
         """Byte 7 bit 3 (0x08) triggers STICK_PRESS on rising edge."""
         data = _make_report(byte7=0x08)
-        self.handler._process_stick_button(data)
+        self.handler._process_report(data)
         assert self.events == [InputEvent.STICK_PRESS]
 
     def test_stick_press_no_repeat(self):
         """Holding stick button does not re-emit."""
         data = _make_report(byte7=0x08)
-        self.handler._process_stick_button(data)
-        self.handler._process_stick_button(data)  # still held
+        self.handler._process_report(data)
+        self.handler._process_report(data)  # still held
         assert self.events == [InputEvent.STICK_PRESS]
 
     def test_stick_release_and_repress(self):
@@ -269,20 +300,20 @@ class TestInputHandlerStickButton:
         pressed = _make_report(byte7=0x08)
         released = _make_report(byte7=0x00)
 
-        self.handler._process_stick_button(pressed)
-        self.handler._process_stick_button(released)
-        self.handler._process_stick_button(pressed)
+        self.handler._process_report(pressed)
+        self.handler._process_report(released)
+        self.handler._process_report(pressed)
         assert self.events == [InputEvent.STICK_PRESS, InputEvent.STICK_PRESS]
 
     def test_short_data_ignored(self):
         """Data shorter than 8 bytes is silently ignored."""
-        self.handler._process_stick_button(bytes([0] * 7))
+        self.handler._process_report(bytes([0] * 7))
         assert self.events == []
 
     def test_stick_not_pressed(self):
         """No bit 3 set → no event."""
         data = _make_report(byte7=0x04)  # bit 2, not bit 3
-        self.handler._process_stick_button(data)
+        self.handler._process_report(data)
         assert self.events == []
 
 
@@ -296,44 +327,44 @@ class TestInputHandlerButtons:
     def test_bd_button(self):
         """BD: byte 6, bit 0."""
         data = _make_report(byte6=0x01)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_BD in self.events
 
     def test_left_button(self):
         """LEFT: byte 7, bit 1."""
         data = _make_report(byte7=0x02)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_LEFT in self.events
 
     def test_m1_button(self):
         """M1: byte 6, bit 5."""
         data = _make_report(byte6=0x20)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_M1 in self.events
 
     def test_m2_button(self):
         """M2: byte 6, bit 6."""
         data = _make_report(byte6=0x40)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_M2 in self.events
 
     def test_m3_button(self):
         """M3: byte 6, bit 7."""
         data = _make_report(byte6=0x80)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_M3 in self.events
 
     def test_mr_button(self):
         """MR: byte 7, bit 0."""
         data = _make_report(byte7=0x01)
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_MR in self.events
 
     def test_rising_edge_only(self):
         """Only emit on transition from unpressed to pressed."""
         data = _make_report(byte6=0x01)  # BD pressed
-        self.handler._process_buttons(data)
-        self.handler._process_buttons(data)  # still held
+        self.handler._process_report(data)
+        self.handler._process_report(data)  # still held
         assert self.events.count(InputEvent.BUTTON_BD) == 1
 
     def test_release_and_repress(self):
@@ -341,24 +372,48 @@ class TestInputHandlerButtons:
         pressed = _make_report(byte6=0x01)
         released = _make_report(byte6=0x00)
 
-        self.handler._process_buttons(pressed)
-        self.handler._process_buttons(released)
-        self.handler._process_buttons(pressed)
+        self.handler._process_report(pressed)
+        self.handler._process_report(released)
+        self.handler._process_report(pressed)
         assert self.events.count(InputEvent.BUTTON_BD) == 2
 
     def test_multiple_buttons_simultaneous(self):
         """Multiple buttons pressed at once."""
         data = _make_report(byte6=0x01 | 0x20, byte7=0x01)  # BD + M1 + MR
-        self.handler._process_buttons(data)
+        self.handler._process_report(data)
         assert InputEvent.BUTTON_BD in self.events
         assert InputEvent.BUTTON_M1 in self.events
         assert InputEvent.BUTTON_MR in self.events
 
     def test_short_data_ignored(self):
         """Data shorter than 8 bytes ignored."""
-        self.handler._process_buttons(bytes([0] * 7))
+        self.handler._process_report(bytes([0] * 7))
         assert self.events == []
 
+    def test_stick_press_with_buttons(self):
+        """Stick click and a button in one report emit stick press first."""
+        self.handler._process_report(_make_report(byte6=0x01, byte7=0x08))
+        assert self.events == [InputEvent.STICK_PRESS, InputEvent.BUTTON_BD]
+
+    def test_simultaneous_presses_emit_in_button_order(self):
+        """All six buttons at once emit in BD, LEFT, M1, M2, M3, MR order."""
+        self.handler._process_report(_make_report(byte6=0xE1, byte7=0x03))
+        assert self.events == [
+            InputEvent.BUTTON_BD,
+            InputEvent.BUTTON_LEFT,
+            InputEvent.BUTTON_M1,
+            InputEvent.BUTTON_M2,
+            InputEvent.BUTTON_M3,
+            InputEvent.BUTTON_MR,
+        ]
+
+    def test_other_bits_do_not_affect_edges(self):
+        """L1-L4 and DOWN bits in the same bytes neither emit nor mask an edge."""
+        self.handler._process_report(_make_report(byte6=0x1E, byte7=0x04))
+        assert self.events == []
+        self.handler._process_report(_make_report(byte6=0x01, byte7=0x00))
+        assert self.events == [InputEvent.BUTTON_BD]
+
 
 class TestInputHandlerEmit:
     """Callback error handling in _emit."""
@@ -423,6 +478,29 @@ class TestInputHandlerPollLoop:
         limited_loop()
         assert InputEvent.BUTTON_BD in events
 
+    def test_poll_loop_skips_unchanged_reports(self):
+        """Repeated identical reports are decoded once but still drive stick repeat."""
+        held = list(_make_report(joystick_y=10, byte6=0x01))  # Stick up + BD
+        reads = [held, list(held), list(held), None]
+        device = MagicMock()
+        handler = InputHandler(device, MagicMock())
+
+        def read(timeout_ms):
+            if len(reads) == 1:
+                handler._running = False
+            return reads.pop(0)
+
+        device.read.side_effect = read
+        handler._running = True
+        with (
+            patch.object(handler, "_process_report", wraps=handler._process_report) as process,
+            patch.object(handler, "_check_stick_repeat") as repeat,
+        ):
+            handler._poll_loop()
+
+        process.assert_called_once_with(held)
+        assert repeat.call_count == 3
+
     def test_poll_loop_handles_read_exception(self):
         device = MagicMock()
         device.read.side_effect = OSError("device disconnected")
@@ -840,6 +918,22 @@ class TestLEDControllerEffects:
         )
         self.ctrl.stop_effect()
 
+    def test_solid_effect_writes_color_once(self):
+        """Repeated frames of the same color skip the hardware write."""
+        self.ctrl.start_effect(EffectType.SOLID, color=RGB(1, 2, 3))
+        time.sleep(0.15)
+        self.ctrl.stop_effect()
+        self.backlight.set_color.assert_called_once_with(1, 2, 3)
+
+    def test_stop_interrupts_frame_wait(self):
+        """stop_effect does not wait out the remaining frame interval."""
+        self.ctrl.FRAME_INTERVAL = 10.0
+        self.ctrl.start_effect(EffectType.SOLID, color=RGB(1, 2, 3))
+        time.sleep(0.05)
+        start = time.monotonic()
+        self.ctrl.stop_effect()
+        assert time.monotonic() - start < 1.0
+
 
 class TestLEDControllerRunAlert:
     """run_alert blocking and non-blocking modes."""
@@ -930,6 +1024,25 @@ class TestPulseEffect:
             assert 0 <= v.g <= 255
             assert 0 <= v.b <= 255
 
+    def test_follows_sine_wave(self):
+        """Brightness runs from 60% at the start, to full, down to 20%."""
+        color = RGB(200, 100, 50)
+        with patch("time.time", return_value=100.0) as clock:
+            gen = pulse(color, speed=2.0)
+            assert next(gen) == RGB(120, 60, 30)
+            clock.return_value = 100.125
+            assert next(gen) == color
+            clock.return_value = 100.375
+            assert next(gen) == dim(color, 0.8)
+
+    def test_colors_precomputed_once_per_effect(self):
+        """The same point in later cycles yields the same color object."""
+        with patch("time.time", return_value=100.0) as clock:
+            gen = pulse(RGB(255, 0, 0), speed=1.0)
+            first = next(gen)
+            clock.return_value = 103.0
+            assert next(gen) is first
+
 
 class TestRainbowEffect:
     """rainbow() generator."""
@@ -1,5 +1,7 @@
 """Tests for KeySelectorDialog widget."""
 
+from unittest.mock import MagicMock
+
 import pytest
 from PyQt6.QtCore import Qt
 
@@ -77,6 +79,7 @@ class TestKeySelectorDialog:
         from PyQt6.QtWidgets import QListWidget, QTabWidget
 
         tabs = dialog.findChild(QTabWidget)
+        tabs.setCurrentIndex(1)  # Lists are built when their tab is shown
         fn_tab = tabs.widget(1)
         list_widget = fn_tab.findChild(QListWidget)
 
@@ -91,17 +94,34 @@ class TestKeySelectorDialog:
         from PyQt6.QtWidgets import QListWidget, QTabWidget
 
         tabs = dialog.findChild(QTabWidget)
+        tabs.setCurrentIndex(3)
         all_tab = tabs.widget(3)  # Now at index 3 (after Modifiers tab)
         list_widget = all_tab.findChild(QListWidget)
 
         # Should have many keys from evdev
         assert list_widget.count() > 100
 
+    def test_other_tabs_built_on_first_view(self, dialog):
+        """Only the default tab has a key list until another tab is opened."""
+        from PyQt6.QtWidgets import QListWidget, QTabWidget
+
+        tabs = dialog.findChild(QTabWidget)
+        assert tabs.widget(0).findChild(QListWidget) is not None
+        assert tabs.widget(3).findChild(QListWidget) is None
+
+        tabs.setCurrentIndex(3)
+        tabs.setCurrentIndex(0)
+        tabs.setCurrentIndex(3)
+
+        assert len(tabs.widget(3).findChildren(QListWidget)) == 1
+        assert tabs.widget(1).findChild(QListWidget) is None
+
     def test_modifiers_tab_has_modifier_keys(self, dialog):
         """Test modifiers tab has modifier keys."""
         from PyQt6.QtWidgets import QListWidget, QTabWidget
 
         tabs = dialog.findChild(QTabWidget)
+        tabs.setCurrentIndex(2)
         mod_tab = tabs.widget(2)
         list_widget = mod_tab.findChild(QListWidget)
 
@@ -155,6 +175,32 @@ class TestKeySelectorDialog:
         # The main key should be set (selected_key is set on accept())
         assert dialog._main_key is not None
 
+    def test_reclicking_selected_key_skips_preview(self, dialog):
+        """Clicking the key that is already selected does no work."""
+        from PyQt6.QtWidgets import QListWidget
+
+        list_widget = dialog._tabs.widget(0).findChild(QListWidget)
+        item = list_widget.item(0)
+        list_widget.itemClicked.emit(item)
+        dialog._update_preview = MagicMock()
+
+        list_widget.itemClicked.emit(item)
+
+        assert dialog._main_key == item.text()
+        dialog._update_preview.assert_not_called()
+
+    def test_double_click_selects_and_accepts(self, dialog):
+        """Double-clicking a key selects it and accepts the dialog."""
+        from PyQt6.QtWidgets import QListWidget
+
+        list_widget = dialog._tabs.widget(0).findChild(QListWidget)
+        item = list_widget.item(0)
+        dialog.done = lambda x: None
+
+        list_widget.itemDoubleClicked.emit(item)
+
+        assert dialog.selected_key == item.text()
+
     def test_clear_mapping_sets_reserved(self, dialog, qtbot):
         """Test Clear Mapping sets KEY_RESERVED."""
         from PyQt6.QtWidgets import QPushButton
@@ -177,17 +223,42 @@ class TestKeySelectorDialog:
         list_widget = common_tab.findChild(QListWidget)
         search_box = common_tab.findChild(QLineEdit)
 
-        initial_count = list_widget.count()
+        def visible():
+            return [
+                list_widget.item(i).text()
+                for i in range(list_widget.count())
+                if not list_widget.isRowHidden(i)
+            ]
+
+        initial_count = len(visible())
 
         # Type in search box to filter (using SPACE since CTRL is in Modifiers tab now)
         search_box.setText("SPACE")
-        qtbot.wait(50)  # Allow filter to apply
+        qtbot.waitUntil(lambda: len(visible()) < initial_count)  # Filter is debounced
+
+        # All visible items should contain SPACE; hidden rows are kept
+        assert visible() and all("SPACE" in key for key in visible())
+        assert list_widget.count() == initial_count
+
+        # Clearing the search shows every row again
+        search_box.setText("")
+        qtbot.waitUntil(lambda: len(visible()) == initial_count)
+
+    def test_search_typing_filters_once(self, dialog, qtbot):
+        """Keystrokes inside the debounce window lead to one filter pass."""
+        from PyQt6.QtWidgets import QLineEdit, QListWidget, QTabWidget
+
+        common_tab = dialog.findChild(QTabWidget).widget(0)
+        list_widget = common_tab.findChild(QListWidget)
+        search_box = common_tab.findChild(QLineEdit)
+
+        for text in ("S", "SP", "SPA"):
+            search_box.setText(text)
+        assert not list_widget.isRowHidden(0)  # Nothing filtered yet
 
-        # Should have fewer items
-        assert list_widget.count() < initial_count
-        # All items should contain SPACE
-        for i in range(list_widget.count()):
-            assert "SPACE" in list_widget.item(i).text()
+        qtbot.waitUntil(lambda: list_widget.isRowHidden(0))
+        shown = [i for i in range(list_widget.count()) if not list_widget.isRowHidden(i)]
+        assert [list_widget.item(i).text() for i in shown] == ["KEY_SPACE", "KEY_BACKSPACE"]
 
     def test_different_button_id(self, qtbot):
         """Test dialog with different button ID."""
@@ -282,6 +353,36 @@ class TestKeySelectorComboKeys:
         assert "KEY_LEFTSHIFT" in keys
         assert "KEY_S" in keys
 
+    def test_preview_text(self, dialog):
+        """Preview shows the key, modifiers in Ctrl/Alt/Shift/Super order, and label."""
+        dialog._main_key = "KEY_S"
+        dialog._do_update_preview()
+        assert dialog.preview_label.text() == "S"
+
+        dialog.meta_check.setChecked(True)
+        dialog.ctrl_check.setChecked(True)
+        dialog._do_update_preview()
+        assert dialog.preview_label.text() == "Ctrl+Super+S"
+
+        dialog.label_edit.setText(" Save ")
+        dialog._do_update_preview()
+        assert dialog.preview_label.text() == "Ctrl+Super+S (Save)"
+
+    def test_preview_updates_coalesced(self, dialog, qtbot):
+        """A burst of changes updates the preview once, on the next loop pass."""
+        dialog._main_key = "KEY_A"
+        dialog._do_update_preview = MagicMock(wraps=dialog._do_update_preview)
+        dialog._preview_timer.timeout.disconnect()
+        dialog._preview_timer.timeout.connect(dialog._do_update_preview)
+
+        dialog.ctrl_check.setChecked(True)
+        dialog.alt_check.setChecked(True)
+        dialog.label_edit.setText("Go")
+        assert dialog.preview_label.text() == "(select a key)"
+
+        qtbot.waitUntil(lambda: dialog.preview_label.text() == "Ctrl+Alt+A (Go)")
+        assert dialog._do_update_preview.call_count == 1
+
     def test_load_existing_simple_mapping(self, qtbot):
         """Test loading existing simple mapping."""
         from g13_linux.gui.widgets.key_selector import KeySelectorDialog
@@ -305,3 +406,17 @@ class TestKeySelectorComboKeys:
         assert dlg.alt_check.isChecked()
         assert not dlg.shift_check.isChecked()
         assert dlg.label_edit.text() == "CAD"
+
+    def test_load_combo_with_right_hand_modifiers(self, qtbot):
+        """Right-hand modifier codes check the same boxes as left-hand ones."""
+        from g13_linux.gui.widgets.key_selector import KeySelectorDialog
+
+        mapping = {"keys": ["KEY_RIGHTSHIFT", "KEY_RIGHTMETA", "KEY_X"], "label": ""}
+        dlg = KeySelectorDialog("G5", current_mapping=mapping)
+        qtbot.addWidget(dlg)
+
+        assert dlg._main_key == "KEY_X"
+        assert dlg.shift_check.isChecked()
+        assert dlg.meta_check.isChecked()
+        assert not dlg.ctrl_check.isChecked()
+        assert not dlg.alt_check.isChecked()
@@ -264,6 +264,15 @@ class TestG13LCDWriteBitmap:
         assert all(b == 0xFF for b in lcd._framebuffer[:100])
         assert all(b == 0 for b in lcd._framebuffer[100:])
 
+    def test_write_bitmap_copies_memoryview(self):
+        """A view source is copied, so later changes to it do not leak in."""
+        lcd = G13LCD()
+        source = bytearray([0x55] * G13LCD.FRAMEBUFFER_SIZE)
+        with patch.object(lcd, "_send_framebuffer"):
+            lcd.write_bitmap(memoryview(source).toreadonly())
+        source[0] = 0x00
+        assert lcd._framebuffer[0] == 0x55
+
     def test_write_bitmap_too_large(self):
         lcd = G13LCD()
         bitmap = bytes([0xFF] * (G13LCD.FRAMEBUFFER_SIZE + 1))
@@ -1,6 +1,12 @@
 """Tests for LCD Canvas drawing primitives."""
 
+import random
+
+import pytest
+
 from g13_linux.lcd.canvas import Canvas
+from g13_linux.lcd.fonts import FONT_4X6, FONT_5X7, FONT_8X8
+from g13_linux.lcd.icons import Icon
 
 
 class TestCanvasBasics:
@@ -32,6 +38,15 @@ class TestCanvasBasics:
         canvas.fill()
         assert all(b == 0xFF for b in canvas._buffer)
 
+    def test_clear_and_fill_reuse_buffer(self):
+        """Clear and fill overwrite the existing buffer instead of replacing it."""
+        canvas = Canvas()
+        buffer = canvas._buffer
+        canvas.fill()
+        canvas.clear()
+        assert canvas._buffer is buffer
+        assert len(buffer) == Canvas.FRAMEBUFFER_SIZE
+
 
 class TestPixelOperations:
     """Test pixel-level operations."""
@@ -143,6 +158,47 @@ class TestLineDrawing:
         assert canvas.get_pixel(10, 10) is True
 
 
+class TestLineMatchesBresenham:
+    """draw_line must light exactly the pixels of per-pixel Bresenham."""
+
+    @staticmethod
+    def _reference(canvas, x1, y1, x2, y2, on):
+        dx, dy = abs(x2 - x1), abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx - dy
+        while True:
+            canvas.set_pixel(x1, y1, on)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x1 += sx
+            if e2 < dx:
+                err += dx
+                y1 += sy
+
+    @pytest.mark.parametrize("on", [True, False])
+    def test_random_lines(self, on):
+        """Random lines, including clipped and axis-aligned ones, match."""
+        rng = random.Random(7)
+        for _ in range(200):
+            x1, x2 = rng.randint(-20, 180), rng.randint(-20, 180)
+            y1, y2 = rng.randint(-10, 55), rng.randint(-10, 55)
+            if rng.random() < 0.3:
+                y2 = y1
+            elif rng.random() < 0.3:
+                x2 = x1
+            fast, slow = Canvas(), Canvas()
+            if not on:
+                fast.fill()
+                slow.fill()
+            fast.draw_line(x1, y1, x2, y2, on)
+            self._reference(slow, x1, y1, x2, y2, on)
+            assert fast.to_bytes() == slow.to_bytes(), (x1, y1, x2, y2)
+
+
 class TestRectangle:
     """Test rectangle drawing."""
 
@@ -214,6 +270,133 @@ class TestInvertRegion:
         assert canvas.get_pixel(6, 5) is True
 
 
+class TestRegionOperations:
+    """Row-block region fills must match per-pixel drawing exactly."""
+
+    @staticmethod
+    def _reference(canvas, x, y, width, height, op):
+        for py in range(y, y + height):
+            for px in range(x, x + width):
+                state = not canvas.get_pixel(px, py) if op == "invert" else op == "on"
+                canvas.set_pixel(px, py, state)
+
+    @pytest.mark.parametrize("size", [(160, 43), (100, 30)])
+    def test_matches_per_pixel_drawing(self, size):
+        """Random rectangles, including ones crossing the edges, match set_pixel."""
+        rng = random.Random(13)
+        fast, slow = Canvas(*size), Canvas(*size)
+        for _ in range(300):
+            x, y = rng.randint(-10, 165), rng.randint(-10, 48)
+            width, height = rng.randint(-2, 40), rng.randint(-2, 20)
+            op = rng.choice(["on", "off", "invert"])
+            if op == "invert":
+                fast.invert_region(x, y, width, height)
+            else:
+                fast.draw_rect(x, y, width, height, filled=True, on=op == "on")
+            self._reference(slow, x, y, width, height, op)
+            assert fast.to_bytes() == slow.to_bytes()
+
+    def test_lines_stay_within_canvas_height(self):
+        """A vertical line past the bottom edge leaves the padding rows clear."""
+        canvas = Canvas()
+        canvas.draw_vline(3, 40, 10)
+        assert [canvas.get_pixel(3, y) for y in range(39, 43)] == [False, True, True, True]
+        assert canvas._buffer[5 * Canvas.WIDTH + 3] == 0b0000_0111
+
+
+class TestText:
+    """Test text rendering."""
+
+    @staticmethod
+    def _reference(canvas, x, y, text, font, on):
+        """Per-pixel rendering, one set_pixel per lit glyph bit."""
+        cursor_x = x
+        for char in text:
+            glyph = font.get_glyph(char)
+            if glyph is None:
+                continue
+            for col_idx, col_data in enumerate(glyph):
+                px = cursor_x + col_idx
+                if px >= canvas.width:
+                    break
+                for row in range(font.char_height):
+                    if y + row < canvas.height and col_data & (1 << row):
+                        canvas.set_pixel(px, y + row, on)
+            cursor_x += font.char_width + 1
+            if cursor_x >= canvas.width:
+                break
+        return cursor_x - x
+
+    def test_shifted_cell_is_cached(self):
+        """Cells are built once per character, shift and row mask."""
+        cell = FONT_5X7.shifted_cell("A", 3, 0x7F)
+        assert FONT_5X7.shifted_cell("A", 3, 0x7F) is cell
+        upper, lower = cell
+        assert len(upper) == len(lower) == FONT_5X7.char_width + 1
+        glyph = FONT_5X7.get_glyph("A")
+        assert [u | (lo << 8) for u, lo in zip(upper, lower)] == [c << 3 for c in glyph] + [0]
+
+    def test_cell_table_indexes_ascii_cells(self):
+        """The per-shift table holds the cached cell of every ASCII code."""
+        table = FONT_4X6.cell_table(2, 0x3F)
+        assert FONT_4X6.cell_table(2, 0x3F) is table
+        assert len(table) == 128
+        assert table[ord("A")] is FONT_4X6.shifted_cell("A", 2, 0x3F)
+        # Characters the font lacks fall back like get_glyph() does
+        assert table[ord("a")] is None
+        assert FONT_5X7.cell_table(0, 0x7F)[0] == FONT_5X7.shifted_cell("?", 0, 0x7F)
+
+    def test_draw_text_returns_width(self):
+        """Returned width covers each character plus spacing."""
+        assert Canvas().draw_text(0, 0, "AB") == 2 * (5 + 1)
+
+    @pytest.mark.parametrize("font", [FONT_4X6, FONT_5X7, FONT_8X8])
+    @pytest.mark.parametrize("on", [True, False])
+    def test_matches_per_pixel_rendering(self, font, on):
+        """Every row offset, including clipped ones, matches set_pixel output."""
+        text = "Hg@#0|~?\x01\xe9"
+        for y in range(-9, 46):
+            for x in (-7, 0, 3, 150):
+                fast, slow = Canvas(), Canvas()
+                if not on:
+                    fast.fill()
+                    slow.fill()
+                width = fast.draw_text(x, y, text, font, on)
+                assert width == self._reference(slow, x, y, text, font, on)
+                assert fast.to_bytes() == slow.to_bytes(), (x, y)
+
+
+class TestIcon:
+    """Icons replace the covered pixels, exactly as per-pixel drawing does."""
+
+    @staticmethod
+    def _reference(canvas, x, y, icon, on):
+        for row in range(icon.height):
+            for col in range(icon.width):
+                byte_idx = col + (row // 8) * icon.width
+                if byte_idx >= len(icon.data):
+                    continue
+                pixel_on = bool(icon.data[byte_idx] & (1 << (row % 8)))
+                canvas.set_pixel(x + col, y + row, pixel_on == on)
+
+    @pytest.mark.parametrize("on", [True, False])
+    @pytest.mark.parametrize("width,height,truncate", [(8, 8, 0), (5, 12, 0), (16, 16, 3)])
+    def test_matches_per_pixel_drawing(self, width, height, truncate, on):
+        """Every offset, clipped ones and short icon data included, matches."""
+        rng = random.Random(width * height)
+        size = width * ((height + 7) // 8) - truncate
+        icon = Icon(width, height, bytes(rng.randrange(256) for _ in range(size)))
+        background = bytes(rng.randrange(256) for _ in range(Canvas.FRAMEBUFFER_SIZE))
+        for y in range(-height, 46, 3):
+            for x in (-width + 1, -2, 0, 77, 155):
+                fast, slow = Canvas(), Canvas()
+                fast.from_bytes(background)
+                slow.from_bytes(background)
+                fast.draw_icon(x, y, icon, on)
+                self._reference(slow, x, y, icon, on)
+                assert fast.to_bytes() == slow.to_bytes(), (x, y)
+
+
 class TestBlit:
     """Test canvas blitting."""
 
@@ -230,6 +413,25 @@ class TestBlit:
         assert dest.get_pixel(25, 25) is True
         assert dest.get_pixel(21, 21) is False
 
+    @pytest.mark.parametrize("width,height", [(10, 10), (17, 5), (160, 43)])
+    def test_matches_per_pixel_blit(self, width, height):
+        """Every offset, clipped ones included, ORs in exactly the lit pixels."""
+        rng = random.Random(width + height)
+        source = Canvas(width=width, height=height)
+        source.from_bytes(bytes(rng.randrange(256) for _ in range(Canvas.FRAMEBUFFER_SIZE)))
+        background = bytes(rng.randrange(256) for _ in range(Canvas.FRAMEBUFFER_SIZE))
+        for y in range(-height, 46, 3):
+            for x in (-width + 1, -2, 0, 77, 155):
+                fast, slow = Canvas(), Canvas()
+                fast.from_bytes(background)
+                slow.from_bytes(background)
+                fast.blit(source, x, y)
+                for py in range(height):
+                    for px in range(width):
+                        if source.get_pixel(px, py):
+                            slow.set_pixel(x + px, y + py, True)
+                assert fast.to_bytes() == slow.to_bytes(), (x, y)
+
 
 class TestSerialization:
     """Test buffer serialization."""
@@ -243,6 +445,17 @@ class TestSerialization:
         assert len(data) == Canvas.FRAMEBUFFER_SIZE
         assert data[0] == 0x01
 
+    def test_buffer_view_is_read_only_and_live(self):
+        """buffer_view shares the framebuffer without copying or allowing writes."""
+        canvas = Canvas()
+        view = canvas.buffer_view()
+        assert view.readonly
+        assert len(view) == Canvas.FRAMEBUFFER_SIZE
+
+        canvas.set_pixel(0, 0, True)
+        assert view[0] == 0x01
+        assert bytes(view) == canvas.to_bytes()
+
     def test_from_bytes(self):
         """from_bytes loads framebuffer correctly."""
         canvas = Canvas()
@@ -107,6 +107,31 @@ class TestProfileLoading:
             assert mapper.button_map["G2"] == [e.KEY_LEFTALT, e.KEY_F4]
 
 
+class TestUpdateMapping:
+    """Test single-button mapping updates."""
+
+    def test_update_replaces_one_entry(self):
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile({"mappings": {"G1": "KEY_1", "G2": "KEY_2"}})
+            mapper.update_mapping("G1", {"keys": ["KEY_LEFTCTRL", "KEY_C"]})
+
+            assert mapper.button_map["G1"] == [e.KEY_LEFTCTRL, e.KEY_C]
+            assert mapper.button_map["G2"] == [e.KEY_2]
+
+    def test_update_with_invalid_key_removes_entry(self):
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile({"mappings": {"G1": "KEY_1"}})
+            mapper.update_mapping("G1", "NOT_A_KEY")
+
+            assert "G1" not in mapper.button_map
+
+
 class TestButtonEvents:
     """Test button event handling."""
 
@@ -113,6 +113,21 @@ class TestScreen:
         s.mark_dirty()
         assert s.is_dirty is True
 
+    def test_mark_dirty_wakes_render_loop(self):
+        mgr = _make_manager()
+        s = ConcreteScreen(mgr)
+        mgr.render_event.clear()
+        s.mark_dirty()
+        assert mgr.render_event.is_set()
+
+    def test_next_update_in_defaults_to_none(self):
+        assert ConcreteScreen(_make_manager()).next_update_in() is None
+
+    def test_mark_dirty_without_manager(self):
+        s = ConcreteScreen(None)
+        s.mark_dirty()
+        assert s.is_dirty is True
+
     def test_manager_reference(self):
         mgr = _make_manager()
         s = ConcreteScreen(mgr)
@@ -1555,6 +1570,28 @@ class TestIdleScreen:
         screen.update(0.016)
         assert screen.is_dirty is True
 
+    def test_next_update_in_tracks_clock(self):
+        from g13_linux.menu.screens.idle import IdleScreen
+
+        mgr = _make_manager()
+        sm = MagicMock()
+        sm.clock_show_seconds = True
+        screen = IdleScreen(mgr, settings_manager=sm)
+        assert 0 < screen.next_update_in() <= 1.01
+
+        sm.clock_show_seconds = False
+        assert 0 < screen.next_update_in() <= 60.01
+
+    def test_manager_next_update_delay(self):
+        from g13_linux.menu.screens.idle import IdleScreen
+
+        mgr = _make_manager()
+        assert mgr.next_update_delay() is None
+        mgr.push(ConcreteScreen(mgr))
+        assert mgr.next_update_delay() is None
+        mgr.push(IdleScreen(mgr))
+        assert 0 < mgr.next_update_delay() <= 1.01
+
     def test_render_no_profile(self):
         from g13_linux.menu.screens.idle import IdleScreen
 
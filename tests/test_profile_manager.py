@@ -1,7 +1,10 @@
 """Tests for G13 profile manager."""
 
+import os
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -36,6 +39,19 @@ class TestProfileData:
         assert profile.mappings == {"G1": "KEY_A"}
         assert profile.joystick == {"mode": "mouse"}
 
+    def test_default_settings_not_shared(self):
+        """Each profile gets its own copy of the nested defaults."""
+        first = ProfileData(name="one")
+        first.lcd["default_text"] = "changed"
+        first.backlight["brightness"] = 10
+        first.joystick["deadzone"] = 99
+
+        second = ProfileData(name="two")
+
+        assert second.lcd == {"enabled": True, "default_text": ""}
+        assert second.backlight == {"color": "#FFFFFF", "brightness": 100}
+        assert second.joystick["deadzone"] == 20
+
 
 class TestProfileManager:
     """Test ProfileManager CRUD operations."""
@@ -65,6 +81,15 @@ class TestProfileManager:
         assert "G22" in profile.mappings
         assert "M1" in profile.mappings
 
+    def test_created_profiles_do_not_share_mappings(self, manager):
+        """Editing one new profile's mappings leaves later ones at defaults."""
+        first = manager.create_profile("one")
+        first.mappings["G1"] = "KEY_A"
+
+        second = manager.create_profile("two")
+        assert second.mappings["G1"] == "KEY_RESERVED"
+        assert len(second.mappings) == 28
+
     def test_save_and_load_profile(self, manager):
         """Save profile and load it back."""
         profile = ProfileData(
@@ -80,6 +105,13 @@ class TestProfileManager:
         assert loaded.mappings["G1"] == "KEY_F1"
         assert loaded.mappings["G2"] == {"keys": ["KEY_LEFTCTRL", "KEY_C"]}
 
+    def test_to_dict_matches_asdict(self):
+        """to_dict has the same content as asdict, sharing nested dicts."""
+        profile = ProfileData(name="Flat", mappings={"G1": {"keys": ["KEY_A"]}})
+        data = profile.to_dict()
+        assert data == asdict(profile)
+        assert data["mappings"] is profile.mappings
+
     def test_list_profiles_after_save(self, manager):
         """List includes saved profiles."""
         profile = ProfileData(name="Listed")
@@ -94,6 +126,24 @@ class TestProfileManager:
         with pytest.raises(FileNotFoundError):
             manager.load_profile("does_not_exist")
 
+    def test_load_all(self, manager):
+        """load_all returns every profile and leaves the current one alone."""
+        manager.save_profile(ProfileData(name="One"), "one")
+        manager.save_profile(ProfileData(name="Two"), "two")
+        manager.current_name = None
+
+        profiles = manager.load_all()
+
+        assert {name: p.name for name, p in profiles.items()} == {"one": "One", "two": "Two"}
+        assert manager.current_name is None
+
+    def test_load_all_skips_invalid(self, manager):
+        """Corrupt profiles are left out of load_all."""
+        manager.save_profile(ProfileData(name="Good"), "good")
+        (manager.profiles_dir / "bad.json").write_text("{ not valid json")
+
+        assert list(manager.load_all()) == ["good"]
+
     def test_delete_profile(self, manager):
         """Delete removes profile file."""
         profile = ProfileData(name="To Delete")
@@ -119,6 +169,28 @@ class TestProfileManager:
 
         assert manager.profile_exists("exists_test")
 
+    def test_list_profiles_cached_until_dir_changes(self, manager):
+        """Directory is rescanned only when its mtime changes."""
+        manager.save_profile(ProfileData(name="a"), "a")
+        assert manager.list_profiles() == ["a"]
+
+        with patch.object(Path, "glob") as glob:
+            assert manager.list_profiles() == ["a"]
+            assert manager.profile_exists("a")
+        glob.assert_not_called()
+
+        # A file added by another process, with the dir mtime visibly moved on
+        (manager.profiles_dir / "b.json").write_text("{}")
+        st = manager.profiles_dir.stat()
+        os.utime(manager.profiles_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert sorted(manager.list_profiles()) == ["a", "b"]
+
+    def test_list_profiles_returns_copy(self, manager):
+        """Callers may mutate the returned list without touching the cache."""
+        manager.save_profile(ProfileData(name="a"), "a")
+        manager.list_profiles().append("bogus")
+        assert manager.list_profiles() == ["a"]
+
     def test_current_profile_tracking(self, manager):
         """Current profile is tracked after load."""
         profile = ProfileData(name="Current")
@@ -303,6 +375,15 @@ class TestProfileImportExport:
         assert manager.profile_exists("Conflict")
         assert manager.profile_exists("Conflict_1")
 
+    def test_import_skips_taken_suffixes(self, manager, export_dir):
+        """Import keeps counting past suffixed names that are already taken."""
+        for name in ("Taken", "Taken_1", "Taken_2"):
+            manager.save_profile(ProfileData(name=name), name)
+        import_path = Path(export_dir) / "taken.json"
+        import_path.write_text('{"name": "Taken"}')
+
+        assert manager.import_profile(str(import_path)) == "Taken_3"
+
     def test_import_nonexistent_raises(self, manager):
         """Importing nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
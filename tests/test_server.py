@@ -16,9 +16,6 @@ from g13_linux.gui.models.macro_types import (
     PlaybackMode,
 )
 
-pytestmark = pytest.mark.asyncio
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -73,7 +70,7 @@ def mock_daemon(mock_led_controller, mock_event_decoder, mock_profile_manager, m
     daemon._event_decoder = mock_event_decoder
     daemon._device = MagicMock()  # device is connected
     daemon._current_mode = "M1"
-    daemon._last_joystick = (128, 128)
+    daemon.last_joystick = (128, 128)
     daemon.profile_manager = mock_profile_manager
     daemon.macro_manager = mock_macro_manager
     daemon.set_mode = MagicMock()
@@ -295,7 +292,10 @@ class TestAPIProfiles:
         class FakeProfile:
             description: str = "A profile"
 
-        mock_daemon.profile_manager.load_profile.return_value = FakeProfile()
+        mock_daemon.profile_manager.load_all.return_value = {
+            "default": FakeProfile(),
+            "gaming": FakeProfile(),
+        }
         resp = await client_no_static.get("/api/profiles")
         assert resp.status == 200
         data = await resp.json()
@@ -306,7 +306,7 @@ class TestAPIProfiles:
     @pytest.mark.asyncio
     async def test_list_profiles_load_error(self, client_no_static, mock_daemon):
         """Profiles that fail to load still appear with empty description."""
-        mock_daemon.profile_manager.load_profile.side_effect = Exception("corrupt")
+        mock_daemon.profile_manager.load_all.return_value = {}
         resp = await client_no_static.get("/api/profiles")
         data = await resp.json()
         assert len(data["profiles"]) == 2
@@ -785,6 +785,20 @@ class TestBroadcast:
         assert sent["type"] == "button_released"
         assert sent["button"] == "G2"
 
+    def test_input_batch_message(self, server_no_static):
+        sent = server_no_static.input_batch_message(["G1"], ["G2"], (10, 20))
+        assert sent == {
+            "type": "input_batch",
+            "pressed": ["G1"],
+            "released": ["G2"],
+            "joystick": {"x": 10, "y": 20},
+        }
+
+    def test_input_batch_message_without_joystick(self, server_no_static):
+        sent = server_no_static.input_batch_message([], ["G3"])
+        assert "joystick" not in sent
+        assert sent["released"] == ["G3"]
+
     @pytest.mark.asyncio
     async def test_broadcast_profile_activated(self, server_no_static):
         ws = AsyncMock()
@@ -810,6 +824,58 @@ class TestBroadcast:
         sent = json.loads(ws.send_str.call_args[0][0])
         assert sent["type"] == "device_disconnected"
 
+    def test_queue_broadcast_before_start_is_dropped(self, server_no_static):
+        server_no_static.queue_broadcast({"type": "joystick", "x": 1, "y": 2})
+        assert server_no_static._broadcast_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_queue_broadcast_drained_by_pump(self, server_no_static):
+        import asyncio
+
+        ws = AsyncMock()
+        server_no_static._clients = {ws}
+        server_no_static._loop = asyncio.get_running_loop()
+        server_no_static._broadcast_wake = asyncio.Event()
+        pump = asyncio.create_task(server_no_static._broadcast_pump())
+
+        server_no_static.queue_broadcast({"type": "button_pressed", "button": "G1"})
+        server_no_static.queue_broadcast({"type": "button_released", "button": "G1"})
+        for _ in range(5):
+            await asyncio.sleep(0)
+        pump.cancel()
+
+        sent = [json.loads(c[0][0])["type"] for c in ws.send_str.call_args_list]
+        assert sent == ["button_pressed", "button_released"]
+        assert server_no_static._broadcast_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_pump_survives_broadcast_error(self, server_no_static):
+        import asyncio
+
+        server_no_static._loop = asyncio.get_running_loop()
+        server_no_static._broadcast_wake = asyncio.Event()
+        sent = []
+
+        async def broadcast(message):
+            if message["type"] == "bad":
+                raise TypeError("not serializable")
+            sent.append(message["type"])
+
+        server_no_static._broadcast = broadcast
+        pump = asyncio.create_task(server_no_static._broadcast_pump())
+
+        server_no_static.queue_broadcast({"type": "bad"})
+        server_no_static.queue_broadcast({"type": "button_pressed"})
+        for _ in range(5):
+            await asyncio.sleep(0)
+        server_no_static.queue_broadcast({"type": "button_released"})
+        for _ in range(5):
+            await asyncio.sleep(0)
+        pump.cancel()
+
+        assert sent == ["button_pressed", "button_released"]
+        assert server_no_static._wake_pending is False
+
 
 # ---------------------------------------------------------------------------
 # WebSocket message handling
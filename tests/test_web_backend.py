@@ -0,0 +1,52 @@
+"""Tests for the FastAPI web GUI backend (gui-web/backend/server.py)."""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+pytest.importorskip("uvicorn")
+
+SERVER_PATH = Path(__file__).resolve().parents[1] / "gui-web" / "backend" / "server.py"
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Web backend module with profiles and macros stored under tmp_path."""
+    spec = importlib.util.spec_from_file_location("g13_web_backend_server", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "PROFILES_DIR", tmp_path / "profiles")
+    monkeypatch.setattr(module, "MACROS_DIR", tmp_path / "macros")
+    module.PROFILES_DIR.mkdir()
+    module.MACROS_DIR.mkdir()
+    return module
+
+
+class TestNonAsciiRoundTrip:
+    """Files written as UTF-8 by orjson read back intact, whatever the locale."""
+
+    def test_profile_round_trip(self, server):
+        profile = server.ProfileData(name="Café", description="Ünïcode ☕")
+        asyncio.run(server.save_profile("Café", profile))
+
+        data = asyncio.run(server.get_profile("Café"))
+        assert data["name"] == "Café"
+        assert data["description"] == "Ünïcode ☕"
+
+        listed = asyncio.run(server.list_profiles())["profiles"]
+        assert [p["name"] for p in listed] == ["Café"]
+
+    def test_macro_round_trip(self, server):
+        macro = server.MacroData(name="Café", description="Ünïcode ☕")
+        macro_id = asyncio.run(server.create_macro(macro))["id"]
+
+        data = asyncio.run(server.get_macro(macro_id))
+        assert data["name"] == "Café"
+        assert data["description"] == "Ünïcode ☕"
+
+        listed = asyncio.run(server.list_macros())["macros"]
+        assert [m["name"] for m in listed] == ["Café"]
@@ -370,3 +370,21 @@ class TestLCDPreviewEmbedded:
         widget.set_framebuffer(bytes([0x55] * 960))
         event = QPaintEvent(QRect(0, 0, 320, 86))
         widget.paintEvent(event)
+
+
+class TestWidgetsPackage:
+    """Lazy re-exports from g13_linux.gui.widgets."""
+
+    def test_reexports_resolve_to_module_classes(self):
+        import g13_linux.gui.widgets as widgets
+        from g13_linux.gui.widgets.lcd_preview import LCDPreviewEmbedded, LCDPreviewWidget
+
+        assert widgets.LCDPreviewWidget is LCDPreviewWidget
+        assert widgets.LCDPreviewEmbedded is LCDPreviewEmbedded
+        assert set(widgets.__all__) <= set(dir(widgets))
+
+    def test_unknown_name_raises_attribute_error(self):
+        import g13_linux.gui.widgets as widgets
+
+        with pytest.raises(AttributeError):
+            _ = widgets.NoSuchWidget